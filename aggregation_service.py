@@ -0,0 +1,260 @@
+# Local HTTP/JSON aggregation service for the dashboards
+#
+# Usage: python aggregation_service.py [--host 127.0.0.1] [--port 8765] [--workers 4] [--cache-size 1024]
+#
+# Runs the aggregations of charts.py outside the Streamlit script thread, so they can be
+# scaled, cached and load-tested separately from the UI. Dashboards become thin clients by
+# setting SG_API_URL=http://127.0.0.1:8765 (see api_client.py).
+#
+# The server is a small asyncio HTTP/1.1 server. The work runs in a process pool where
+# every worker loads the data store once. Responses are cached by path and filter state
+# (least recently used ones are dropped first), and requests for a response that is
+# already being computed wait for that result instead of computing it again. Responses
+# are also kept on disk (see disk_cache.py): a worker reads a response computed before a
+# restart instead of computing it again, and the cache starts with the most recently used
+# responses on disk.
+#
+# Endpoints (filters as query parameters: year_min, year_max, gender, age, jobs, model, similar_to,
+# anomalies, industry_drill):
+#   GET /options               values of the filter widgets
+#   GET /summary               KPI numbers, key insights and data checks of the dashboard
+#   GET /trends                employment trend of each occupation
+#   GET /growth                top growing / declining occupations and top hiring industry
+#   GET /salary-gaps           male minus female salary per occupation and year
+#   GET /unemployment          overall unemployment trend, and by age / qualification
+#   GET /figure/<builder>      Plotly JSON of one chart builder in charts.CHARTS
+#   GET /stats                 cache statistics
+import argparse
+import asyncio
+import json
+import urllib.parse
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import charts
+import disk_cache
+import forecasting
+from data_store import load_data
+
+FIGURES = {builder.__name__: builder for builders in charts.CHARTS.values() for builder in builders}
+LIST_FILTERS = ["gender", "age", "jobs"]
+
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"}
+
+
+def records(df):
+    return json.loads(df.to_json(orient="records"))
+
+
+def trends(data, filters):
+    return records(charts.occupation_trend(data, filters))
+
+
+def growth(data, filters):
+    top_grow, top_decl = charts.occupation_growth(data, filters)
+    top_hiring = charts.top_hiring_industry(data, filters) if filters["year_min"] < filters["year_max"] else None
+    return {
+        "growing": records(top_grow),
+        "declining": records(top_decl),
+        "top_hiring_industry": [top_hiring[0], float(top_hiring[1])] if top_hiring else None}
+
+
+def salary_gaps(data, filters):
+    gap = charts.salary_gap(data, filters)
+    gap = gap[gap["year"].isin(charts.salary_years(data, filters))]
+    return records(gap[["occupation", "year", "value_m", "value_f", "gap"]])
+
+
+def unemployment(data, filters):
+    df_age = data["unemployment_age"]
+    df_qual = data["unemployment_qual"]
+    return {
+        "overall": records(charts.unemployment_trend(data, filters)[["Year", "Unemployment"]]),
+        "by_age": records(df_age[(df_age["Year"] == filters["year_max"]) & (df_age["Age Group"].isin(charts.UNEMPLOYMENT_AGE_GROUPS))]),
+        "by_qualification": records(df_qual[df_qual["Year"] == filters["year_max"]])}
+
+
+ENDPOINTS = {
+    "/options": lambda data, filters: charts.filter_options(data),
+    "/summary": charts.dashboard_summary,
+    "/trends": trends,
+    "/growth": growth,
+    "/salary-gaps": salary_gaps,
+    "/unemployment": unemployment,
+}
+
+
+# Data store of this worker process, loaded once by start_worker
+worker_data = None
+
+
+def start_worker():
+    global worker_data
+    worker_data = load_data()
+
+    # Build the figures with the Plotly theme Streamlit sets for the dashboard, because
+    # Plotly Express takes the trace colours from the default theme when building a chart
+    from streamlit.elements.lib.streamlit_plotly_theme import configure_streamlit_plotly_theme
+    configure_streamlit_plotly_theme()
+
+
+# Runs in a worker process: compute one response and encode it as JSON bytes
+def compute(path, filters):
+    if path.startswith("/figure/"):
+        fig = FIGURES[path[len("/figure/"):]](worker_data, filters)
+        return b"null" if fig is None else fig.to_json().encode("utf-8")
+    return json.dumps(ENDPOINTS[path](worker_data, filters)).encode("utf-8")
+
+
+# Runs in a worker process: read a response from the disk cache, or compute it and write
+# it there. Returns the response and whether it came from the disk.
+def compute_cached(path, filters, key):
+    body = disk_cache.load("service", key)
+    if body is not None:
+        return body, True
+    body = compute(path, filters)
+    disk_cache.store_now("service", key, body)
+    return body, False
+
+
+# Read the filter state from the query string, using the defaults for anything missing.
+# A list filter sent as one empty parameter (gender=) is an empty selection.
+def parse_filters(query, defaults):
+    params = urllib.parse.parse_qs(query, keep_blank_values=True)
+    params = {key: values for key, values in params.items() if key in LIST_FILTERS or any(values)}
+    filters = dict(defaults)
+    for key in ["year_min", "year_max"]:
+        if key in params:
+            filters[key] = int(params[key][0])
+    for key in LIST_FILTERS:
+        if key in params:
+            filters[key] = [value for value in params[key] if value]
+    if "model" in params:
+        if params["model"][0] not in forecasting.MODELS:
+            raise ValueError(f"unknown model {params['model'][0]}")
+        filters["model"] = params["model"][0]
+    if "similar_to" in params:
+        filters["similar_to"] = params["similar_to"][0]
+    if "anomalies" in params:
+        filters["anomalies"] = params["anomalies"][0] in ("1", "true", "True")
+    if "industry_drill" in params:
+        filters["industry_drill"] = params["industry_drill"][0]
+    return filters
+
+
+# Server state: worker pool, default filters, response cache and computations in progress
+server = {"pool": None, "defaults": None, "cache_size": 1024}
+cache = OrderedDict()
+in_flight = {}
+stats = {"requests": 0, "hits": 0, "misses": 0, "shared": 0, "disk_hits": 0}
+
+
+# Get a response from the cache, from a computation already running, or compute it
+async def cached(path, filters):
+    key = (path,) + tuple((k, tuple(v) if isinstance(v, list) else v) for k, v in sorted(filters.items()))
+    if key in cache:
+        stats["hits"] += 1
+        cache.move_to_end(key)
+        return cache[key]
+    if key in in_flight:
+        stats["shared"] += 1
+        return (await asyncio.shield(in_flight[key]))[0]
+
+    stats["misses"] += 1
+    future = asyncio.get_running_loop().run_in_executor(server["pool"], compute_cached, path, filters, key)
+    in_flight[key] = future
+    try:
+        body, from_disk = await future
+    finally:
+        del in_flight[key]
+    stats["disk_hits"] += from_disk
+
+    cache[key] = body
+    if len(cache) > server["cache_size"]:
+        cache.popitem(last=False)
+    return body
+
+
+def is_known(path):
+    if path.startswith("/figure/"):
+        return path[len("/figure/"):] in FIGURES
+    return path in ENDPOINTS
+
+
+async def respond(method, target):
+    if method != "GET":
+        return 405, b'{"error": "only GET is supported"}'
+    url = urllib.parse.urlsplit(target)
+    if url.path == "/stats":
+        return 200, json.dumps(dict(stats, cached=len(cache))).encode("utf-8")
+    if not is_known(url.path):
+        return 404, json.dumps({"error": f"unknown endpoint {url.path}"}).encode("utf-8")
+    try:
+        filters = parse_filters(url.query, server["defaults"])
+    except ValueError as error:
+        return 400, json.dumps({"error": str(error)}).encode("utf-8")
+    try:
+        return 200, await cached(url.path, filters)
+    except Exception as error:
+        return 500, json.dumps({"error": f"{type(error).__name__}: {error}"}).encode("utf-8")
+
+
+# Serve the requests of one connection (HTTP/1.1 keep-alive)
+async def handle(reader, writer):
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line.strip():
+                break
+            method, target, version = request_line.decode("latin-1").split()
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if not line.strip():
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip().lower()
+
+            stats["requests"] += 1
+            status, body = await respond(method, target)
+            keep_alive = headers.get("connection", "keep-alive" if version == "HTTP/1.1" else "close") != "close"
+            writer.write(
+                f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + body)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host, port, workers, cache_size):
+    data = load_data()
+    with ProcessPoolExecutor(max_workers=workers, initializer=start_worker) as pool:
+        server.update(pool=pool, defaults=charts.default_filters(data), cache_size=cache_size)
+        for key, body in reversed(disk_cache.warm("service", cache_size)):
+            cache[key] = body
+        async with await asyncio.start_server(handle, host, port) as tcp_server:
+            print(f"Aggregation service listening on http://{host}:{port}")
+            await tcp_server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the aggregation service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--cache-size", type=int, default=1024, help="number of responses to keep")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.cache_size))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
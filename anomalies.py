@@ -0,0 +1,178 @@
+# Batched anomaly and structural break detection for every series of the data store
+#
+# Every series of a dataset is scanned at once, as NumPy operations on a (series x years)
+# matrix:
+#   employment          one series per Sex x Age Group x Occupation row
+#   salary              one series per gender x occupation
+#   unemployment_age    one series per age group
+#   unemployment_sex    one series per sex x age category
+#   unemployment_qual   one series per highest qualification
+#
+# Two detectors run on the year-over-year change of each series (relative change for
+# counts and salaries, change in percentage points for unemployment rates):
+#   outlier   the change is more than Z_LIMIT robust standard deviations from the usual
+#             change of the series (median and MAD, so the outliers don't hide themselves)
+#   break     two-sided CUSUM of the standardized changes: a run of changes on the same side
+#             of the median adds up past CUSUM_H. The sum restarts after every alarm.
+# A flag at year t is about the change from the previous year to t. Series with fewer than
+# MIN_CHANGES changes are not scanned.
+#
+# The flags of all datasets are kept in one index (see get_index), which the charts read
+# to mark the flagged years. detect_lines runs the same detectors on lines that are not
+# series of the data store, such as the sums drawn by the filtered charts.
+import threading
+import warnings
+
+import numpy as np
+import pandas as pd
+
+import forecasting
+
+DATASETS = {
+    "employment": "relative",
+    "salary": "relative",
+    "unemployment_age": "absolute",
+    "unemployment_sex": "absolute",
+    "unemployment_qual": "absolute"}
+
+Z_LIMIT = 3.5
+CUSUM_K = 0.5
+CUSUM_H = 4.0
+MIN_CHANGES = 4
+MAD_TO_STD = 1.4826
+
+UNEMPLOYMENT_LABELS = {
+    "unemployment_age": ["Age Group"],
+    "unemployment_sex": ["Sex", "Category"],
+    "unemployment_qual": ["Highest Qualification"]}
+
+
+# Series of a dataset as (index of the series, years, values matrix)
+def series_matrix(data, name):
+    if name == "employment":
+        return forecasting.series_matrix(data, name)
+    if name == "salary":
+        cube = data["salary"].pivot_table(index=["gender", "occupation"], columns="year", values="value", aggfunc="mean")
+    elif name in UNEMPLOYMENT_LABELS:
+        cube = data[name].pivot_table(index=UNEMPLOYMENT_LABELS[name], columns="Year", values="Unemployment", aggfunc="mean")
+    else:
+        raise ValueError(f"No series for dataset {name}")
+    return cube.index, cube.columns.to_numpy(), cube.to_numpy(dtype="float64")
+
+
+# Year-over-year change of every row; NaN where either year is missing
+def yearly_changes(values, change):
+    previous, current = values[:, :-1], values[:, 1:]
+    if change == "absolute":
+        return current - previous
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(previous != 0, (current - previous) / np.abs(previous), np.nan)
+
+
+# Robust z-score of every change against the other changes of its row
+def robust_z(changes):
+    with warnings.catch_warnings():
+        # Rows without any change give all-NaN slices
+        warnings.simplefilter("ignore", RuntimeWarning)
+        median = np.nanmedian(changes, axis=1)
+        scale = MAD_TO_STD * np.nanmedian(np.abs(changes - median[:, None]), axis=1)
+        # A row that nearly always changes by the same amount has no MAD: use the standard deviation
+        scale = np.where(scale > 0, scale, np.nanstd(changes, axis=1))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        z = (changes - median[:, None]) / scale[:, None]
+    z[~(scale > 0)] = np.nan
+    return z
+
+
+# Two-sided CUSUM of every row at once; the loop only runs over the years.
+# Returns the signed sum at each alarm (positive: shift up, negative: shift down), else 0.
+def cusum(z):
+    steps = np.nan_to_num(np.clip(z, -Z_LIMIT, Z_LIMIT))
+    up = np.zeros(len(z))
+    down = np.zeros(len(z))
+    alarms = np.zeros_like(steps)
+    for t in range(steps.shape[1]):
+        up = np.maximum(0.0, up + steps[:, t] - CUSUM_K)
+        down = np.maximum(0.0, down - steps[:, t] - CUSUM_K)
+        alarms[:, t] = np.where(up > CUSUM_H, up, np.where(down > CUSUM_H, -down, 0.0))
+        up[up > CUSUM_H] = 0.0
+        down[down > CUSUM_H] = 0.0
+    return alarms
+
+
+# Flags of every row of a values matrix: one row per flagged (series, year), with the
+# position of the series in the matrix
+def detect(years, values, change):
+    changes = yearly_changes(values, change)
+    z = robust_z(changes)
+    z[np.isfinite(changes).sum(axis=1) < MIN_CHANGES] = np.nan
+    alarms = cusum(z)
+
+    flags = []
+    for kind, hits, score in [("outlier", np.abs(z) > Z_LIMIT, z), ("break", alarms != 0, alarms)]:
+        rows, cols = np.nonzero(hits)
+        flags.append(pd.DataFrame({
+            "row": rows, "year": years[1:][cols], "kind": kind, "score": score[rows, cols],
+            "value": values[rows, cols + 1], "change": changes[rows, cols]}))
+    return pd.concat(flags, ignore_index=True).sort_values(["row", "year", "kind"], ignore_index=True)
+
+
+# Labels of some rows of a series index, joined with " | "
+def series_labels(index, rows):
+    levels = index.to_frame(index=False).iloc[rows]
+    labels = levels.iloc[:, 0].astype(str)
+    for column in levels.columns[1:]:
+        labels = labels + " | " + levels[column].astype(str)
+    return labels.to_numpy()
+
+
+# Flags of every series of every dataset. "series" holds the labels of the series joined
+# with " | " (for example "Male | All Ages | All Occupations").
+def build_index(data):
+    flags = []
+    for name, change in DATASETS.items():
+        index, years, values = series_matrix(data, name)
+        found = detect(np.asarray(years, dtype="int64"), values, change)
+        found.insert(0, "series", series_labels(index, found.pop("row").to_numpy()))
+        found.insert(0, "dataset", name)
+        flags.append(found)
+    flags = pd.concat(flags, ignore_index=True)
+    return {"flags": flags, "series": flags.groupby(["dataset", "series"]).indices}
+
+
+# Cached index: (source DataFrames, index). The DataFrames are kept to make sure the index
+# belongs to the data store it is asked for. Charts are also built on background threads
+# (precompute.py), hence the lock.
+cached_index = {}
+index_lock = threading.Lock()
+
+
+def get_index(data):
+    sources = [data[name] for name in DATASETS]
+    with index_lock:
+        cached = cached_index.get("index")
+        if cached is not None and all(a is b for a, b in zip(cached[0], sources)):
+            return cached[1]
+
+    index = build_index(data)
+    with index_lock:
+        cached_index["index"] = (sources, index)
+    return index
+
+
+# Flags of one series of the index between year_min and year_max
+def series_flags(data, name, labels, year_min, year_max):
+    index = get_index(data)
+    rows = index["series"].get((name, " | ".join(labels)))
+    if rows is None:
+        return index["flags"].iloc[:0]
+    flags = index["flags"].iloc[rows]
+    return flags[(flags["year"] >= year_min) & (flags["year"] <= year_max)]
+
+
+# Flags of some lines that are not in the index: lines is a DataFrame with one row per
+# line and one column per year, and "series" holds the row labels
+def detect_lines(lines, change="relative"):
+    found = detect(lines.columns.to_numpy(dtype="int64"), lines.to_numpy(dtype="float64"), change)
+    found.insert(0, "series", lines.index.to_numpy()[found.pop("row").to_numpy()])
+    return found
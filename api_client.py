@@ -0,0 +1,54 @@
+# Client for the aggregation service (aggregation_service.py)
+#
+# The dashboards use these functions instead of charts.py when they run as thin clients
+# (SG_API_URL=http://127.0.0.1:8765). Filters are sent as query parameters, lists as
+# repeated parameters (gender=Male&gender=Female) and an empty list as one empty parameter
+# (gender=), so the service doesn't take it as missing. Filters set to None are left out,
+# so the service uses its default for them.
+import json
+import urllib.error
+import urllib.parse
+import urllib.request
+
+import plotly.io as pio
+
+TIMEOUT = 60
+
+
+# Encode a filter state as a query string
+def encode_filters(filters):
+    params = {k: (v or [""]) if isinstance(v, list) else v for k, v in filters.items() if v is not None}
+    return urllib.parse.urlencode(params, doseq=True)
+
+
+def get(base_url, path, filters=None):
+    url = base_url.rstrip("/") + path
+    if filters is not None:
+        url += "?" + encode_filters(filters)
+    try:
+        with urllib.request.urlopen(url, timeout=TIMEOUT) as response:
+            return response.read()
+    except urllib.error.HTTPError as error:
+        raise RuntimeError(f"Aggregation service error {error.code} for {path}: {error.read().decode('utf-8', 'replace')}")
+    except urllib.error.URLError as error:
+        raise RuntimeError(f"Can't reach the aggregation service at {base_url}: {error.reason}")
+
+
+def get_json(base_url, path, filters=None):
+    return json.loads(get(base_url, path, filters))
+
+
+def get_options(base_url):
+    return get_json(base_url, "/options")
+
+
+def get_summary(base_url, filters):
+    return get_json(base_url, "/summary", filters)
+
+
+# A chart built by the service, or None when the builder had nothing to show
+def get_figure(base_url, name, filters):
+    body = get(base_url, f"/figure/{name}", filters)
+    if body == b"null":
+        return None
+    return pio.from_json(body.decode("utf-8"), skip_invalid=True)
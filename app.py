@@ -0,0 +1,17 @@
+# Singapore employment app: one Streamlit app for the dashboard and the presentation
+#
+# Run with: streamlit run app.py
+#
+# The pages share one data store (app_data.py) and one set of chart builders (charts.py),
+# so the data is loaded once for the whole app instead of once per script.
+import streamlit as st
+
+st.set_page_config(page_title="Singapore Employment Trends", layout="wide")
+
+pages = [
+    st.Page("interactive_dashboard.py", title="Dashboard", icon="📊", default=True),
+    st.Page("static_dashboard_update.py", title="Presentation", icon="🎞️"),
+    st.Page("client_dashboard.py", title="Dashboard (in browser)", icon="⚡"),
+]
+
+st.navigation(pages).run()
@@ -0,0 +1,92 @@
+# Run a dashboard script headlessly and capture what it renders
+import json
+import os
+import sys
+
+from streamlit.testing.v1 import AppTest
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Text elements we keep when capturing a page
+TEXT_TYPES = ["title", "header", "subheader", "markdown", "caption", "info", "warning", "success", "error", "divider"]
+
+
+# Run one script with the given session state and widget values, then return the AppTest object
+def run_app(script, session_state=None, widgets=None, timeout=120):
+    # AppTest runs the script as __main__, so put the real __main__ back afterwards.
+    # Otherwise process pool workers can't find the functions of the calling script.
+    main_module = sys.modules["__main__"]
+    try:
+        at = AppTest.from_file(os.path.join(ROOT_DIR, script), default_timeout=timeout)
+        for key, value in (session_state or {}).items():
+            at.session_state[key] = value
+        at.run()
+
+        # Widgets can only be set after the first run created them, so run a second time
+        if widgets:
+            for (kind, label), value in widgets.items():
+                for widget in at.get(kind):
+                    if widget.label == label:
+                        widget.set_value(value)
+            at.run()
+    finally:
+        sys.modules["__main__"] = main_module
+
+    if at.exception:
+        raise RuntimeError(f"{script} failed: {at.exception[0].message}")
+    return at
+
+
+# Turn the element tree into plain dicts so it can be sent between processes
+def capture_tree(node):
+    node_type = getattr(node, "type", None)
+
+    if node_type == "plotly_chart":
+        return {"type": "plotly", "spec": node.proto.spec}
+    if node_type == "metric":
+        return {"type": "metric", "label": node.label, "value": node.value, "delta": node.proto.delta}
+    if node_type in TEXT_TYPES:
+        return {"type": node_type, "text": node.value if node_type != "divider" else ""}
+
+    # Blocks: keep tabs and columns, flatten everything else
+    if hasattr(node, "children"):
+        children = []
+        for child in node.children.values():
+            captured = capture_tree(child)
+            if captured is not None:
+                children.append(captured)
+        if node_type == "tab_container":
+            return {"type": "tabs", "tabs": [(tab["label"], tab["children"]) for tab in children if tab["type"] == "tab"]}
+        if node_type == "tab":
+            return {"type": "tab", "label": node.label, "children": children}
+        if node_type == "flex_container" and children and all(c["type"] == "column" for c in children):
+            return {"type": "columns", "columns": [c["children"] for c in children]}
+        if node_type == "column":
+            return {"type": "column", "children": children}
+        return {"type": "block", "children": children}
+    return None
+
+
+# Capture the main area of a finished run
+def capture_page(at):
+    return capture_tree(at.main)["children"]
+
+
+# Run a script and return the captured page (safe to use as a process pool task)
+def capture_run(script, session_state=None, widgets=None):
+    return capture_page(run_app(script, session_state, widgets))
+
+
+# Walk a captured tree and yield (tab path, figure spec) for every plotly chart
+def iter_figures(nodes, path=()):
+    for node in nodes:
+        if node["type"] == "plotly":
+            yield path, json.loads(node["spec"])
+        elif node["type"] == "tabs":
+            for label, children in node["tabs"]:
+                yield from iter_figures(children, path + (label,))
+        elif node["type"] == "columns":
+            for column in node["columns"]:
+                yield from iter_figures(column, path)
+        elif "children" in node:
+            yield from iter_figures(node["children"], path)
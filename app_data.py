@@ -0,0 +1,26 @@
+# Shared data store for the Streamlit pages
+#
+# Every page of app.py gets its data from here. The CSV files are read once per server
+# process and the same DataFrames are shared by every page and every session, instead of
+# each script reading its own copy.
+import streamlit as st
+
+from data_store import get_data_dir, load_data
+from profiling import traced
+
+
+@st.cache_resource
+def load_shared_data(data_dir):
+    return load_data(data_dir)
+
+
+# The data store for the current data folder. Don't change these DataFrames in place.
+@traced("load")
+def get_data():
+    return load_shared_data(get_data_dir())
+
+
+# A copy of one dataset, for page code that changes the DataFrame it works on
+@traced("load")
+def get_frame(name):
+    return get_data()[name].copy()
@@ -0,0 +1,205 @@
+# Benchmark how long one rerun of each dashboard takes
+#
+# Usage: python benchmark_dashboards.py [--repeat 3] [--out results.json] [--compare old.json] [--data-dir synthetic/x100]
+#
+# Every script is driven headlessly with Streamlit's AppTest over a matrix of filter
+# states. For each case we record the rerun wall time, the peak Python memory during
+# the rerun and the size of the Plotly JSON sent for each tab. For interactive_dashboard.py
+# every chart builder is also timed on its own, so we can see which tab dominates.
+# Results are written as JSON so two commits can be compared with --compare.
+import argparse
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+from collections import defaultdict
+
+import pandas as pd
+import streamlit
+
+import charts
+from app_capture import capture_page, run_app
+from data_store import load_data
+
+# Widget labels used by each script for (year range, gender, age group, occupation)
+LABELS = {
+    "interactive_dashboard.py": ("Pick Year Range", "Gender", "Age Group", "Occupation"),
+}
+
+# Filter states: (name, year range, gender, age groups, occupations)
+FILTER_MATRIX = [
+    ("default", (2000, 2024), ["All"], ["All Ages"], ["All Occupations"]),
+    ("recent_years", (2019, 2024), ["All"], ["All Ages"], ["All Occupations"]),
+    ("female_25_29", (2000, 2024), ["Female"], ["25-29 Years Old"], ["All Occupations"]),
+    ("male_young", (2000, 2012), ["Male"], ["15-19 Years Old", "20-24 Years Old"], ["All Occupations"]),
+    ("two_occupations", (2012, 2024), ["All"], ["All Ages"], ["Professionals", "Associate Professionals & Technicians"]),
+    ("single_year", (2024, 2024), ["All"], ["All Ages"], ["All Occupations"]),
+]
+
+N_SLIDES = 8
+
+
+# Build the list of (script, case name, session state, widgets) to run
+def benchmark_cases():
+    cases = []
+    for script, (year_label, gender_label, age_label, job_label) in LABELS.items():
+        for name, years, gender, age, jobs in FILTER_MATRIX:
+            widgets = {
+                ("select_slider", year_label): years,
+                ("multiselect", gender_label): gender,
+                ("multiselect", age_label): age,
+                ("multiselect", job_label): jobs}
+            cases.append((script, name, None, widgets))
+    for i in range(N_SLIDES):
+        cases.append(("static_dashboard_update.py", f"slide_{i}", {"idx": i}, None))
+    return cases
+
+
+# Add up the Plotly JSON bytes of every figure, grouped by the top-level tab it is in
+def payload_by_tab(nodes, tab="(page)", totals=None):
+    if totals is None:
+        totals = defaultdict(int)
+    for node in nodes:
+        if node["type"] == "plotly":
+            totals[tab] += len(node["spec"].encode("utf-8"))
+        elif node["type"] == "tabs":
+            for label, children in node["tabs"]:
+                payload_by_tab(children, label if tab == "(page)" else tab, totals)
+        elif node["type"] == "columns":
+            for column in node["columns"]:
+                payload_by_tab(column, tab, totals)
+        elif "children" in node:
+            payload_by_tab(node["children"], tab, totals)
+    return dict(totals)
+
+
+# Run one case: a first run to set the widgets, then timed reruns of the same state
+def run_case(script, session_state, widgets, repeat, timeout=120):
+    at = run_app(script, session_state, widgets, timeout)
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - start)
+
+    # Memory is measured in a separate rerun, because tracing slows the script down a lot
+    tracemalloc.start()
+    at.run()
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    payload = payload_by_tab(capture_page(at))
+    return {
+        "wall_time_s": min(times),
+        "wall_time_all_s": times,
+        "peak_memory_bytes": peak_memory,
+        "payload_bytes": sum(payload.values()),
+        "payload_bytes_by_tab": payload}
+
+
+# Time every chart builder of interactive_dashboard.py, grouped by tab
+def time_builders(filters, data, repeat):
+    by_tab = {}
+    for tab, builders in charts.CHARTS.items():
+        tab_time = 0.0
+        for builder in builders:
+            best = min(timed(builder, data, filters) for _ in range(repeat))
+            tab_time += best
+        by_tab[tab] = tab_time
+    return by_tab
+
+
+def timed(builder, data, filters):
+    start = time.perf_counter()
+    builder(data, filters)
+    return time.perf_counter() - start
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+# Print the change of every case against an older result file
+def compare(results, old_path):
+    with open(old_path) as f:
+        old = json.load(f)
+    old_cases = {(c["script"], c["case"]): c for c in old["cases"]}
+
+    print(f"\nCompared with {old_path} (commit {old.get('commit')}):")
+    for case in results["cases"]:
+        before = old_cases.get((case["script"], case["case"]))
+        if before is None or "error" in case or "error" in before:
+            continue
+        change = (case["wall_time_s"] - before["wall_time_s"]) / before["wall_time_s"] * 100
+        flag = "  <-- slower" if change > 10 else ""
+        print(f"  {case['script']:36s} {case['case']:16s} {before['wall_time_s'] * 1000:8.1f} ms -> "
+              f"{case['wall_time_s'] * 1000:8.1f} ms ({change:+.1f}%){flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dashboard reruns")
+    parser.add_argument("--repeat", type=int, default=3, help="timed reruns per case")
+    parser.add_argument("--out", default=None, help="result file (default: benchmarks/<commit>.json)")
+    parser.add_argument("--compare", default=None, help="older result file to compare against")
+    parser.add_argument("--data-dir", default=None, help="read the CSV files from this folder (e.g. synthetic/x100)")
+    parser.add_argument("--timeout", type=int, default=120, help="seconds before a rerun counts as failed")
+    parser.add_argument("--scripts", nargs="+", default=None, help="only run these scripts")
+    args = parser.parse_args()
+
+    # The dashboards run in this process and read the data folder from the environment
+    if args.data_dir:
+        os.environ["SG_DATA_DIR"] = os.path.abspath(args.data_dir)
+
+    commit = git_commit()
+    results = {
+        "commit": commit,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "streamlit": streamlit.__version__,
+        "repeat": args.repeat,
+        "data_dir": args.data_dir or "",
+        "cases": []}
+
+    data = load_data()
+    for script, name, session_state, widgets in benchmark_cases():
+        if args.scripts and script not in args.scripts:
+            continue
+        # A rerun that fails or times out is recorded instead of stopping the run
+        try:
+            result = run_case(script, session_state, widgets, args.repeat, args.timeout)
+        except RuntimeError as error:
+            results["cases"].append({"script": script, "case": name, "error": str(error)})
+            print(f"{script:36s} {name:16s} failed: {error}")
+            continue
+        result["script"] = script
+        result["case"] = name
+
+        # Per-tab builder times for the main dashboard
+        if script == "interactive_dashboard.py":
+            _, years, gender, age, jobs = next(m for m in FILTER_MATRIX if m[0] == name)
+            filters = dict(charts.default_filters(data), year_min=years[0], year_max=years[1],
+                           gender=gender, age=age, jobs=jobs)
+            result["builder_time_s_by_tab"] = time_builders(filters, data, args.repeat)
+
+        results["cases"].append(result)
+        print(f"{script:36s} {name:16s} {result['wall_time_s'] * 1000:8.1f} ms  "
+              f"{result['peak_memory_bytes'] / 1e6:7.1f} MB  {result['payload_bytes'] / 1e3:8.1f} KB")
+
+    out = args.out or os.path.join("benchmarks", f"{commit}.json")
+    os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
+    with open(out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nSaved results to {out}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# Benchmark the memory used by the data store as the number of server processes grows
+#
+# Usage: python benchmark_memory.py [--workers 1 2 4 8] [--data-dir synthetic/x100]
+#
+# Starts N processes at once, each loading the data store and reading every value in it
+# (like a server process that has served a few requests), and records the memory of each
+# process from /proc/self/smaps_rollup (Linux only) while all of them are alive.
+# PSS splits shared pages between the processes that map them, so the total PSS is the
+# real memory used by the group. It is measured with private DataFrames (the CSV files
+# read in every process) and with the shared memory-mapped store (SG_SHARED_STORE=1).
+import argparse
+import multiprocessing as mp
+import os
+
+import pandas as pd
+
+MODES = {"private": "0", "shared": "1"}
+
+
+def memory_kb():
+    values = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                values[parts[0].rstrip(":")] = int(parts[1])
+    return values
+
+
+# Runs in each child process
+def worker(mode, barrier, results):
+    os.environ["SG_SHARED_STORE"] = MODES[mode]
+    from data_store import load_data
+    data = load_data()
+
+    # Touch every value, like the chart builders do over time
+    for value in data.values():
+        if isinstance(value, pd.DataFrame):
+            for c in value.columns:
+                if value[c].dtype.kind in "fiub":
+                    value[c].sum()
+                else:
+                    value[c].str.len().sum()
+
+    # Measure while every process still holds its data
+    barrier.wait()
+    results.put(memory_kb())
+    barrier.wait()
+
+
+def run(mode, n_workers):
+    ctx = mp.get_context("spawn")
+    barrier = ctx.Barrier(n_workers)
+    results = ctx.Queue()
+    processes = [ctx.Process(target=worker, args=(mode, barrier, results)) for _ in range(n_workers)]
+    for p in processes:
+        p.start()
+    memory = [results.get() for _ in processes]
+    for p in processes:
+        p.join()
+    return memory
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark data store memory per worker count")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--data-dir", default=None, help="read the CSV files from this folder (e.g. synthetic/x100)")
+    args = parser.parse_args()
+
+    if args.data_dir:
+        os.environ["SG_DATA_DIR"] = os.path.abspath(args.data_dir)
+
+    # Build the shared store once before timing anything
+    os.environ["SG_SHARED_STORE"] = "1"
+    from data_store import load_data
+    load_data()
+
+    print(f"{'mode':8s} {'workers':>7s} {'total PSS':>12s} {'PSS/worker':>12s} {'private/worker':>15s}")
+    for mode in MODES:
+        for n in args.workers:
+            memory = run(mode, n)
+            total_pss = sum(m["Pss"] for m in memory) / 1024
+            private = sum(m["Private_Clean"] + m["Private_Dirty"] for m in memory) / 1024 / n
+            print(f"{mode:8s} {n:7d} {total_pss:9.1f} MB {total_pss / n:9.1f} MB {private:12.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# Benchmark the import time of each dashboard script in a fresh Python process
+#
+# Usage: python benchmark_startup.py [--repeat 5] [--compare-rev HEAD~1] [--scripts a.py b.py]
+#
+# A cold start pays for every module a script imports at the top. For each script we run
+# its top-level import statements in a new interpreter (so nothing is cached in memory)
+# and record the time and which heavy plotting libraries got loaded.
+# With --compare-rev the imports of the same script at an older git revision are timed
+# too, to show how much an import change saves.
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+import sys
+
+from data_store import ROOT_DIR
+
+SCRIPTS = [
+    "app.py",
+    "interactive_dashboard.py",
+    "static_dashboard_update.py",
+]
+
+# Modules that only matplotlib/seaborn charts need
+HEAVY_MODULES = ["matplotlib", "seaborn"]
+
+# Run in the child process: time the imports, then report which heavy modules are loaded
+CHILD_CODE = """
+import sys, time
+start = time.perf_counter()
+{imports}
+elapsed = time.perf_counter() - start
+print(elapsed, ",".join(m for m in {heavy!r} if m in sys.modules) or "-")
+"""
+
+
+# Get the top-level import statements of a script's source code
+def top_level_imports(source):
+    lines = []
+    for node in ast.parse(source).body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            lines.append(ast.unparse(node))
+    return "\n".join(lines)
+
+
+def script_source(script, rev=None):
+    if rev is None:
+        with open(os.path.join(ROOT_DIR, script), encoding="utf-8") as f:
+            return f.read()
+    return subprocess.check_output(["git", "show", f"{rev}:{script}"], cwd=ROOT_DIR, text=True, encoding="utf-8")
+
+
+# Time the imports in a new interpreter `repeat` times and keep the median
+def time_imports(imports, repeat):
+    code = CHILD_CODE.format(imports=imports, heavy=HEAVY_MODULES)
+    times = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, "-c", code], cwd=ROOT_DIR, text=True,
+                                         stderr=subprocess.DEVNULL)
+        elapsed, loaded = output.split()[-2:]
+        times.append(float(elapsed))
+    return statistics.median(times), loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark script import times")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per script")
+    parser.add_argument("--compare-rev", default=None, help="also time the imports at this git revision")
+    parser.add_argument("--scripts", nargs="+", default=SCRIPTS, help="only run these scripts")
+    args = parser.parse_args()
+
+    print(f"{'script':40s} {'import time':>12s}  heavy modules loaded")
+    for script in args.scripts:
+        now, loaded = time_imports(top_level_imports(script_source(script)), args.repeat)
+        line = f"{script:40s} {now * 1000:9.0f} ms  {loaded}"
+
+        if args.compare_rev:
+            try:
+                before, loaded_before = time_imports(top_level_imports(script_source(script, args.compare_rev)), args.repeat)
+            except subprocess.CalledProcessError:
+                print(line + f"  (not in {args.compare_rev})")
+                continue
+            line += f"  | {args.compare_rev}: {before * 1000:6.0f} ms ({(now - before) * 1000:+.0f} ms), {loaded_before}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# Declarative chart specifications and the query planner that runs them
+#
+# A spec is a dict saying what a chart shows instead of how to get it:
+#   dataset      source of the rows, a key of SOURCES
+#   filters      filter state keys applied to label columns, as (column, key, everyone):
+#                rows are kept when their label is selected, and the filter is left out
+#                when everyone is selected (as in charts.filter_employment)
+#   totals       columns whose filter keeps only the "everyone" row when everyone is
+#                selected, instead of being left out
+#   where        fixed conditions: {column: ("in" or "not in", [labels])}
+#   dimensions   label columns the measure is added up by
+#   years        "range" (year_min..year_max), "latest" (year_max) or "ends" (year_min and year_max)
+#   measure      name of the value column of the result
+#   chart        optional Plotly Express call drawn by figure(): {"type": "line", "x": ..., ...}
+# query() returns one row per year and group, with the columns "Year", the dimensions and
+# the measure, in the order of a pandas groupby over ["Year"] + dimensions.
+#
+# The planner runs every spec over the series matrix of its dataset (forecasting.series_matrix:
+# one row per label combination, one column per year), never over melted rows:
+#   pushdown   the filters and conditions become one boolean mask over the rows, from label
+#              codes computed once per data store
+#   scans      the group sums of a (dataset, mask, dimensions) are computed for every year at
+#              once and kept (see SCAN_CACHE_SIZE), so specs that only differ by their years
+#              or their chart share one scan, such as the age group bar and line charts
+#   rollup     when a scan with the same mask and more dimensions is already kept, the sums
+#              are added up from it instead of from the rows
+# Only the groups left are turned into rows, so new charts written as specs get the cache
+# and the vectorized sums for free.
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+import forecasting
+
+SOURCES = ["employment", "industry_occupation"]
+SCAN_CACHE_SIZE = 64
+
+# Filters of the employment charts
+EMPLOYMENT_FILTERS = [("Sex", "gender", "All"), ("Age Group", "age", "All Ages"), ("Occupation", "jobs", "All Occupations")]
+
+
+# Series matrix of a dataset, with the codes of every label column (labels sorted).
+# Cached per dataset: (source DataFrame, source). The DataFrame is kept to make sure the
+# source belongs to the data store it is asked for. Charts are also built on background
+# threads (precompute.py), hence the locks.
+sources = {}
+sources_lock = threading.Lock()
+
+
+def get_source(data, dataset):
+    if dataset not in SOURCES:
+        raise ValueError(f"No source for dataset {dataset}")
+    with sources_lock:
+        cached = sources.get(dataset)
+        if cached is not None and cached[0] is data[dataset]:
+            return cached[1]
+
+    index, years, values = forecasting.series_matrix(data, dataset)
+    labels = index.to_frame(index=False)
+    source = {
+        "years": np.asarray(years),
+        "values": np.nan_to_num(values),
+        "codes": {column: pd.factorize(labels[column], sort=True) for column in labels.columns}}
+    with sources_lock:
+        sources[dataset] = (data[dataset], source)
+    return source
+
+
+# Conditions of a spec for a filter state, as a sorted tuple (column, operator, labels):
+# the key of the mask it pushes down
+def conditions(spec, filters):
+    found = []
+    for column, key, everyone in spec.get("filters", []):
+        if everyone not in filters[key]:
+            found.append((column, "in", tuple(sorted(filters[key]))))
+        elif column in spec.get("totals", []):
+            found.append((column, "in", (everyone,)))
+    for column, (operator, labels) in spec.get("where", {}).items():
+        found.append((column, operator, tuple(sorted(labels))))
+    return tuple(sorted(found))
+
+
+def row_mask(source, predicate):
+    mask = np.ones(len(source["values"]), dtype=bool)
+    for column, operator, labels in predicate:
+        codes, uniques = source["codes"][column]
+        hit = np.isin(codes, np.flatnonzero(np.isin(uniques, labels)))
+        mask &= hit if operator == "in" else ~hit
+    return mask
+
+
+# Add up the rows of values by group: (labels of every group, sums). group_codes are the
+# codes of each dimension for the rows; groups come out sorted by the dimensions in order.
+def sum_groups(group_codes, uniques, values):
+    if not group_codes:
+        return pd.DataFrame(index=[0]), values.sum(axis=0, keepdims=True)
+    shape = tuple(len(u) for u in uniques)
+    if len(values) == 0:
+        return pd.DataFrame({i: [] for i in range(len(shape))}), np.zeros((0, values.shape[1]))
+    groups, inverse = np.unique(np.ravel_multi_index(group_codes, shape), return_inverse=True)
+    order = np.argsort(inverse, kind="stable")
+    starts = np.flatnonzero(np.r_[True, np.diff(inverse[order]) != 0])
+    sums = np.add.reduceat(values[order], starts, axis=0)
+    positions = np.unravel_index(groups, shape)
+    return pd.DataFrame({i: np.asarray(u, dtype=object)[p] for i, (u, p) in enumerate(zip(uniques, positions))}), sums
+
+
+# Kept scans: (dataset, mask key, dimensions) -> (source, labels of the groups, sums per year)
+scans = OrderedDict()
+scans_lock = threading.Lock()
+
+
+def remember(key, scan):
+    with scans_lock:
+        scans[key] = scan
+        scans.move_to_end(key)
+        while len(scans) > SCAN_CACHE_SIZE:
+            scans.popitem(last=False)
+
+
+# Group sums of a dataset for one mask and dimensions, for every year of the source
+def scan(data, dataset, predicate, dimensions):
+    source = get_source(data, dataset)
+    key = (dataset, predicate, tuple(dimensions))
+    with scans_lock:
+        hit = scans.get(key)
+        if hit is not None and hit[0] is source:
+            scans.move_to_end(key)
+            return hit[1], hit[2]
+        # A kept scan of the same rows by more dimensions: add it up again
+        finer = next((
+            (kept_key[2], kept[1], kept[2]) for kept_key, kept in reversed(scans.items())
+            if kept[0] is source and kept_key[:2] == key[:2] and set(dimensions) < set(kept_key[2])), None)
+
+    if finer is not None:
+        finer_dimensions, finer_labels, finer_sums = finer
+        factorized = [pd.factorize(finer_labels[finer_dimensions.index(d)], sort=True) for d in dimensions]
+        labels, sums = sum_groups([codes for codes, _ in factorized], [uniques for _, uniques in factorized], finer_sums)
+    else:
+        mask = row_mask(source, predicate)
+        codes = [source["codes"][d][0][mask] for d in dimensions]
+        labels, sums = sum_groups(codes, [source["codes"][d][1] for d in dimensions], source["values"][mask])
+    remember(key, (source, labels, sums))
+    return labels, sums
+
+
+def spec_years(spec, filters, years):
+    kind = spec.get("years", "range")
+    if kind == "latest":
+        return years == filters["year_max"]
+    if kind == "ends":
+        return np.isin(years, [filters["year_min"], filters["year_max"]])
+    return (years >= filters["year_min"]) & (years <= filters["year_max"])
+
+
+# Rows of a spec for a filter state (see the top of this file)
+def query(data, filters, spec):
+    dimensions = spec.get("dimensions", [])
+    labels, sums = scan(data, spec["dataset"], conditions(spec, filters), dimensions)
+    years = get_source(data, spec["dataset"])["years"]
+    selected = spec_years(spec, filters, years)
+
+    # One row per (year, group): years first, like a groupby over ["Year"] + dimensions
+    n_groups = len(labels) if dimensions else 1
+    rows = {"Year": np.repeat(years[selected], n_groups)}
+    for i, dimension in enumerate(dimensions):
+        rows[dimension] = np.tile(labels[i].to_numpy(), selected.sum())
+    rows[spec["measure"]] = sums[:, selected].T.reshape(-1)
+    return pd.DataFrame(rows)
+
+
+# Plotly Express figure of a spec with a "chart" entry
+def figure(data, filters, spec):
+    chart = dict(spec["chart"])
+    draw = getattr(px, chart.pop("type"))
+    return draw(query(data, filters, spec), **chart)
@@ -0,0 +1,1047 @@
+# Chart builders for the employment dashboard
+#
+# Every function here takes the data store from data_store.load_data() and a filter
+# state dict, and returns a Plotly figure (or plain numbers for the KPI cards).
+# Nothing in this file calls Streamlit, so the charts can be built from scripts,
+# worker processes or benchmarks as well as from interactive_dashboard.py.
+# Builders are timed as "transform" / "chart" spans when profiling is on (see profiling.py).
+# The base slices the builders start from (filtered rows and the like) are computed once
+# per filter state and shared, see shared(). Charts that add the employment up by some
+# labels are written as declarative specs, run by the query planner of chart_specs.py.
+# When the data store has a SQLite database attached (SG_SQL_STORE=1, see sql_store.py),
+# the row filters run as indexed SQL queries instead of pandas masks.
+#
+# Filter state keys:
+#   year_min, year_max : selected year range
+#   gender             : list of selected genders, ["All"] for everyone
+#   age                : list of selected age groups, ["All Ages"] for every age
+#   jobs               : list of selected occupations, ["All Occupations"] for every occupation
+#   model              : trend model of the projection charts (a key of forecasting.MODELS)
+#   similar_to         : occupation of the "Similar careers" chart, None for the top growing one
+#   anomalies          : mark the years flagged by the anomaly detector (anomalies.py) on the trend charts
+#   industry_drill     : sector opened into its industries in the industry charts, None for every sector
+import functools
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import plotly.colors
+import plotly.express as px
+import plotly.graph_objects as go
+
+import anomalies
+import chart_specs
+import forecasting
+import rollups
+import similarity
+import sql_store
+from profiling import traced
+
+AGE_ORDER = [
+    "15-19 Years Old", "20-24 Years Old", "25-29 Years Old", "30-34 Years Old",
+    "35-39 Years Old", "40-44 Years Old", "45-49 Years Old", "50-54 Years Old",
+    "55-59 Years Old", "60-64 Years Old", "65 Years & Over"]
+
+UNEMPLOYMENT_AGE_GROUPS = ["15 - 24", "25 - 29", "30 - 39", "40 - 49", "50 - 59", "60 & Over"]
+
+SIMILAR_COUNT = 6
+
+EVENTS = {2003: "SARS Pandemic", 2008: "Global Financial Crisis", 2020: "COVID-19 Pandemic"}
+
+SLICE_CACHE_SIZE = 16
+
+# Specs of the employment charts (see chart_specs.py)
+# Every filtered employment row, added up by the lines of the employment trend chart
+EMPLOYMENT_TREND = {
+    "dataset": "employment", "filters": chart_specs.EMPLOYMENT_FILTERS, "measure": "Employment"}
+# Employment of each age group; every occupation is the "All Occupations" rows
+AGE_GROUPS = {
+    "dataset": "employment", "filters": chart_specs.EMPLOYMENT_FILTERS, "totals": ["Occupation"],
+    "where": {"Age Group": ("not in", ["All Ages"])}, "dimensions": ["Age Group"], "measure": "Employment Count"}
+# Employment of each occupation (the "All Occupations" total left out)
+OCCUPATIONS = {
+    "dataset": "employment", "filters": chart_specs.EMPLOYMENT_FILTERS,
+    "where": {"Occupation": ("not in", ["All Occupations"])}, "dimensions": ["Occupation"], "measure": "Employment",
+    "chart": {"type": "line", "x": "Year", "y": "Employment", "color": "Occupation", "markers": True}}
+
+
+# Default filter state: the full year range and everyone selected
+def default_filters(data):
+    return {
+        "year_min": data["year_list"][0],
+        "year_max": data["year_list"][-1],
+        "gender": ["All"],
+        "age": ["All Ages"],
+        "jobs": ["All Occupations"],
+        "model": forecasting.DEFAULT_MODEL,
+        "similar_to": None,
+        "anomalies": False,
+        "industry_drill": None}
+
+
+# Values the filter widgets can take
+def filter_options(data):
+    df = data["employment"]
+    return {
+        "year_list": data["year_list"],
+        "gender_list": sorted(df["Sex"].unique().tolist()),
+        "age_list": sorted(df["Age Group"].unique().tolist()),
+        "job_list": sorted(df["Occupation"].unique().tolist())}
+
+
+# Base slices shared by the builders: a transform decorated with shared(keys) runs once per
+# data store and values of the filter keys it reads, and every builder (and filter state)
+# needing the same slice gets that result. So the builders of one rerun filter the data
+# once, and the two selections of the comparison mode (interactive_dashboard.py) share
+# every slice they have in common. Slices are shared: nothing may change them in place.
+# Builders also run on background threads (precompute.py), hence the lock.
+slices = OrderedDict()
+slices_lock = threading.Lock()
+
+
+def shared(*keys):
+    def decorate(transform):
+        @functools.wraps(transform)
+        def cached(data, filters):
+            key = (transform.__name__,) + filters_key(filters, keys)
+            with slices_lock:
+                hit = slices.get(key)
+                if hit is not None and hit[0] is data:
+                    slices.move_to_end(key)
+                    return hit[1]
+
+            value = transform(data, filters)
+            with slices_lock:
+                slices[key] = (data, value)
+                slices.move_to_end(key)
+                while len(slices) > SLICE_CACHE_SIZE:
+                    slices.popitem(last=False)
+            return value
+        return cached
+    return decorate
+
+
+# Get the year columns inside the selected range
+def get_year_cols(data, filters):
+    return [str(year) for year in data["year_list"] if filters["year_min"] <= year <= filters["year_max"]]
+
+
+# Apply the gender, age and occupation filters to the employment data. Every year column
+# is cleaned, not only the selected ones, so all year ranges share the slice (the builders
+# only add the values up, and a sum leaves out NaN the same way as 0).
+@shared("gender", "age", "jobs")
+@traced("transform")
+def filter_employment(data, filters):
+    if "database" in data:
+        filtered_data = sql_store.filter_rows(data, "employment", filters, chart_specs.EMPLOYMENT_FILTERS)
+    else:
+        filtered_data = data["employment"].copy()
+
+        if "All" not in filters["gender"]:
+            filtered_data = filtered_data[filtered_data["Sex"].isin(filters["gender"])]
+
+        if "All Ages" not in filters["age"]:
+            filtered_data = filtered_data[filtered_data["Age Group"].isin(filters["age"])]
+
+        if "All Occupations" not in filters["jobs"]:
+            filtered_data = filtered_data[filtered_data["Occupation"].isin(filters["jobs"])]
+
+    for year in data["year_list"]:
+        if str(year) in filtered_data.columns:
+            filtered_data[str(year)] = pd.to_numeric(filtered_data[str(year)], errors="coerce").fillna(0)
+    return filtered_data
+
+
+# Everything the dashboard needs besides the charts: whether there is data to show,
+# the KPI cards and the key insights. Only plain Python values, so it can be sent as JSON.
+@traced("transform")
+def dashboard_summary(data, filters):
+    summary = {
+        "has_employment": not filter_employment(data, filters).empty,
+        "year_cols": get_year_cols(data, filters)}
+    if not summary["has_employment"] or not summary["year_cols"]:
+        return summary
+
+    top_hiring = top_hiring_industry(data, filters) if filters["year_min"] < filters["year_max"] else None
+    top_paying = top_paying_occupation(data, filters)
+    summary.update({
+        "kpis": {k: v.item() if hasattr(v, "item") else v for k, v in overview_kpis(data, filters).items()},
+        "top_hiring": [top_hiring[0], float(top_hiring[1])] if top_hiring else None,
+        "top_paying": [top_paying[0], float(top_paying[1])] if top_paying else None,
+        "has_industry": not industry_data(data, filters).empty,
+        "salary_years": salary_years(data, filters)})
+    return summary
+
+
+# TAB 1: Overview
+
+# Calculate the numbers for the KPI metric cards
+@traced("transform")
+def overview_kpis(data, filters):
+    df = data["employment"]
+    year_list = data["year_list"]
+    year_min, year_max = filters["year_min"], filters["year_max"]
+    filtered_data = filter_employment(data, filters)
+
+    # Get the previous years available in the data
+    latest_col = str(year_max)
+    prev_col = None
+    prev2_col = None
+    if year_max in year_list:
+        latest_year_index = year_list.index(year_max)
+        if latest_year_index > 0:
+            prev_col = str(year_list[latest_year_index - 1])
+        if latest_year_index > 1:
+            prev2_col = str(year_list[latest_year_index - 2])
+
+    # Calculate totals only if the year columns exist
+    total_latest = filtered_data[latest_col].sum() if latest_col in filtered_data.columns else 0
+    total_prev = filtered_data[prev_col].sum() if prev_col and prev_col in filtered_data.columns else 0
+    total_prev2 = filtered_data[prev2_col].sum() if prev2_col and prev2_col in filtered_data.columns else 0
+
+    # Calculate YoY growth if previous year's data is available
+    growth = ((total_latest - total_prev) / total_prev * 100) if total_prev else 0
+    growth_prev = ((total_prev - total_prev2) / total_prev2 * 100) if total_prev2 else 0
+    change = round(growth - growth_prev, 2)
+
+    # Total period growth
+    start_col = str(year_min)
+    total_start = filtered_data[start_col].sum() if start_col in filtered_data.columns else 0
+    period_growth = ((total_latest - total_start) / total_start * 100) if total_start else 0
+
+    # Gender breakdown
+    gender_data = df.copy()
+    if "All Ages" not in filters["age"]:
+        gender_data = gender_data[gender_data["Age Group"].isin(filters["age"])]
+    if "All Occupations" not in filters["jobs"]:
+        gender_data = gender_data[gender_data["Occupation"].isin(filters["jobs"])]
+    gender_data[latest_col] = pd.to_numeric(gender_data[latest_col], errors="coerce")
+    female_sum = gender_data[gender_data["Sex"] == "Female"][latest_col].sum()
+    male_sum = gender_data[gender_data["Sex"] == "Male"][latest_col].sum()
+    female_ratio = (female_sum / (female_sum + male_sum) * 100) if (female_sum + male_sum) else 0
+
+    # Grand total for the latest year from the unfiltered data
+    grand_total = df.loc[(df["Age Group"] == "All Ages") & (df["Occupation"] == "All Occupations") & (df["Sex"] == "All"), latest_col].item()
+
+    return {
+        "latest_col": latest_col,
+        "prev_col": prev_col,
+        "prev2_col": prev2_col,
+        "growth": growth,
+        "change": change,
+        "period_growth": period_growth,
+        "grand_total": float(grand_total),
+        "female_sum": female_sum,
+        "male_sum": male_sum,
+        "female_ratio": female_ratio}
+
+
+# Column the employment trend is split by when filters are set
+def trend_grouping(filters):
+    if "All" not in filters["gender"]:
+        return "Sex"
+    if "All Occupations" not in filters["jobs"] and len(filters["jobs"]) > 1:
+        return "Occupation"
+    return "Age Group"
+
+
+def is_default_view(filters):
+    return "All Ages" in filters["age"] and "All Occupations" in filters["jobs"] and "All" in filters["gender"]
+
+
+# Hover text of the flags of the anomaly detector
+def anomaly_text(flags, change_format):
+    kinds = np.where(flags["kind"] == "outlier", "unusual change", np.where(flags["score"] > 0, "shift up", "shift down"))
+    changes = [format(change, change_format) for change in flags["change"]]
+    return [f"<b>{series}</b><br>{year}: {kind} ({change})" for series, year, kind, change in zip(flags["series"], flags["year"], kinds, changes)]
+
+
+# Mark the flagged years of the lines of a figure (flags from anomalies.py, with the value
+# to mark in "value")
+def add_anomaly_markers(fig, flags, change_format="+.1%"):
+    if flags.empty:
+        return
+    fig.add_trace(go.Scatter(
+        x=flags["year"], y=flags["value"], text=anomaly_text(flags, change_format),
+        mode="markers", name="Detected anomaly",
+        marker=dict(symbol="x", size=11, color="#2c3e50", line=dict(width=1, color="white")),
+        hovertemplate="%{text}<extra></extra>"))
+
+
+# Overall employment trend, or the trend split by the filtered dimension
+@traced("chart")
+def fig_employment_trend(data, filters):
+    df = data["employment"]
+    selected_year_cols = get_year_cols(data, filters)
+
+    if is_default_view(filters):
+        total_trend = df.loc[(df["Sex"] == "All") & (df["Age Group"] == "All Ages") & (df["Occupation"] == "All Occupations"), selected_year_cols].sum()
+        male_trend = df.loc[(df["Sex"] == "Male") & (df["Age Group"] == "All Ages") & (df["Occupation"] == "All Occupations"), selected_year_cols].sum()
+        female_trend = df.loc[(df["Sex"] == "Female") & (df["Age Group"] == "All Ages") & (df["Occupation"] == "All Occupations"), selected_year_cols].sum()
+
+        # Create a figure with graph_objects for layering
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(
+            x=total_trend.index, y=total_trend.values,
+            fill="tozeroy", mode="lines",
+            line_color="rgba(100, 149, 237, 0.5)", name="Total"))
+        fig.add_trace(go.Scatter(
+            x=male_trend.index, y=male_trend.values,
+            mode="lines", line_color="#6495ED", name="Male"))
+        fig.add_trace(go.Scatter(
+            x=female_trend.index, y=female_trend.values,
+            mode="lines", line_color="#FF69B4", name="Female"))
+        title = "<b>Overall Employment Trend by Gender</b>"
+
+        if filters["anomalies"]:
+            add_anomaly_markers(fig, pd.concat([
+                anomalies.series_flags(data, "employment", [sex, "All Ages", "All Occupations"], filters["year_min"], filters["year_max"]).assign(series=name)
+                for name, sex in [("Total", "All"), ("Male", "Male"), ("Female", "Female")]]))
+
+    # Setting the chart when user uses filters
+    else:
+        grouping_var = trend_grouping(filters)
+        grouped_trend = chart_specs.query(data, filters, dict(EMPLOYMENT_TREND, dimensions=[grouping_var]))
+        color_map = {"Male": "#6495ED", "Female": "#FF69B4"} if grouping_var == "Sex" else {}
+        fig = px.line(grouped_trend, x="Year", y="Employment", color=grouping_var,
+                      markers=True, color_discrete_map=color_map)
+        title = f"<b>Employment Trend by {grouping_var}</b>"
+
+        if filters["anomalies"]:
+            add_anomaly_markers(fig, anomalies.detect_lines(grouped_trend.pivot(index=grouping_var, columns="Year", values="Employment")))
+
+    fig.update_layout(
+        title=title,
+        height=350,
+        margin=dict(l=20, r=20, t=60, b=20),
+        legend_title_text="")
+    return fig
+
+
+# Rows of the employment data behind each line of the employment trend chart
+def trend_rows(data, filters):
+    df = data["employment"]
+    if is_default_view(filters):
+        totals = df[(df["Age Group"] == "All Ages") & (df["Occupation"] == "All Occupations")]
+        return {name: df.index.get_indexer(totals.index[totals["Sex"] == sex]) for name, sex in [("Total", "All"), ("Male", "Male"), ("Female", "Female")]}
+    filtered_data = filter_employment(data, filters)
+    grouping_var = trend_grouping(filters)
+    return {name: df.index.get_indexer(group.index) for name, group in filtered_data.groupby(grouping_var)}
+
+
+def band_color(color, opacity=0.15):
+    r, g, b = plotly.colors.hex_to_rgb(color) if color.startswith("#") else plotly.colors.unlabel_rgb(color)
+    return f"rgba({r}, {g}, {b}, {opacity})"
+
+
+# History and projection lines of some groups of employment rows. With bands=True the
+# 95% prediction interval of each projection is drawn as a shaded band.
+def projection_figure(data, filters, groups, colors, bands):
+    df = data["employment"]
+    year_cols = get_year_cols(data, filters)
+    fit = forecasting.get_fit(data, "employment", filters["model"], filters["year_min"], filters["year_max"])
+
+    fig = go.Figure()
+    for i, (name, rows) in enumerate(groups.items()):
+        color = colors.get(name) or px.colors.qualitative.Plotly[i % len(px.colors.qualitative.Plotly)]
+        history = df.iloc[rows][year_cols].sum()
+        projection = forecasting.forecast_total(fit, rows)
+        years = projection["year"].tolist()
+
+        if bands:
+            fig.add_trace(go.Scatter(
+                x=years + years[::-1], y=projection["upper"].tolist() + projection["lower"].tolist()[::-1],
+                fill="toself", fillcolor=band_color(color), line=dict(width=0),
+                hoverinfo="skip", showlegend=False, legendgroup=name))
+        fig.add_trace(go.Scatter(
+            x=[int(year) for year in year_cols], y=history.values,
+            mode="lines", line=dict(color=color), name=name, legendgroup=name))
+        # Start the projection at the last selected year so the two lines join
+        fig.add_trace(go.Scatter(
+            x=[filters["year_max"]] + years, y=[history.iloc[-1]] + projection["forecast"].tolist(),
+            customdata=[[None, None]] + projection[["lower", "upper"]].values.tolist(),
+            mode="lines", line=dict(color=color, dash="dash"), name=f"{name} (projection)",
+            showlegend=False, legendgroup=name,
+            hovertemplate="%{x}: %{y:,.1f}<br>95% interval %{customdata[0]:,.1f} – %{customdata[1]:,.1f}<extra>" + name + "</extra>"))
+
+    fig.update_layout(
+        title=f"<b>Projection to {forecasting.HORIZON_YEAR}</b> ({forecasting.MODELS[filters['model']]}, fitted on {filters['year_min']}–{filters['year_max']})",
+        xaxis_title="Year", yaxis_title="Employment (in Thousands)", legend_title_text="")
+    return fig
+
+
+# Projection of the lines of the employment trend chart with their 95% intervals, or None
+# when there is nothing to project (period too short, or it already ends at the horizon)
+@traced("chart")
+def fig_projection(data, filters):
+    if len(get_year_cols(data, filters)) < forecasting.MIN_POINTS or filters["year_max"] >= forecasting.HORIZON_YEAR:
+        return None
+    colors = {"Total": "#6495ED", "Male": "#1F4E9C", "Female": "#FF69B4"}
+    fig = projection_figure(data, filters, trend_rows(data, filters), colors, bands=True)
+    fig.update_layout(height=400, margin=dict(l=20, r=20, t=60, b=20))
+    return fig
+
+
+# Industry that added the most jobs in the selected period, or None
+@traced("transform")
+def top_hiring_industry(data, filters):
+    year_min, year_max = filters["year_min"], filters["year_max"]
+
+    io_filtered = rollups.rollup(rollups.get_engine(data), "industry", years=[year_min, year_max])
+    io_pivot = io_filtered.pivot_table(index="industry", columns="year", values="employment", aggfunc="sum")
+    if year_min not in io_pivot.columns or year_max not in io_pivot.columns:
+        return None
+
+    growth = io_pivot[year_max] - io_pivot[year_min]
+    return growth.idxmax(), growth.max()
+
+
+# Occupation with the highest average salary (salary data stops at 2023), or None
+@traced("transform")
+def top_paying_occupation(data, filters):
+    df2 = data["salary"]
+    year_for_salary = salary_insight_year(filters)
+    sal_latest = df2[(df2["year"] == year_for_salary) & (df2["occupation"] != "All Occupations")]
+    if sal_latest.empty:
+        return None
+
+    mean_salary = sal_latest.groupby("occupation")["value"].mean()
+    return mean_salary.idxmax(), mean_salary.max()
+
+
+# If 2024 is selected, use 2023 for the salary insight, because there's no 2024 salary data
+def salary_insight_year(filters):
+    return 2023 if filters["year_max"] == 2024 else filters["year_max"]
+
+
+# TAB 2: Demographic Analysis
+
+# Employment trend for the total and each selected gender
+@traced("chart")
+def fig_area(data, filters):
+    df = data["employment"]
+
+    genders_to_plot = ["All"]
+    if "All" in filters["gender"]:
+        genders_to_plot.extend(["Male", "Female"])
+    else:
+        genders_to_plot.extend(filters["gender"])
+
+    combined_src = df[
+        (df["Occupation"] == "All Occupations") &
+        (df["Age Group"] == "All Ages") &
+        df["Sex"].isin(genders_to_plot)]
+
+    combined_melt = combined_src.melt(
+        id_vars=["Sex"],
+        value_vars=get_year_cols(data, filters),
+        var_name="Year",
+        value_name="Employment")
+    combined_melt["Year"] = combined_melt["Year"].astype(int)
+    combined_melt["Sex"] = combined_melt["Sex"].replace({"All": "Total"})
+
+    fig = px.line(
+        combined_melt, x="Year", y="Employment", color="Sex",
+        markers=False, category_orders={"Sex": ["Total", "Male", "Female"]},
+        color_discrete_map={"Total": "lightskyblue", "Male": "blue", "Female": "hotpink"})
+    fig.update_traces(selector={"name": "Total"}, fill="tozeroy")
+    return fig
+
+
+# Employment by age group in the latest selected year
+@traced("chart")
+def fig_bar(data, filters):
+    age_snapshot = chart_specs.query(data, filters, dict(AGE_GROUPS, years="latest"))[["Age Group", "Employment Count"]]
+
+    # Set age group order from youngest to oldest
+    age_snapshot["Age Group"] = pd.Categorical(age_snapshot["Age Group"], categories=AGE_ORDER, ordered=True)
+    age_snapshot = age_snapshot.sort_values("Age Group")
+
+    fig = px.bar(age_snapshot, x="Age Group", y="Employment Count",
+                 color="Age Group", text_auto=".2s")
+    fig.update_traces(textposition="outside", cliponaxis=False)
+    return fig
+
+
+# Employment trend for each age group
+@traced("chart")
+def fig_line(data, filters):
+    age_trend = chart_specs.query(data, filters, AGE_GROUPS).pivot(index="Year", columns="Age Group", values="Employment Count")
+    age_trend.index.name = None
+
+    fig = px.line(age_trend, x=age_trend.index, y=age_trend.columns, markers=True)
+    fig.update_layout(xaxis_title="Year", yaxis_title="Total Employment", legend_title_text="Age Group")
+    return fig
+
+
+# TAB 3: Industry Performance
+
+# Industry x occupation rows inside the selected year range
+@traced("transform")
+def industry_data(data, filters):
+    df_io = data["industry_occupation"]
+    return df_io[(df_io["year"] >= filters["year_min"]) & (df_io["year"] <= filters["year_max"])].copy()
+
+
+# Level the industry charts are drawn at, as (level, node of the level above): every
+# sector (rollups.HIERARCHIES), or the industries of the drilled-down sector
+def industry_level(filters):
+    return ("industry", filters["industry_drill"]) if filters["industry_drill"] else ("sector", None)
+
+
+LEVEL_NAMES = {"sector": "Sector", "industry": "Industry"}
+
+
+# Title of a chart opened on a drilled-down sector, or None when nothing is drilled into
+def drill_title(filters):
+    return f"Industries of {filters['industry_drill']}" if filters["industry_drill"] else None
+
+
+# Total employment of each sector (or industry of the drilled-down sector) in the latest selected year
+@traced("transform")
+def industry_totals(data, filters):
+    level, node = industry_level(filters)
+    return rollups.rollup(rollups.get_engine(data), level, industry_node=node, years=[filters["year_max"]])
+
+
+# Bar chart of employment volume by sector (industry)
+@traced("chart")
+def fig1(data, filters):
+    by_industry = industry_totals(data, filters)[["industry", "employment"]].sort_values(
+        by="employment", ascending=False)
+
+    fig = px.bar(
+        by_industry,
+        x="industry",
+        y="employment",
+        color="industry",
+        text="employment",
+        text_auto=".1f")
+    fig.update_traces(textposition="outside", cliponaxis=False)
+    fig.update_layout(
+        xaxis_title="Employment (in Thousands)",
+        yaxis_title=None,
+        uniformtext_minsize=8,
+        uniformtext_mode="hide",
+        showlegend=False,
+        coloraxis_showscale=True)
+    title = drill_title(filters)
+    if title:
+        fig.update_layout(title=title)
+    return fig
+
+
+# Line chart of the employment trend of the top 10 sectors (industries)
+@traced("chart")
+def fig2(data, filters):
+    level, node = industry_level(filters)
+    engine = rollups.get_engine(data)
+    years = [year for year in engine["years"] if filters["year_min"] <= year <= filters["year_max"]]
+    top_industries = industry_totals(data, filters).sort_values(
+        by="employment", ascending=False)["industry"].head(10).tolist()
+
+    trends_data = rollups.rollup(engine, level, industry_node=node, years=years)
+    trends_data = trends_data[trends_data["industry"].isin(top_industries)]
+
+    fig = px.line(
+        trends_data,
+        x="year",
+        y="employment",
+        color="industry",
+        markers=True)
+    fig.update_layout(
+        xaxis_title="Year",
+        yaxis_title="Employment (in Thousands)",
+        legend_title_text=LEVEL_NAMES[level])
+    title = drill_title(filters)
+    if title:
+        fig.update_layout(title=title)
+    return fig
+
+
+# Stacked bar chart of the occupation share in each sector (industry), or None when there's no detail
+@traced("chart")
+def fig3(data, filters):
+    level, node = industry_level(filters)
+    composition_data = rollups.rollup(
+        rollups.get_engine(data), level, "occupation", industry_node=node, years=[filters["year_max"]])
+
+    # Filter by occupation if specific occupations in the filter are selected
+    if "All Occupations" not in filters["jobs"]:
+        composition_data = composition_data[composition_data["occupation"].isin(filters["jobs"])]
+    if composition_data.empty:
+        return None
+
+    # Calculate the percentage share of each occupation within its industry
+    totals = composition_data.groupby("industry")["employment"].sum().rename("total_employment")
+    composition_data = composition_data.merge(totals, on="industry")
+    composition_data["share"] = composition_data["employment"] / composition_data["total_employment"]
+
+    fig = px.bar(
+        composition_data,
+        x="industry",
+        y="share",
+        color="occupation",
+        labels={"share": "Share of Workforce", "industry": LEVEL_NAMES[level], "occupation": "Occupation"},
+        text_auto=".0%")
+    fig.update_traces(textposition="inside", insidetextanchor="middle")
+    fig.update_layout(
+        height=700,
+        barmode="stack",
+        xaxis_title=None,
+        yaxis_title="Share of Employment",
+        yaxis_tickformat=".0%",
+        legend=dict(orientation="h", yanchor="bottom", y=-0.4, xanchor="center", x=0.5),
+        xaxis={"categoryorder": "total descending"})
+    title = drill_title(filters)
+    if title:
+        fig.update_layout(title=title)
+    return fig
+
+
+# TAB 4: Occupation Performance
+
+# Employment trend of each occupation
+@traced("transform")
+def occupation_trend(data, filters):
+    return chart_specs.query(data, filters, OCCUPATIONS)
+
+
+@traced("chart")
+def fig_trend(data, filters):
+    fig = chart_specs.figure(data, filters, OCCUPATIONS)
+    final_trend = occupation_trend(data, filters)
+    if filters["anomalies"] and not final_trend.empty:
+        add_anomaly_markers(fig, anomalies.detect_lines(final_trend.pivot(index="Occupation", columns="Year", values="Employment")))
+    return fig
+
+
+# Projection of the employment of each occupation, or None when there is nothing to project
+@traced("chart")
+def fig_occupation_projection(data, filters):
+    if len(get_year_cols(data, filters)) < forecasting.MIN_POINTS or filters["year_max"] >= forecasting.HORIZON_YEAR:
+        return None
+    df = data["employment"]
+    filtered_data = filter_employment(data, filters)
+    filtered_data = filtered_data[filtered_data["Occupation"] != "All Occupations"]
+    if filtered_data.empty:
+        return None
+    groups = {name: df.index.get_indexer(group.index) for name, group in filtered_data.groupby("Occupation")}
+    return projection_figure(data, filters, groups, {}, bands=False)
+
+
+# Top 4 growing and declining occupations between the first and last selected year
+@shared("year_min", "year_max", "gender", "age", "jobs")
+@traced("transform")
+def occupation_growth(data, filters):
+    start_year = str(filters["year_min"])
+    end_year = str(filters["year_max"])
+
+    # The growth needs more than one year
+    if filters["year_min"] not in data["year_list"] or filters["year_max"] not in data["year_list"] or start_year == end_year:
+        empty = pd.DataFrame(columns=["Occupation", "Growth %"])
+        return empty, empty
+
+    # Employment of each occupation (the total excluded) in the first and last year
+    growth_summary = chart_specs.query(data, filters, dict(OCCUPATIONS, years="ends")).pivot(
+        index="Occupation", columns="Year", values="Employment")
+    growth_summary.columns = [str(year) for year in growth_summary.columns]
+
+    # Remove any occupations that had 0 employment at the start to avoid division-by-zero errors
+    growth_summary = growth_summary[growth_summary[start_year] > 0]
+    growth_summary["Growth %"] = (
+        (growth_summary[end_year] - growth_summary[start_year]) /
+        growth_summary[start_year]) * 100
+
+    top_grow = growth_summary.nlargest(4, "Growth %").reset_index()
+    top_decl = growth_summary.nsmallest(4, "Growth %").reset_index()
+    return top_grow, top_decl
+
+
+@traced("chart")
+def fig_growing(data, filters):
+    top_grow, _ = occupation_growth(data, filters)
+    fig = px.bar(top_grow, x="Growth %", y="Occupation", orientation="h", color="Occupation",
+                 text_auto=".1f", title="Top 4 Growing Occupations")
+    fig.update_traces(texttemplate="%{x:.1f}%", textposition="outside")
+    fig.update_layout(showlegend=False, yaxis={"categoryorder": "total ascending"})
+    return fig
+
+
+@traced("chart")
+def fig_declining(data, filters):
+    _, top_decl = occupation_growth(data, filters)
+    fig = px.bar(top_decl, x="Growth %", y="Occupation", orientation="h", color="Occupation",
+                 text_auto=".1f", title="Top 4 Declining Occupations")
+    fig.update_traces(texttemplate="%{x:.1f}%", textposition="outside")
+    fig.update_layout(showlegend=False, yaxis={"categoryorder": "total descending"})
+    return fig
+
+
+# Occupation the "Similar careers" chart is about: the selected one, or the top growing one
+def similar_query(data, filters):
+    if filters["similar_to"]:
+        return filters["similar_to"]
+    top_grow, _ = occupation_growth(data, filters)
+    return top_grow["Occupation"].iloc[0] if not top_grow.empty else None
+
+
+# Employment series whose trajectories are most like the one of an occupation (see
+# similarity.py), drawn as indexes (first selected year = 100), or None when there is
+# nothing to compare
+@traced("chart")
+def fig_similar(data, filters):
+    occupation = similar_query(data, filters)
+    index = similarity.get_index(data, filters["year_min"], filters["year_max"])
+    if occupation is None or index is None:
+        return None
+    found = similarity.similar_occupations(index, occupation, SIMILAR_COUNT)
+    if found is None or found["hits"].empty:
+        return None
+
+    years = index["years"]
+    fig = go.Figure()
+    for row, (_, hit) in zip(found["rows"], found["hits"].iterrows()):
+        values = index["values"][row]
+        fig.add_trace(go.Scatter(
+            x=years, y=values / values[0] * 100, mode="lines", name=hit["series"],
+            hovertemplate=f"%{{x}}: %{{y:.0f}}<br>correlation {hit['correlation']:.2f}, shape cluster {hit['cluster'] + 1}<extra></extra>"))
+    values = index["values"][found["query"]]
+    cluster = index["table"]["cluster"].iloc[found["query"]]
+    fig.add_trace(go.Scatter(
+        x=years, y=values / values[0] * 100, mode="lines+markers", name=occupation,
+        line=dict(color="#2c3e50", width=4), hovertemplate="%{x}: %{y:.0f}<extra>" + occupation + "</extra>"))
+    fig.update_layout(
+        title=f"<b>Careers Shaped Like {occupation}</b><br><sup>Shape cluster {cluster + 1} of {similarity.N_CLUSTERS}, "
+              f"{(index['table']['cluster'] == cluster).sum():,} series</sup>",
+        xaxis_title="Year", yaxis_title=f"Employment ({years[0]} = 100)", legend_title_text="",
+        legend=dict(orientation="h", yanchor="top", y=-0.2), height=500)
+    return fig
+
+
+# 100% stacked bar of the male/female share of each occupation, or None when there's no data
+@traced("chart")
+def fig_gender(data, filters):
+    end_year = str(filters["year_max"])
+    filtered_data = filter_employment(data, filters)
+    gender_dist_data = filtered_data[filtered_data["Sex"].isin(["Male", "Female"])]
+    if end_year not in gender_dist_data.columns or gender_dist_data.empty:
+        return None
+
+    gender_summary = gender_dist_data.groupby(["Occupation", "Sex"])[end_year].sum().reset_index()
+
+    # Calculate the share of each gender in every occupation
+    occupation_totals = gender_summary.groupby("Occupation")[end_year].sum().rename("Total")
+    gender_summary = gender_summary.merge(occupation_totals, on="Occupation")
+    gender_summary["Share (%)"] = (gender_summary[end_year] / gender_summary["Total"]) * 100
+
+    fig = px.bar(
+        gender_summary, x="Share (%)", y="Occupation", color="Sex", orientation="h",
+        text="Share (%)",
+        color_discrete_map={"Male": "#004C99", "Female": "#FF9999"})
+    fig.update_traces(texttemplate="%{text:.1f}%", textposition="inside")
+    fig.update_layout(
+        barmode="stack", xaxis_title="Share of Workforce", yaxis_title=None,
+        legend_title_text="Gender", yaxis={"categoryorder": "total ascending"})
+    return fig
+
+
+# Grid of small bar charts: age x gender for each occupation, or None when there's no data
+@traced("chart")
+def fig_breakdown(data, filters):
+    df = data["employment"]
+    end_year = str(filters["year_max"])
+
+    # Use the non-aggregated rows only
+    breakdown_data = df[
+        (df["Age Group"] != "All Ages") &
+        (df["Sex"] != "All") &
+        (df["Occupation"] != "All Occupations")]
+
+    if "All Occupations" not in filters["jobs"]:
+        breakdown_data = breakdown_data[breakdown_data["Occupation"].isin(filters["jobs"])]
+    if "All" not in filters["gender"]:
+        breakdown_data = breakdown_data[breakdown_data["Sex"].isin(filters["gender"])]
+    if "All Ages" not in filters["age"]:
+        breakdown_data = breakdown_data[breakdown_data["Age Group"].isin(filters["age"])]
+
+    if end_year not in breakdown_data.columns or breakdown_data.empty:
+        return None
+
+    occupations_in_order = sorted(breakdown_data["Occupation"].unique())
+    # Plotly needs the gap between rows to shrink when there are many occupations
+    n_rows = (len(occupations_in_order) - 1) // 3 + 1
+    fig = px.bar(
+        breakdown_data,
+        x="Age Group", y=end_year, color="Sex",
+        facet_col="Occupation",     # Create a new chart for each occupation
+        facet_col_wrap=3,           # Show 3 charts per row
+        facet_row_spacing=min(0.07, 0.5 / max(n_rows - 1, 1)),
+        barmode="group",
+        height=300 * n_rows,
+        color_discrete_map={"Male": "navy", "Female": "lightcoral"})
+
+    # Set y-axis ranges for each chart for better visibility
+    fig.update_yaxes(matches=None, showticklabels=True)
+
+    # Tidy up the titles for each small chart
+    for annotation in fig.layout.annotations:
+        annotation.text = annotation.text.replace("Occupation=", "")
+
+    # Add a y-axis title only to the first chart in each row
+    fig.update_yaxes(title_text="Employed (in Thousands)", col=1)
+    fig.update_yaxes(title_text="", col=2)
+    fig.update_yaxes(title_text="", col=3)
+    return fig
+
+
+# TAB 5: Salary Trend
+
+# Apply the gender and occupation filters to the salary data
+@shared("gender", "jobs")
+@traced("transform")
+def filter_salary(data, filters):
+    if "database" in data:
+        return sql_store.filter_rows(data, "salary", filters, sql_store.SALARY_FILTERS)
+    filtered_data2 = data["salary"].copy()
+    if "All" not in filters["gender"]:
+        filtered_data2 = filtered_data2[filtered_data2["gender"].isin(filters["gender"])]
+    if "All Occupations" not in filters["jobs"]:
+        filtered_data2 = filtered_data2[filtered_data2["occupation"].isin(filters["jobs"])]
+    return filtered_data2
+
+
+# Salary years available inside the selected range
+@traced("transform")
+def salary_years(data, filters):
+    years = filter_salary(data, filters)["year"]
+    return sorted(int(year) for year in years.unique() if filters["year_min"] <= year <= filters["year_max"])
+
+
+# Male minus female salary for every occupation and year
+@shared("gender", "jobs")
+@traced("transform")
+def salary_gap(data, filters):
+    filtered_data2 = filter_salary(data, filters)
+    rank_m = filtered_data2[filtered_data2["gender"] == "Male"]
+    rank_f = filtered_data2[filtered_data2["gender"] == "Female"]
+    gap = rank_m.merge(rank_f, how="left", on=("occupation", "year"), suffixes=("_m", "_f"))
+    gap["gap"] = gap["value_m"] - gap["value_f"]
+    return gap
+
+
+# Salary charts return None when there's no salary data in the selected range
+@traced("chart")
+def fig_salary_bar(data, filters):
+    years = salary_years(data, filters)
+    if not years:
+        return None
+    year_max_sal = years[-1]
+    filtered_data2 = filter_salary(data, filters)
+    sal_snapshot = filtered_data2[filtered_data2["year"] == year_max_sal].groupby("occupation")["value"].mean().sort_values(ascending=False).reset_index()
+    sal_snapshot.columns = ["Occupation", "Gross Monthly Income"]
+
+    fig = px.bar(sal_snapshot, x="Occupation", y="Gross Monthly Income",
+                 title=f"<b>Gross Monthly Income by Occupation in {year_max_sal}</b>",
+                 color="Occupation", text_auto=".2s")
+    fig.update_traces(textposition="outside", cliponaxis=False)
+    return fig
+
+
+@traced("chart")
+def fig_salary_gap(data, filters):
+    years = salary_years(data, filters)
+    if not years:
+        return None
+    year_max_sal = years[-1]
+    gap = salary_gap(data, filters)
+    gap_snapshot = gap[gap["year"] == year_max_sal].groupby(["occupation", "year"])["gap"].mean().sort_values(ascending=False).reset_index()
+    gap_snapshot = gap_snapshot.rename(columns={
+        "occupation": "Occupation",
+        "gap": "Monthly Income Gap"})
+
+    fig = px.bar(gap_snapshot, x="Occupation", y="Monthly Income Gap",
+                 title=f"<b>Gender Monthly Income Gap by Occupation in {year_max_sal} (Men − Women)</b>",
+                 color="Occupation", text_auto=".2s")
+    fig.update_traces(textposition="outside", cliponaxis=False)
+    return fig
+
+
+@traced("chart")
+def fig_salary_trend(data, filters):
+    years = salary_years(data, filters)
+    if not years:
+        return None
+    filtered_data2 = filter_salary(data, filters)
+    sal_trend = filtered_data2[filtered_data2["year"].isin(years)].groupby(["occupation", "year"])["value"].mean().reset_index()
+
+    fig = px.line(sal_trend, x="year", y="value", color="occupation",
+                  title="<b>Year-over-Year Salary Trends by Occupation</b>", markers=True)
+    fig.update_layout(xaxis_title="Year", yaxis_title="Gross Monthly Income", legend_title_text="Occupation")
+    fig.update_traces(cliponaxis=False, selector=dict(type="scatter"))
+    return fig
+
+
+@traced("chart")
+def fig_salary_gap_trend(data, filters):
+    years = salary_years(data, filters)
+    if not years:
+        return None
+    gap = salary_gap(data, filters)
+    gap_trend = gap[gap["year"].isin(years)].groupby(["occupation", "year"])["gap"].mean().reset_index()
+
+    fig = px.line(gap_trend, x="year", y="gap", color="occupation",
+                  title="<b>Year-over-Year Gender Salary Gap Trends by Occupation (Men − Women)</b>", markers=True)
+    fig.update_layout(xaxis_title="Year", yaxis_title="Monthly Income Gap", legend_title_text="Occupation")
+    fig.update_traces(cliponaxis=False, selector=dict(type="scatter"))
+    return fig
+
+
+# TAB 6: Unemployment Trend
+
+# Overall unemployment rate of each year in the selected range
+@traced("transform")
+def unemployment_trend(data, filters):
+    if "database" in data:
+        return sql_store.select(
+            data["database"], "unemployment_age", {"Age Group": ["Total"]},
+            between=("Year", filters["year_min"], filters["year_max"])).sort_values("Year")
+    df_age = data["unemployment_age"]
+    return df_age[
+        (df_age["Age Group"] == "Total") &
+        (df_age["Year"] >= filters["year_min"]) &
+        (df_age["Year"] <= filters["year_max"])
+    ].sort_values("Year")
+
+
+# Overall unemployment rate with the key events marked, or None when there's no data
+@traced("chart")
+def fig_overall(data, filters):
+    df_total_trend = unemployment_trend(data, filters)
+    if df_total_trend.empty:
+        return None
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=df_total_trend["Year"], y=df_total_trend["Unemployment"],
+        mode="lines+markers", name="Unemployment Rate",
+        line=dict(color="#e74c3c", width=3),
+        marker=dict(size=8, color="#e74c3c", line=dict(width=1, color="white")),
+        fill="tozeroy", fillcolor="rgba(231, 76, 60, 0.2)"))
+    for year, text in EVENTS.items():
+        if year in df_total_trend["Year"].values:
+            unemployment_value = df_total_trend[df_total_trend["Year"] == year]["Unemployment"].iloc[0]
+            fig.add_annotation(
+                x=year, y=unemployment_value, text=text,
+                showarrow=True, arrowhead=2, ax=0, ay=-40)
+    if filters["anomalies"]:
+        flags = anomalies.series_flags(data, "unemployment_age", ["Total"], filters["year_min"], filters["year_max"])
+        add_anomaly_markers(fig, flags.assign(series="Unemployment Rate"), change_format="+.1f")
+    fig.update_layout(
+        xaxis_title="Year", yaxis_title="Unemployment Rate (%)", height=500,
+        hovermode="x unified", showlegend=False)
+    return fig
+
+
+# Unemployment rate by age group in the latest selected year, or None when there's no data
+@traced("chart")
+def fig_age_dist(data, filters):
+    df_age = data["unemployment_age"]
+    df_age_latest = df_age[df_age["Year"] == filters["year_max"]].copy()
+    df_age_latest = df_age_latest[df_age_latest["Age Group"].isin(UNEMPLOYMENT_AGE_GROUPS)]
+    if df_age_latest.empty:
+        return None
+
+    df_age_latest["Age Group"] = pd.Categorical(df_age_latest["Age Group"], categories=UNEMPLOYMENT_AGE_GROUPS, ordered=True)
+    df_age_latest = df_age_latest.sort_values("Age Group")
+
+    fig = go.Figure()
+    # Add bar trace with text labels
+    fig.add_trace(go.Bar(
+        x=df_age_latest["Age Group"], y=df_age_latest["Unemployment"],
+        marker_color=px.colors.sequential.Viridis, name="Unemployment Rate",
+        text=df_age_latest["Unemployment"], texttemplate="%{text:.1f}%", textposition="outside"))
+    # Add line trace
+    fig.add_trace(go.Scatter(
+        x=df_age_latest["Age Group"], y=df_age_latest["Unemployment"],
+        mode="lines+markers", line=dict(color="navy", width=3),
+        marker=dict(size=12, color="white", line=dict(width=2.5, color="navy")),
+        name="Trend Line"))
+    fig.update_layout(
+        title="By Age Group", xaxis_title=None,
+        yaxis_title="Unemployment Rate (%)", height=450, showlegend=False,
+        uniformtext_minsize=8, uniformtext_mode="hide")
+    return fig
+
+
+# Unemployment rate by qualification in the latest selected year, or None when there's no data
+@traced("chart")
+def fig_qual_bar(data, filters):
+    df_qual = data["unemployment_qual"]
+    df_qual_latest = df_qual[df_qual["Year"] == filters["year_max"]]
+    if df_qual_latest.empty:
+        return None
+
+    df_chart_data = df_qual_latest.sort_values("Unemployment", ascending=True)
+    fig = px.bar(
+        df_chart_data, x="Unemployment", y="Highest Qualification",
+        orientation="h", color="Unemployment",
+        color_continuous_scale="RdYlGn_r", title="By Qualification",
+        text_auto=".1f")
+    fig.update_traces(textposition="outside")
+    fig.update_layout(
+        height=450, showlegend=False,
+        xaxis_title="Unemployment Rate (%)", yaxis_title=None)
+    return fig
+
+
+# Every chart builder, grouped by the dashboard tab it belongs to
+CHARTS = {
+    "Overview": [fig_employment_trend, fig_projection],
+    "Demographic Analysis": [fig_area, fig_bar, fig_line],
+    "Industry Performance": [fig1, fig2, fig3],
+    "Occupation Performance": [fig_trend, fig_occupation_projection, fig_growing, fig_declining, fig_similar, fig_gender, fig_breakdown],
+    "Salary Trend": [fig_salary_bar, fig_salary_gap, fig_salary_trend, fig_salary_gap_trend],
+    "Unemployment Trend": [fig_overall, fig_age_dist, fig_qual_bar],
+}
+
+
+# Filter keys each chart builder reads. A chart only has to be built again when one of
+# its keys changes: moving the start of the year range, for example, leaves the charts of
+# the latest year alone, and the gender filter leaves the industry and unemployment charts.
+YEARS = ["year_min", "year_max"]
+CHART_INPUTS = {
+    fig_employment_trend: YEARS + ["gender", "age", "jobs", "anomalies"],
+    fig_projection: YEARS + ["gender", "age", "jobs", "model"],
+    fig_area: YEARS + ["gender"],
+    fig_bar: ["year_max", "gender", "age", "jobs"],
+    fig_line: YEARS + ["gender", "age", "jobs"],
+    fig1: ["year_max", "industry_drill"],
+    fig2: YEARS + ["industry_drill"],
+    fig3: ["year_max", "jobs", "industry_drill"],
+    fig_trend: YEARS + ["gender", "age", "jobs", "anomalies"],
+    fig_occupation_projection: YEARS + ["gender", "age", "jobs", "model"],
+    fig_growing: YEARS + ["gender", "age", "jobs"],
+    fig_declining: YEARS + ["gender", "age", "jobs"],
+    fig_similar: YEARS + ["gender", "age", "jobs", "similar_to"],
+    fig_gender: ["year_max", "gender", "age", "jobs"],
+    fig_breakdown: ["year_max", "gender", "age", "jobs"],
+    fig_salary_bar: YEARS + ["gender", "jobs"],
+    fig_salary_gap: YEARS + ["gender", "jobs"],
+    fig_salary_trend: YEARS + ["gender", "jobs"],
+    fig_salary_gap_trend: YEARS + ["gender", "jobs"],
+    fig_overall: YEARS + ["anomalies"],
+    fig_age_dist: ["year_max"],
+    fig_qual_bar: ["year_max"],
+}
+
+
+# The values of the given filter keys (all of them by default) as a hashable tuple
+def filters_key(filters, keys=None):
+    return tuple((k, tuple(filters[k]) if isinstance(filters[k], list) else filters[k]) for k in keys or sorted(filters))
+
+
+# The values of the filters a chart builder reads, to tell whether it must be built again
+def chart_key(builder, filters):
+    return filters_key(filters, CHART_INPUTS[builder])
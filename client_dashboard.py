@@ -0,0 +1,461 @@
+# Client-side dashboard: the data is sent to the browser once and filtered there
+#
+# Run with: streamlit run client_dashboard.py (or pick "Dashboard (in browser)" in app.py)
+#
+# interactive_dashboard.py reruns on the server and sends every figure again for each
+# filter change. This page packs the data behind the charts into one compact payload
+# (float32 values and dictionary-encoded labels, base64) and embeds it in an HTML
+# component together with the filters and the charts. Filtering, aggregating and drawing
+# happen in JavaScript, so a filter change never reaches the server.
+#
+# The page covers the main charts of every tab with the same filter rules as charts.py:
+# KPIs and employment trend, demographics, industry volume and top 10 trends, occupation
+# trends, salary trends and unemployment. The other charts stay in interactive_dashboard.py.
+# Plotly.js is loaded from the Plotly CDN, like include_plotlyjs="cdn" in plotly.
+import base64
+import json
+
+import numpy as np
+import streamlit as st
+import streamlit.components.v1 as components
+from plotly.offline import get_plotlyjs_version
+
+import charts
+import profiling
+import rollups
+from app_data import load_shared_data
+from data_store import get_data_dir
+
+PLOTLY_CDN = f"https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"
+
+
+def encode(values, dtype):
+    return {"type": dtype, "data": base64.b64encode(np.ascontiguousarray(values, dtype=dtype).tobytes()).decode("ascii")}
+
+
+# Smallest unsigned integer type that holds the codes of n labels
+def code_type(n):
+    return "<u1" if n <= 1 << 8 else "<u2" if n <= 1 << 16 else "<u4"
+
+
+# Pack a DataFrame column by column: text as a list of labels plus one small integer code
+# per row, numbers as float32 (NaN stays NaN). A missing label gets the code of a null
+# label added at the end of the list.
+def pack_frame(df):
+    columns = {}
+    for c in df.columns:
+        if df[c].dtype.kind in "fiub":
+            columns[str(c)] = encode(df[c].to_numpy(dtype="float64"), "<f4")
+        else:
+            codes, labels = df[c].factorize()
+            labels = labels.tolist()
+            if (codes < 0).any():
+                codes = np.where(codes < 0, len(labels), codes)
+                labels.append(None)
+            packed = encode(codes, code_type(len(labels)))
+            packed["labels"] = labels
+            columns[str(c)] = packed
+    return {"rows": len(df), "columns": columns}
+
+
+# Everything the browser needs, as one JSON document
+def build_payload(data):
+    industry_totals = rollups.rollup(rollups.get_engine(data), "industry")[["industry", "year", "employment"]]
+    year_cols = [str(year) for year in data["year_list"]]
+    employment = data["employment"][["Sex", "Age Group", "Occupation"] + year_cols]
+
+    return {
+        "options": charts.filter_options(data),
+        "age_order": charts.AGE_ORDER,
+        "unemployment_age_groups": charts.UNEMPLOYMENT_AGE_GROUPS,
+        "events": {str(year): text for year, text in charts.EVENTS.items()},
+        "employment": pack_frame(employment),
+        "salary": pack_frame(data["salary"]),
+        "industry": pack_frame(industry_totals),
+        "unemployment_age": pack_frame(data["unemployment_age"]),
+        "unemployment_qual": pack_frame(data["unemployment_qual"])}
+
+
+PAGE_STYLE = """
+body { font-family: "Source Sans Pro", sans-serif; margin: 0; color: #31333F; }
+.layout { display: flex; gap: 24px; }
+.filters { width: 220px; flex: none; }
+.filters label { display: block; font-size: 14px; margin: 12px 0 4px; }
+.filters select { width: 100%; }
+.content { flex: 1; min-width: 0; border: 1px solid #ddd; border-radius: 8px; padding: 12px 16px; }
+.row { display: flex; gap: 24px; } .col { flex: 1; min-width: 0; }
+.tab-bar { border-bottom: 1px solid #ddd; margin-bottom: 12px; }
+.tab-btn { background: none; border: none; padding: 8px 12px; cursor: pointer; font-size: 15px; }
+.tab-btn.active { border-bottom: 2px solid #ff4b4b; color: #ff4b4b; }
+.tab-panel { display: none; } .tab-panel.active { display: block; }
+.caption { color: #808495; font-size: 13px; }
+.alert { padding: 12px 16px; border-radius: 6px; margin: 8px 0; background: #e6f0ff; }
+.metric .label { font-size: 14px; } .metric .value { font-size: 30px; }
+.metric .delta { font-size: 14px; color: #09ab3b; } .metric .delta.down { color: #ff2b2b; }
+.chart { width: 100%; min-height: 400px; }
+"""
+
+PAGE_BODY = """
+<div class="layout">
+<div class="filters">
+  <h3>🔎 Filters</h3>
+  <label>From year</label><select id="year_min"></select>
+  <label>To year</label><select id="year_max"></select>
+  <label>Gender</label><select id="gender" multiple size="3"></select>
+  <label>Age Group</label><select id="age" multiple size="6"></select>
+  <label>Occupation</label><select id="jobs" multiple size="6"></select>
+  <p class="caption">⚠️ If you select <b>All</b>, the other filters for that category won't apply.
+  Hold Ctrl (Cmd on Mac) to pick several values.</p>
+</div>
+<div class="content">
+  <div class="tab-bar">
+    <button class="tab-btn active" data-tab="overview">Overview</button>
+    <button class="tab-btn" data-tab="demographic">Demographic Analysis</button>
+    <button class="tab-btn" data-tab="industry">Industry Performance</button>
+    <button class="tab-btn" data-tab="occupation">Occupation Performance</button>
+    <button class="tab-btn" data-tab="salary">Salary Trend</button>
+    <button class="tab-btn" data-tab="unemployment">Unemployment Trend</button>
+  </div>
+  <div class="tab-panel active" id="overview">
+    <div class="row" id="kpis"></div>
+    <h3>Employment Trend</h3><div class="chart" id="employment_trend"></div>
+  </div>
+  <div class="tab-panel" id="demographic">
+    <h3>Employment Trend (Overall & By Gender)</h3><div class="chart" id="area"></div>
+    <h3>Employment by Age Group (<span class="year-max"></span>)</h3><div class="chart" id="age_bar"></div>
+    <h3>Employment Trends by Age Group</h3><div class="chart" id="age_line"></div>
+  </div>
+  <div class="tab-panel" id="industry">
+    <div class="alert">Note: Gender and Age Group filters are not applicable for this section.</div>
+    <h3>Employment Volume by Industry in <span class="year-max"></span></h3><div class="chart" id="industry_bar"></div>
+    <h3>Employment Trends Across Top 10 Industries</h3><div class="chart" id="industry_trend"></div>
+  </div>
+  <div class="tab-panel" id="occupation">
+    <h3>Employment Trend by Occupation</h3><div class="chart" id="occupation_trend"></div>
+  </div>
+  <div class="tab-panel" id="salary">
+    <div class="alert">Note: The Age Group filter is not applicable for this section.</div>
+    <h3>Salary Trends by Occupation</h3><div class="chart" id="salary_trend"></div>
+  </div>
+  <div class="tab-panel" id="unemployment">
+    <div class="alert">Note: This section is only affected by the year filter.</div>
+    <h3>Overall Unemployment Trend</h3><div class="chart" id="unemployment_overall"></div>
+    <div class="row">
+      <div class="col"><div class="chart" id="unemployment_age"></div></div>
+      <div class="col"><div class="chart" id="unemployment_qual"></div></div>
+    </div>
+  </div>
+</div>
+</div>
+"""
+
+# Unpack the payload into typed arrays, then redraw the charts of the visible tab whenever
+# a filter changes. Hidden tabs are drawn when they are opened.
+PAGE_SCRIPT = """
+const PAYLOAD = JSON.parse(document.getElementById("payload").textContent);
+const TYPES = {"<f4": Float32Array, "<u1": Uint8Array, "<u2": Uint16Array, "<u4": Uint32Array};
+
+function decode(col) {
+  const bin = atob(col.data);
+  const bytes = new Uint8Array(bin.length);
+  for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+  return new TYPES[col.type](bytes.buffer);
+}
+// Text columns keep their codes; label(col, i) gives the text of row i (null when missing)
+function unpack(frame) {
+  const cols = {rows: frame.rows};
+  for (const [name, col] of Object.entries(frame.columns)) {
+    cols[name] = col.labels ? {codes: decode(col), labels: col.labels} : decode(col);
+  }
+  return cols;
+}
+const label = (col, i) => col.labels[col.codes[i]];
+const DATA = {};
+for (const name of ["employment", "salary", "industry", "unemployment_age", "unemployment_qual"]) DATA[name] = unpack(PAYLOAD[name]);
+const YEARS = PAYLOAD.options.year_list;
+const CONFIG = {responsive: true, displaylogo: false};
+
+// Row indexes of a frame where test(i) is true
+function rows(frame, test) {
+  const out = [];
+  for (let i = 0; i < frame.rows; i++) if (test(i)) out.push(i);
+  return out;
+}
+// Sum values into groups: returns Map(group -> number)
+function groupSum(items, keyOf, valueOf) {
+  const out = new Map();
+  for (const i of items) {
+    const key = keyOf(i);
+    out.set(key, (out.get(key) || 0) + valueOf(i));
+  }
+  return out;
+}
+const num = v => (Number.isNaN(v) ? 0 : v);
+const sorted = keys => Array.from(keys).sort();
+
+// ---- Filters ----
+function fillSelect(id, values, selected) {
+  const el = document.getElementById(id);
+  for (const v of values) el.add(new Option(v, v, false, selected.includes(v)));
+}
+fillSelect("year_min", YEARS, [YEARS[0]]);
+fillSelect("year_max", YEARS, [YEARS[YEARS.length - 1]]);
+fillSelect("gender", PAYLOAD.options.gender_list, ["All"]);
+fillSelect("age", PAYLOAD.options.age_list, ["All Ages"]);
+fillSelect("jobs", PAYLOAD.options.job_list, ["All Occupations"]);
+
+function getFilters() {
+  const picked = id => Array.from(document.getElementById(id).selectedOptions, o => o.value);
+  let yearMin = +document.getElementById("year_min").value;
+  let yearMax = +document.getElementById("year_max").value;
+  if (yearMin > yearMax) [yearMin, yearMax] = [yearMax, yearMin];
+  return {year_min: yearMin, year_max: yearMax, gender: picked("gender"), age: picked("age"), jobs: picked("jobs")};
+}
+const inRange = (f, year) => f.year_min <= year && year <= f.year_max;
+const yearCols = f => YEARS.filter(y => inRange(f, y)).map(String);
+
+// Same rules as charts.filter_employment
+function filterEmployment(f) {
+  const e = DATA.employment;
+  return rows(e, i =>
+    (f.gender.includes("All") || f.gender.includes(label(e.Sex, i))) &&
+    (f.age.includes("All Ages") || f.age.includes(label(e["Age Group"], i))) &&
+    (f.jobs.includes("All Occupations") || f.jobs.includes(label(e.Occupation, i))));
+}
+const sumCol = (items, col) => items.reduce((s, i) => s + num(DATA.employment[col][i]), 0);
+
+// ---- Charts ----
+function lines(groups, xs, mode) {
+  return sorted(groups.keys()).map(name => ({type: "scatter", mode: mode || "lines+markers", name: name, x: xs, y: groups.get(name)}));
+}
+function plot(id, traces, layout) {
+  Plotly.react(id, traces, Object.assign({margin: {l: 40, r: 20, t: 40, b: 40}}, layout || {}), CONFIG);
+}
+
+function drawOverview(f) {
+  const e = DATA.employment;
+  const filtered = filterEmployment(f);
+  const latest = String(f.year_max);
+  const idx = YEARS.indexOf(f.year_max);
+  const prev = idx > 0 ? String(YEARS[idx - 1]) : null;
+  const prev2 = idx > 1 ? String(YEARS[idx - 2]) : null;
+  const totalLatest = sumCol(filtered, latest);
+  const totalPrev = prev && prev in e ? sumCol(filtered, prev) : 0;
+  const totalPrev2 = prev2 && prev2 in e ? sumCol(filtered, prev2) : 0;
+  const growth = totalPrev ? (totalLatest - totalPrev) / totalPrev * 100 : 0;
+  const growthPrev = totalPrev2 ? (totalPrev - totalPrev2) / totalPrev2 * 100 : 0;
+  const totalStart = sumCol(filtered, String(f.year_min));
+  const periodGrowth = totalStart ? (totalLatest - totalStart) / totalStart * 100 : 0;
+
+  const genderRows = rows(e, i =>
+    (f.age.includes("All Ages") || f.age.includes(label(e["Age Group"], i))) &&
+    (f.jobs.includes("All Occupations") || f.jobs.includes(label(e.Occupation, i))));
+  const female = sumCol(genderRows.filter(i => label(e.Sex, i) === "Female"), latest);
+  const male = sumCol(genderRows.filter(i => label(e.Sex, i) === "Male"), latest);
+  const total = rows(e, i => label(e.Sex, i) === "All" && label(e["Age Group"], i) === "All Ages" && label(e.Occupation, i) === "All Occupations");
+
+  const metric = (name, value, delta, note) =>
+    `<div class="col metric"><div class="label">${name}</div><div class="value">${value}</div>` +
+    (delta ? `<div class="delta ${delta.startsWith("-") ? "down" : ""}">${delta}</div>` : "") +
+    `<div class="caption">${note}</div></div>`;
+  document.getElementById("kpis").innerHTML =
+    metric(`Total Growth (${f.year_min} to ${f.year_max})`, periodGrowth.toFixed(2) + "%", null, "For the entire selected period") +
+    metric(`Total Employment (in Thousands, ${latest})`, sumCol(total, latest).toFixed(1), prev ? growth.toFixed(2) + "%" : null,
+           prev ? `Year-over-year vs. ${prev}` : "No previous year for comparison") +
+    metric(`YoY Growth Rate (${latest})`, prev ? growth.toFixed(2) + "%" : "N/A", prev2 ? (growth - growthPrev).toFixed(2) + " pp" : null,
+           prev2 ? `Growth momentum vs. ${prev}` : "Insufficient data for momentum") +
+    metric(`Female Employment (${latest})`, (female + male ? female / (female + male) * 100 : 0).toFixed(1) + "%", null,
+           `${Math.round(female).toLocaleString()} Female / ${Math.round(male).toLocaleString()} Male`);
+
+  // Employment trend: total and genders by default, otherwise split by the filtered dimension
+  const cols = yearCols(f);
+  const isDefault = f.gender.includes("All") && f.age.includes("All Ages") && f.jobs.includes("All Occupations");
+  let traces;
+  if (isDefault) {
+    const series = sex => {
+      const picked = rows(e, i => label(e.Sex, i) === sex && label(e["Age Group"], i) === "All Ages" && label(e.Occupation, i) === "All Occupations");
+      return cols.map(c => sumCol(picked, c));
+    };
+    traces = [
+      {type: "scatter", mode: "lines", name: "Total", x: cols, y: series("All"), fill: "tozeroy", line: {color: "rgba(100, 149, 237, 0.5)"}},
+      {type: "scatter", mode: "lines", name: "Male", x: cols, y: series("Male"), line: {color: "#6495ED"}},
+      {type: "scatter", mode: "lines", name: "Female", x: cols, y: series("Female"), line: {color: "#FF69B4"}}];
+  } else {
+    const by = !f.gender.includes("All") ? "Sex" : (!f.jobs.includes("All Occupations") && f.jobs.length > 1 ? "Occupation" : "Age Group");
+    const groups = new Map();
+    for (const i of filtered) {
+      const key = label(e[by], i);
+      if (!groups.has(key)) groups.set(key, cols.map(() => 0));
+      const ys = groups.get(key);
+      cols.forEach((c, j) => { ys[j] += num(e[c][i]); });
+    }
+    traces = lines(groups, cols.map(Number));
+    if (by === "Sex") traces.forEach(t => { t.line = {color: t.name === "Male" ? "#6495ED" : "#FF69B4"}; });
+  }
+  plot("employment_trend", traces, {height: 350, legend: {title: {text: ""}}});
+}
+
+function drawDemographic(f) {
+  const e = DATA.employment;
+  const cols = yearCols(f);
+  const genders = ["All"].concat(f.gender.includes("All") ? ["Male", "Female"] : f.gender);
+  plot("area", genders.map(sex => {
+    const picked = rows(e, i => label(e.Sex, i) === sex && label(e["Age Group"], i) === "All Ages" && label(e.Occupation, i) === "All Occupations");
+    const name = sex === "All" ? "Total" : sex;
+    const trace = {type: "scatter", mode: "lines", name: name, x: cols.map(Number), y: cols.map(c => sumCol(picked, c)),
+                   line: {color: {Total: "lightskyblue", Male: "blue", Female: "hotpink"}[name]}};
+    if (name === "Total") trace.fill = "tozeroy";
+    return trace;
+  }), {xaxis: {title: {text: "Year"}}, yaxis: {title: {text: "Employment"}}});
+
+  // Same rows as charts.AGE_GROUPS
+  const ageRows = filterEmployment(f).filter(i =>
+    (!f.jobs.includes("All Occupations") || label(e.Occupation, i) === "All Occupations") && label(e["Age Group"], i) !== "All Ages");
+  const ages = PAYLOAD.age_order.filter(a => ageRows.some(i => label(e["Age Group"], i) === a));
+  const latest = groupSum(ageRows, i => label(e["Age Group"], i), i => num(e[String(f.year_max)][i]));
+  plot("age_bar", [{type: "bar", x: ages, y: ages.map(a => latest.get(a)), marker: {color: ages.map((a, j) => j)},
+                    text: ages.map(a => latest.get(a)), texttemplate: "%{text:.2s}", textposition: "outside", cliponaxis: false}],
+       {xaxis: {title: {text: "Age Group"}}, yaxis: {title: {text: "Employment Count"}}});
+
+  const trend = new Map();
+  for (const a of sorted(new Set(ageRows.map(i => label(e["Age Group"], i))))) {
+    const picked = ageRows.filter(i => label(e["Age Group"], i) === a);
+    trend.set(a, cols.map(c => sumCol(picked, c)));
+  }
+  plot("age_line", lines(trend, cols.map(Number)), {xaxis: {title: {text: "Year"}}, yaxis: {title: {text: "Total Employment"}}, legend: {title: {text: "Age Group"}}});
+}
+
+function drawIndustry(f) {
+  const d = DATA.industry;
+  const latest = rows(d, i => d.year[i] === f.year_max).sort((a, b) => d.employment[b] - d.employment[a]);
+  plot("industry_bar", [{type: "bar", x: latest.map(i => label(d.industry, i)), y: latest.map(i => d.employment[i]),
+                         text: latest.map(i => d.employment[i]), texttemplate: "%{text:.1f}", textposition: "outside", cliponaxis: false}],
+       {yaxis: {title: {text: "Employment (in Thousands)"}}, showlegend: false});
+
+  const top = latest.slice(0, 10).map(i => label(d.industry, i));
+  const inPeriod = rows(d, i => inRange(f, d.year[i]) && top.includes(label(d.industry, i)));
+  plot("industry_trend", top.map(name => {
+    const picked = inPeriod.filter(i => label(d.industry, i) === name).sort((a, b) => d.year[a] - d.year[b]);
+    return {type: "scatter", mode: "lines+markers", name: name, x: picked.map(i => d.year[i]), y: picked.map(i => d.employment[i])};
+  }), {xaxis: {title: {text: "Year"}}, yaxis: {title: {text: "Employment (in Thousands)"}}, legend: {title: {text: "Industry"}}});
+}
+
+function drawOccupation(f) {
+  const e = DATA.employment;
+  const cols = yearCols(f);
+  const picked = filterEmployment(f).filter(i => label(e.Occupation, i) !== "All Occupations");
+  const trend = new Map();
+  for (const occupation of new Set(picked.map(i => label(e.Occupation, i)))) {
+    const group = picked.filter(i => label(e.Occupation, i) === occupation);
+    trend.set(occupation, cols.map(c => sumCol(group, c)));
+  }
+  plot("occupation_trend", lines(trend, cols.map(Number)), {xaxis: {title: {text: "Year"}}, yaxis: {title: {text: "Employment"}}});
+}
+
+function drawSalary(f) {
+  const s = DATA.salary;
+  // Same rows as charts.filter_salary, inside the selected years; mean per occupation and year
+  const picked = rows(s, i => inRange(f, s.year[i]) &&
+    (f.gender.includes("All") || f.gender.includes(label(s.gender, i))) &&
+    (f.jobs.includes("All Occupations") || f.jobs.includes(label(s.occupation, i))) && !Number.isNaN(s.value[i]));
+  const years = sorted(new Set(picked.map(i => s.year[i])));
+  const sums = groupSum(picked, i => label(s.occupation, i) + "|" + s.year[i], i => s.value[i]);
+  const counts = groupSum(picked, i => label(s.occupation, i) + "|" + s.year[i], () => 1);
+  const trend = new Map();
+  for (const occupation of new Set(picked.map(i => label(s.occupation, i)))) {
+    trend.set(occupation, years.map(y => { const k = occupation + "|" + y; return counts.has(k) ? sums.get(k) / counts.get(k) : null; }));
+  }
+  plot("salary_trend", lines(trend, years), {title: {text: "<b>Year-over-Year Salary Trends by Occupation</b>"},
+       xaxis: {title: {text: "Year"}}, yaxis: {title: {text: "Gross Monthly Income"}}, legend: {title: {text: "Occupation"}}});
+}
+
+function drawUnemployment(f) {
+  const a = DATA.unemployment_age;
+  const total = rows(a, i => label(a["Age Group"], i) === "Total" && inRange(f, a.Year[i])).sort((x, y) => a.Year[x] - a.Year[y]);
+  const annotations = total.filter(i => String(a.Year[i]) in PAYLOAD.events).map(i =>
+    ({x: a.Year[i], y: a.Unemployment[i], text: PAYLOAD.events[String(a.Year[i])], showarrow: true, arrowhead: 2, ax: 0, ay: -40}));
+  plot("unemployment_overall", [{type: "scatter", mode: "lines+markers", name: "Unemployment Rate",
+        x: total.map(i => a.Year[i]), y: total.map(i => a.Unemployment[i]), fill: "tozeroy", fillcolor: "rgba(231, 76, 60, 0.2)",
+        line: {color: "#e74c3c", width: 3}, marker: {size: 8, color: "#e74c3c", line: {width: 1, color: "white"}}}],
+       {height: 500, hovermode: "x unified", showlegend: false, annotations: annotations,
+        xaxis: {title: {text: "Year"}}, yaxis: {title: {text: "Unemployment Rate (%)"}}});
+
+  const byAge = new Map(rows(a, i => a.Year[i] === f.year_max).map(i => [label(a["Age Group"], i), a.Unemployment[i]]));
+  const groups = PAYLOAD.unemployment_age_groups.filter(g => byAge.has(g));
+  plot("unemployment_age", [
+    {type: "bar", x: groups, y: groups.map(g => byAge.get(g)), text: groups.map(g => byAge.get(g)), texttemplate: "%{text:.1f}%", textposition: "outside"},
+    {type: "scatter", mode: "lines+markers", x: groups, y: groups.map(g => byAge.get(g)), line: {color: "navy", width: 3},
+     marker: {size: 12, color: "white", line: {width: 2.5, color: "navy"}}}],
+    {title: {text: "By Age Group"}, height: 450, showlegend: false, yaxis: {title: {text: "Unemployment Rate (%)"}}});
+
+  const q = DATA.unemployment_qual;
+  const latest = rows(q, i => q.Year[i] === f.year_max).sort((x, y) => q.Unemployment[x] - q.Unemployment[y]);
+  plot("unemployment_qual", [{type: "bar", orientation: "h", x: latest.map(i => q.Unemployment[i]), y: latest.map(i => label(q["Highest Qualification"], i)),
+        marker: {color: latest.map(i => q.Unemployment[i]), colorscale: "RdYlGn", reversescale: true},
+        text: latest.map(i => q.Unemployment[i]), texttemplate: "%{text:.1f}", textposition: "outside"}],
+       {title: {text: "By Qualification"}, height: 450, xaxis: {title: {text: "Unemployment Rate (%)"}}});
+}
+
+const DRAW = {overview: drawOverview, demographic: drawDemographic, industry: drawIndustry,
+              occupation: drawOccupation, salary: drawSalary, unemployment: drawUnemployment};
+let drawnFor = {};
+
+// Draw the visible tab for the current filters (other tabs are redrawn when opened)
+function update() {
+  const f = getFilters();
+  const key = JSON.stringify(f);
+  document.querySelectorAll(".year-max").forEach(el => { el.textContent = f.year_max; });
+  const tab = document.querySelector(".tab-panel.active").id;
+  if (drawnFor[tab] !== key) {
+    DRAW[tab](f);
+    drawnFor[tab] = key;
+  }
+}
+document.querySelectorAll(".filters select").forEach(el => el.addEventListener("change", update));
+document.querySelectorAll(".tab-btn").forEach(function (btn) {
+  btn.addEventListener("click", function () {
+    document.querySelectorAll(".tab-btn, .tab-panel").forEach(el => el.classList.remove("active"));
+    btn.classList.add("active");
+    document.getElementById(btn.dataset.tab).classList.add("active");
+    update();
+  });
+});
+update();
+"""
+
+
+def build_page(payload):
+    # Escape "</" so the data can never close the script tag early
+    payload_json = json.dumps(payload, separators=(",", ":")).replace("</", "<\\/")
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<style>{PAGE_STYLE}</style>
+<script src="{PLOTLY_CDN}"></script>
+</head>
+<body>
+{PAGE_BODY}
+<script type="application/json" id="payload">{payload_json}</script>
+<script>{PAGE_SCRIPT}</script>
+</body>
+</html>
+"""
+
+
+# The page for one data folder, built once per server process
+@st.cache_resource
+def get_page(data_dir):
+    return build_page(build_payload(load_shared_data(data_dir)))
+
+
+profiling.start_run("client_dashboard.py")
+
+st.set_page_config(page_title="Singapore Employment Trends", layout="wide")
+st.title("📊 Singapore Employment Dashboard (2000-2024)")
+st.caption("Data Source: SingStat · Filters run in your browser: changing them doesn't reload the page.")
+
+with profiling.span("client page", "render"):
+    components.html(get_page(get_data_dir()), height=1500, scrolling=True)
+
+profiling.finish_run()
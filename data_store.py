@@ -0,0 +1,130 @@
+# Load every dataset used by the dashboards into one data store
+#
+# The data store is a plain dict of DataFrames plus the list of years, so it can be
+# passed to the chart builders in charts.py from Streamlit, scripts or tests alike.
+# The CSV files are read from the repo folder, or from the folder in the SG_DATA_DIR
+# environment variable (for example a synthetic/x100 folder from generate_synthetic_data.py).
+# Every dataset is checked for consistent totals as it is read (see validation.py), so a
+# bad refresh fails when the dataset is first used instead of drawing wrong charts.
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pandas as pd
+
+import validation
+from profiling import span
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# File name of each dataset
+FILES = {
+    "employment": "clean_data_combined.csv",
+    "salary": "salary.csv",
+    "unemployment_age": "unemployment_by_age.csv",
+    "unemployment_sex": "unemployment_by_sex.csv",
+    "unemployment_qual": "unemployment_by_qualification.csv",
+    "industry_occupation": "Industry and Occupation.csv",
+}
+
+
+# Folder the CSV files are read from
+def get_data_dir():
+    return os.environ.get("SG_DATA_DIR") or ROOT_DIR
+
+
+def data_path(file_name, data_dir=None):
+    return os.path.join(data_dir or get_data_dir(), file_name)
+
+
+# Read one CSV file from the data folder (timed as a "load" span when profiling is on).
+# The pyarrow parser gives the same DataFrame as the default one, but it releases the GIL
+# while parsing, so the files really are read in parallel by start_reading.
+def read_csv(file_name, data_dir=None):
+    with span(f"read_csv {file_name}", "load"):
+        return pd.read_csv(data_path(file_name, data_dir), engine="pyarrow")
+
+
+# Read the CSV files and get them ready for the charts.
+# With SG_SHARED_STORE=1 the data comes from the memory-mapped store in shared_store.py,
+# so every process on the host shares one copy of it. Otherwise the files are read at the
+# same time on a thread pool (see start_reading), and the data store is returned right away:
+# getting a dataset from it only waits for that one file.
+# With SG_SQL_STORE=1 the SQLite copy of the data (see sql_store.py) is also attached as
+# data["database"], and the row filters of the charts are run as SQL queries against it.
+def load_data(data_dir=None):
+    data_dir = data_dir or get_data_dir()
+    if os.environ.get("SG_SHARED_STORE", "") not in ("", "0"):
+        from shared_store import load_store
+        data = load_store(data_dir, FILES, read_data)
+    else:
+        data = start_reading(data_dir)
+    if os.environ.get("SG_SQL_STORE", "") not in ("", "0"):
+        from sql_store import open_database
+        data["database"] = open_database(data_dir, FILES, data=data)
+    return data
+
+
+# Read every dataset and wait for all of them
+def read_data(data_dir):
+    pending = start_reading(data_dir)
+    return {name: pending[name] for name in pending}
+
+
+# Check the totals of a dataset (timed as a "load" span when profiling is on); raises a
+# ValueError listing the worst cells when they don't add up
+def check_dataset(name, df):
+    with span(f"validate {name}", "load"):
+        validation.check(name, df)
+    return df
+
+
+def read_dataset(name, data_dir):
+    return check_dataset(name, read_csv(FILES[name], data_dir))
+
+
+# Read the employment file and make sure the year columns are numbers
+def read_employment(data_dir):
+    df = read_csv(FILES["employment"], data_dir)
+    year_cols = [c for c in df.columns if c.isdigit()]
+    for c in year_cols:
+        df[c] = pd.to_numeric(df[c], errors="coerce")
+    return check_dataset("employment", df)
+
+
+def get_year_list(employment):
+    return sorted(int(c) for c in employment.result().columns if c.isdigit())
+
+
+# Start reading every CSV file on its own thread, so a cold load takes about as long as
+# the slowest file instead of the sum of all of them
+def start_reading(data_dir):
+    pool = ThreadPoolExecutor(max_workers=len(FILES) + 1, thread_name_prefix="load_data")
+    pending = PendingData()
+    employment = pool.submit(read_employment, data_dir)
+    for name in FILES:
+        pending[name] = employment if name == "employment" else pool.submit(read_dataset, name, data_dir)
+    pending["year_list"] = pool.submit(get_year_list, employment)
+    pool.shutdown(wait=False)
+    return pending
+
+
+# A data store whose datasets may still be loading. Getting a dataset waits for it
+# (timed as a "load" span when profiling is on) and then keeps the result. get(), values()
+# and items() wait too, so they never return a dataset that is still loading.
+class PendingData(dict):
+    def __getitem__(self, name):
+        value = super().__getitem__(name)
+        if isinstance(value, Future):
+            with span(f"wait for {name}", "load"):
+                value = value.result()
+            self[name] = value
+        return value
+
+    def get(self, name, default=None):
+        return self[name] if name in self else default
+
+    def values(self):
+        return [self[name] for name in self]
+
+    def items(self):
+        return [(name, self[name]) for name in self]
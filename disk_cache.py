@@ -0,0 +1,210 @@
+# Result cache on disk, kept across server restarts and deploys
+#
+# Results are written to files named after the SHA-256 of their key, in a folder per kind
+# of result ("dashboard" for the summaries and figures of precompute.py, "service" for the
+# responses of aggregation_service.py) and per version of the data and code:
+#   .data_store/results/<kind>-<version>/<sha256 of the key>
+# The version is a hash of the fingerprint of the CSV files (see shared_store.py) and of
+# the contents of the .py files of the repo, so a data refresh or a deploy that changes the
+# code starts from new entries, and the old ones age out. A file holds the key as a line
+# of JSON, then the result. Files are written to a temporary name and renamed, so several
+# processes can share the folder.
+#
+# The folder is kept under SG_RESULT_CACHE_MB megabytes (default MAX_MB): past that, the
+# least recently used files (by modification time, which a hit refreshes) are removed until
+# it is down to EVICT_TO of the limit. warm() reads back the most recently used entries of
+# the current version, for a server to start with a full in-memory cache.
+#
+# Set SG_RESULT_CACHE=0 to turn it off.
+import glob
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from data_store import FILES, ROOT_DIR, get_data_dir
+from shared_store import fingerprint, get_store_root
+
+ENABLED = os.environ.get("SG_RESULT_CACHE", "1") not in ("", "0")
+MAX_MB = 256
+EVICT_TO = 0.9
+
+
+def get_cache_root():
+    return os.path.join(get_store_root(), "results")
+
+
+def get_max_bytes():
+    return float(os.environ.get("SG_RESULT_CACHE_MB") or MAX_MB) * 1024 * 1024
+
+
+# Hash of the code the results are computed by
+def code_fingerprint():
+    h = hashlib.sha1()
+    for path in sorted(glob.glob(os.path.join(ROOT_DIR, "*.py"))):
+        with open(path, "rb") as f:
+            h.update(os.path.basename(path).encode() + b"\0" + f.read())
+    return h.hexdigest()[:16]
+
+
+# Folder of every kind of result for the data folder and code of this process, computed
+# once: the data store of a process is read once too
+folders = {}
+state = {"size": None}
+lock = threading.Lock()
+# Files are written by one background thread, so writing never slows a page down
+writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="disk_cache")
+
+
+def get_folder(kind):
+    with lock:
+        if kind not in folders:
+            version = hashlib.sha1(f"{fingerprint(get_data_dir(), FILES)}:{code_fingerprint()}".encode()).hexdigest()[:16]
+            folders[kind] = os.path.join(get_cache_root(), f"{kind}-{version}")
+        return folders[kind]
+
+
+def entry_path(kind, key_line):
+    return os.path.join(get_folder(kind), hashlib.sha256(key_line).hexdigest())
+
+
+def key_line(key):
+    return json.dumps(key, separators=(",", ":")).encode("utf-8")
+
+
+# JSON turns the tuples of a key into lists: turn them back
+def as_key(value):
+    return tuple(as_key(v) for v in value) if isinstance(value, list) else value
+
+
+# The result (bytes) of a key, or None when it isn't on disk
+def load(kind, key):
+    if not ENABLED:
+        return None
+    line = key_line(key)
+    path = entry_path(kind, line)
+    try:
+        with open(path, "rb") as f:
+            stored_line, _, body = f.read().partition(b"\n")
+        os.utime(path)
+    except OSError:
+        return None
+    # Two keys with the same hash are not the same entry
+    return body if stored_line == line else None
+
+
+def write(kind, key, body):
+    line = key_line(key)
+    path = entry_path(kind, line)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".writing-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(line + b"\n" + body)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    grow(len(line) + 1 + len(body))
+
+
+# Write the result of a key in the background. body is bytes, or a function returning
+# them (so encoding a figure doesn't slow the page down either).
+def store(kind, key, body):
+    if not ENABLED:
+        return
+    writer.submit(store_now, kind, key, body)
+
+
+def store_now(kind, key, body):
+    try:
+        write(kind, key, body() if callable(body) else body)
+    except (OSError, TypeError, ValueError):
+        # A result that can't be written is computed again next time
+        pass
+
+
+# Files of the cache as (modification time, size, path)
+def list_entries():
+    entries = []
+    for folder in glob.glob(os.path.join(get_cache_root(), "*")):
+        try:
+            with os.scandir(folder) as found:
+                for entry in found:
+                    if entry.is_file() and not entry.name.startswith("."):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            continue
+    return entries
+
+
+# Add a new file to the size of the cache, and remove the least recently used files when
+# it is over the limit
+def grow(size):
+    with lock:
+        if state["size"] is None:
+            state["size"] = sum(entry[1] for entry in list_entries())
+        else:
+            state["size"] += size
+        if state["size"] <= get_max_bytes():
+            return
+        entries = sorted(list_entries())
+        total = sum(entry[1] for entry in entries)
+        for _, entry_size, path in entries:
+            if total <= get_max_bytes() * EVICT_TO:
+                break
+            try:
+                os.remove(path)
+                total -= entry_size
+            except OSError:
+                pass
+        state["size"] = total
+        # Folders of old versions left empty
+        for folder in glob.glob(os.path.join(get_cache_root(), "*")):
+            if folder not in folders.values() and not os.listdir(folder):
+                shutil.rmtree(folder, ignore_errors=True)
+
+
+# The most recently used entries of a kind of result for the current version, up to
+# limit, as (key, body), most recent first
+def warm(kind, limit):
+    if not ENABLED:
+        return []
+    folder = get_folder(kind)
+    try:
+        with os.scandir(folder) as found:
+            entries = sorted(((entry.stat().st_mtime, entry.path) for entry in found
+                              if entry.is_file() and not entry.name.startswith(".")), reverse=True)
+    except OSError:
+        return []
+    warmed = []
+    for _, path in entries[:limit]:
+        try:
+            with open(path, "rb") as f:
+                line, _, body = f.read().partition(b"\n")
+            warmed.append((as_key(json.loads(line)), body))
+        except (OSError, ValueError):
+            continue
+    return warmed
+
+
+# Results of the dashboard: Plotly figures (as "F" and their JSON) or plain JSON values
+# such as the summary (as "V" and the JSON)
+def encode(value):
+    if isinstance(value, go.Figure):
+        return b"F" + value.to_json().encode("utf-8")
+    return b"V" + json.dumps(value).encode("utf-8")
+
+
+def decode(body):
+    if body[:1] == b"F":
+        return pio.from_json(body[1:].decode("utf-8"), skip_invalid=True)
+    return json.loads(body[1:])
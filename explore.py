@@ -0,0 +1,188 @@
+# Ad-hoc queries of the Explore tab, run against the SQLite copy of the data store
+#
+# There are two kinds of query:
+#   filter / group-by   a dataset of DATASETS, labels to keep for some of its label columns,
+#                       a year range, the columns to group by and how to add the measure up,
+#                       turned into one SELECT with parameters (see build_sql)
+#   sql                 a SELECT statement typed by the user
+# Both run on the read-only database of sql_store.py, with an authorizer that only allows
+# reading (no ATTACH, PRAGMA or writes). A query is stopped after QUERY_TIMEOUT seconds and
+# returns at most MAX_ROWS rows. Results are cached by database and statement (see
+# RESULT_CACHE_SIZE), so the same question asked again, by anyone, is answered at once.
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+import plotly.express as px
+
+import sql_store
+from data_store import FILES, get_data_dir
+
+QUERY_TIMEOUT = 10
+MAX_ROWS = 10000
+RESULT_CACHE_SIZE = 64
+# Number of SQLite steps between two checks of the timeout
+PROGRESS_STEPS = 10000
+
+# Datasets of the filter / group-by queries:
+#   title      name shown in the Explore tab
+#   table      table of the database the rows come from
+#   labels     label columns, which can be filtered and grouped by
+#   year       year column
+#   measure    value column
+#   values     table the labels to pick from are read from (smaller than table)
+DATASETS = {
+    "employment": {
+        "title": "Employment by sex, age and occupation", "table": "employment_long", "values": "employment",
+        "labels": ["Sex", "Age Group", "Occupation"], "year": "Year", "measure": "Employment"},
+    "industry_occupation": {
+        "title": "Employment by industry and occupation", "table": "industry_occupation",
+        "labels": ["industry", "occupation"], "year": "year", "measure": "employment"},
+    "salary": {
+        "title": "Gross monthly income", "table": "salary",
+        "labels": ["gender", "occupation"], "year": "year", "measure": "value"},
+    "unemployment_age": {
+        "title": "Unemployment rate by age", "table": "unemployment_age",
+        "labels": ["Age Group"], "year": "Year", "measure": "Unemployment"},
+    "unemployment_sex": {
+        "title": "Unemployment rate by sex", "table": "unemployment_sex",
+        "labels": ["Sex", "Category"], "year": "Year", "measure": "Unemployment"},
+    "unemployment_qual": {
+        "title": "Unemployment rate by qualification", "table": "unemployment_qual",
+        "labels": ["Highest Qualification"], "year": "Year", "measure": "Unemployment"},
+}
+AGGREGATES = {"sum": "SUM", "mean": "AVG", "min": "MIN", "max": "MAX", "count": "COUNT"}
+
+# What a query may do: read tables and call functions
+ALLOWED = {sqlite3.SQLITE_SELECT, sqlite3.SQLITE_READ, sqlite3.SQLITE_FUNCTION, sqlite3.SQLITE_RECURSIVE}
+
+
+# Database of a data store: the attached one (SG_SQL_STORE=1), else the one already built
+# for the data folder (python sql_store.py), or None
+def find_database(data):
+    if "database" in data:
+        return data["database"]
+    path = sql_store.database_path(get_data_dir(), FILES)
+    return path if os.path.exists(path) else None
+
+
+# SELECT statement and parameters of a filter / group-by query:
+#   dataset     a key of DATASETS
+#   where       {label column: labels to keep}, a column without labels is not filtered
+#   years       (first year, last year)
+#   group_by    label or year columns
+#   aggregate   a key of AGGREGATES
+def build_sql(query):
+    dataset = DATASETS[query["dataset"]]
+    quote = sql_store.quote
+    clauses, params = [f"{quote(dataset['year'])} BETWEEN ? AND ?"], list(query["years"])
+    for column, labels in query["where"].items():
+        if labels:
+            clauses.append(f"{quote(column)} IN ({', '.join('?' * len(labels))})")
+            params.extend(labels)
+    groups = ", ".join(quote(column) for column in query["group_by"])
+    measure = f"{AGGREGATES[query['aggregate']]}({quote(dataset['measure'])}) AS {quote(dataset['measure'])}"
+    sql = f"SELECT {groups + ', ' if groups else ''}{measure} FROM {quote(dataset['table'])} WHERE {' AND '.join(clauses)}"
+    if groups:
+        sql += f" GROUP BY {groups} ORDER BY {groups}"
+    return sql, params
+
+
+def authorize(action, *args):
+    return sqlite3.SQLITE_OK if action in ALLOWED else sqlite3.SQLITE_DENY
+
+
+# Run a statement on the read-only connection of this thread, with the authorizer and the
+# timeout: (rows, whether rows were left out)
+def execute(database, sql, params):
+    con = sql_store.connect(database)
+    deadline = time.monotonic() + QUERY_TIMEOUT
+    con.set_authorizer(authorize)
+    con.set_progress_handler(lambda: time.monotonic() > deadline, PROGRESS_STEPS)
+    try:
+        cursor = con.execute(sql.strip().rstrip(";"), params)
+        if cursor.description is None:
+            raise ValueError("Only SELECT statements can be run here")
+        rows = cursor.fetchmany(MAX_ROWS + 1)
+        columns = [d[0] for d in cursor.description]
+    except sqlite3.OperationalError as e:
+        if time.monotonic() > deadline:
+            raise ValueError(f"The query was stopped after {QUERY_TIMEOUT} s: add filters or group it further")
+        raise ValueError(f"The query failed: {e}")
+    except (sqlite3.DatabaseError, sqlite3.Warning) as e:
+        raise ValueError(f"The query failed: {e}")
+    finally:
+        con.set_progress_handler(None, 0)
+        con.set_authorizer(None)
+    return pd.DataFrame.from_records(rows[:MAX_ROWS], columns=columns), len(rows) > MAX_ROWS
+
+
+# Cached results: (database, statement, parameters) -> result
+results = OrderedDict()
+results_lock = threading.Lock()
+
+
+# Result of a statement: {"rows", "truncated", "seconds", "cached"}. Raises a ValueError
+# with a message for the user when the query fails or takes too long.
+def run(database, sql, params=()):
+    key = (database, sql, tuple(params))
+    with results_lock:
+        hit = results.get(key)
+        if hit is not None:
+            results.move_to_end(key)
+            return dict(hit, cached=True)
+
+    start = time.perf_counter()
+    rows, truncated = execute(database, sql, list(params))
+    result = {"rows": rows, "truncated": truncated, "seconds": time.perf_counter() - start, "cached": False}
+    with results_lock:
+        results[key] = result
+        while len(results) > RESULT_CACHE_SIZE:
+            results.popitem(last=False)
+    return result
+
+
+# Labels of a label column of a dataset, to pick the filters from
+def labels(database, dataset, column):
+    table = DATASETS[dataset].get("values", DATASETS[dataset]["table"])
+    quote = sql_store.quote
+    rows = run(database, f"SELECT DISTINCT {quote(column)} FROM {quote(table)} ORDER BY {quote(column)}")["rows"]
+    return rows.iloc[:, 0].dropna().tolist()
+
+
+def years(database, dataset):
+    column = sql_store.quote(DATASETS[dataset]["year"])
+    rows = run(database, f"SELECT DISTINCT {column} FROM {sql_store.quote(DATASETS[dataset]['table'])} ORDER BY {column}")["rows"]
+    return [int(year) for year in rows.iloc[:, 0].dropna()]
+
+
+# Chart of a result, or None when it has nothing to draw. A filter / group-by query is drawn
+# over its first group column (a line over the years, bars otherwise) with a colour for the
+# second one. A SQL result is drawn the same way from its columns: the first number column
+# is the value, a "year" column or else the first text column is the x axis.
+def figure(rows, query=None):
+    if rows.empty:
+        return None
+    if query is not None:
+        dataset = DATASETS[query["dataset"]]
+        x_options = [dataset["year"]] if dataset["year"] in query["group_by"] else []
+        x_options += [column for column in query["group_by"] if column != dataset["year"]]
+        value = dataset["measure"]
+    else:
+        numbers = [column for column in rows.columns if pd.api.types.is_numeric_dtype(rows[column])]
+        years_first = [column for column in numbers if column.lower() == "year"]
+        texts = [column for column in rows.columns if column not in numbers]
+        values = [column for column in numbers if column not in years_first]
+        if not values:
+            return None
+        x_options, value = years_first + texts, values[0]
+    if not x_options:
+        return px.bar(rows, y=value)
+    x = x_options[0]
+    color = x_options[1] if len(x_options) > 1 else None
+    if x.lower() == "year":
+        return px.line(rows.sort_values(x, kind="stable"), x=x, y=value, color=color, markers=True)
+    return px.bar(rows, x=x, y=value, color=color, barmode="group")
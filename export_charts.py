@@ -0,0 +1,168 @@
+# Export every chart of the dashboards to files (PNG / SVG / HTML)
+#
+# Usage: python export_charts.py --out report_pack --formats png svg html [--data-dir synthetic/x100]
+#
+# Every chart builder in charts.py is called for every filter preset, and every slide of
+# static_dashboard_update.py is run headlessly. The figures are built and written by a
+# process pool. Each worker loads the data once and keeps one Kaleido (Chromium) renderer
+# alive for all the figures it writes, instead of starting a browser per image.
+# A timing report is saved next to the files.
+#
+# PNG and SVG need Kaleido, which is not in requirements.txt because the dashboards don't
+# use it: pip install "kaleido>=1.1", and kaleido_get_chrome if Chrome is not installed.
+# HTML needs nothing more.
+import argparse
+import csv
+import importlib.util
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import plotly.graph_objects as go
+from plotly.offline import get_plotlyjs
+
+import charts
+from app_capture import capture_run, iter_figures
+from data_store import load_data
+
+YEAR_RANGES = [(2000, 2024), (2000, 2012), (2012, 2024), (2019, 2024)]
+GENDERS = [["All"], ["Male"], ["Female"]]
+AGE_GROUPS = [["All Ages"], ["15-19 Years Old", "20-24 Years Old"], ["25-29 Years Old"]]
+OCCUPATIONS = [["All Occupations"], ["Professionals", "Associate Professionals & Technicians"]]
+
+
+# Build the list of filter presets for the interactive dashboard
+def dashboard_presets(data):
+    presets = []
+    for year_min, year_max in YEAR_RANGES:
+        for gender in GENDERS:
+            for age in AGE_GROUPS:
+                for jobs in OCCUPATIONS:
+                    name = f"{year_min}-{year_max}_{'+'.join(gender)}_{'+'.join(age)}_{'+'.join(jobs)}"
+                    filters = dict(charts.default_filters(data), year_min=year_min, year_max=year_max,
+                                   gender=gender, age=age, jobs=jobs)
+                    presets.append((slugify(name), filters))
+    return presets
+
+
+# Every slide of the presentation is a preset of its own
+def slide_presets(n_slides=8):
+    return [(f"slide_{i}", {"idx": i}) for i in range(n_slides)]
+
+
+def slugify(text):
+    return re.sub(r"[^A-Za-z0-9+_-]+", "-", text).strip("-").lower()
+
+
+# Data store of this worker process, loaded once by start_worker
+worker_data = None
+
+
+# Load the data and start one renderer per worker process, and keep them for the whole run
+def start_worker(formats):
+    global worker_data
+    worker_data = load_data()
+    if "png" in formats or "svg" in formats:
+        import kaleido
+        kaleido.start_sync_server(silence_warnings=True)
+
+
+# Build one chart for one preset and write it, returning the build and write times
+def export_builder(builder_name, filters, base_path, formats, plotlyjs_path):
+    start = time.perf_counter()
+    fig = getattr(charts, builder_name)(worker_data, filters)
+    build_time = time.perf_counter() - start
+    if fig is None:
+        return base_path, build_time, 0.0
+    _, write_time = write_figure(fig, base_path, formats, plotlyjs_path)
+    return base_path, build_time, write_time
+
+
+# Write one figure in every requested format and return how long it took
+def write_figure(fig, base_path, formats, plotlyjs_path):
+    start = time.perf_counter()
+    if not isinstance(fig, go.Figure):
+        fig = go.Figure(fig)
+    for fmt in formats:
+        path = f"{base_path}.{fmt}"
+        if fmt == "html":
+            # Point every HTML file at the one shared plotly.min.js
+            src = os.path.relpath(plotlyjs_path, os.path.dirname(path)).replace(os.sep, "/")
+            fig.write_html(path, include_plotlyjs=src, full_html=True)
+        else:
+            fig.write_image(path, format=fmt, width=1200, height=fig.layout.height or 600)
+    return base_path, time.perf_counter() - start
+
+
+# Write a figure captured from a headless run (nothing to build)
+def export_builder_spec(spec, base_path, formats, plotlyjs_path):
+    _, write_time = write_figure(spec, base_path, formats, plotlyjs_path)
+    return base_path, 0.0, write_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export all dashboard figures")
+    parser.add_argument("--out", default="report_pack", help="output folder")
+    parser.add_argument("--formats", nargs="+", default=["png"], choices=["png", "svg", "html"])
+    parser.add_argument("--data-dir", default=None, help="read the CSV files from this folder (e.g. synthetic/x100)")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    args = parser.parse_args()
+    if ("png" in args.formats or "svg" in args.formats) and importlib.util.find_spec("kaleido") is None:
+        parser.error('PNG and SVG export needs Kaleido: pip install "kaleido>=1.1" (and run kaleido_get_chrome '
+                     'if Chrome is not installed), or use --formats html')
+
+    # The dashboards and the worker processes read the data folder from the environment
+    if args.data_dir:
+        os.environ["SG_DATA_DIR"] = os.path.abspath(args.data_dir)
+
+    start = time.perf_counter()
+    os.makedirs(args.out, exist_ok=True)
+    plotlyjs_path = os.path.join(args.out, "plotly.min.js")
+    if "html" in args.formats:
+        with open(plotlyjs_path, "w", encoding="utf-8") as f:
+            f.write(get_plotlyjs())
+
+    timings = []
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=start_worker, initargs=(args.formats,)) as pool:
+        # The slides put their own filter states and layouts on the chart builders, so run them headlessly first
+        slide_futures = [(name, pool.submit(capture_run, "static_dashboard_update.py", state))
+                         for name, state in slide_presets()]
+
+        # Every chart builder x every filter preset
+        futures = []
+        for name, filters in dashboard_presets(load_data()):
+            folder = os.path.join(args.out, "interactive_dashboard", name)
+            os.makedirs(folder, exist_ok=True)
+            for tab, builders in charts.CHARTS.items():
+                for builder in builders:
+                    base_path = os.path.join(folder, f"{slugify(tab)}_{builder.__name__}")
+                    futures.append(pool.submit(export_builder, builder.__name__, filters, base_path, args.formats, plotlyjs_path))
+
+        for name, future in slide_futures:
+            folder = os.path.join(args.out, "static_dashboard_update", name)
+            os.makedirs(folder, exist_ok=True)
+            for i, (path, spec) in enumerate(iter_figures(future.result()), start=1):
+                base_path = os.path.join(folder, f"{i:02d}_{slugify('_'.join(path)) or 'main'}")
+                futures.append(pool.submit(export_builder_spec, spec, base_path, args.formats, plotlyjs_path))
+
+        for future in futures:
+            timings.append(future.result())
+
+    # Save the per-figure timing report
+    with open(os.path.join(args.out, "timings.csv"), "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["figure", "build_seconds", "write_seconds"])
+        for base_path, build_time, write_time in timings:
+            writer.writerow([os.path.relpath(base_path, args.out), f"{build_time:.4f}", f"{write_time:.4f}"])
+
+    total = time.perf_counter() - start
+    slowest = sorted(timings, key=lambda t: t[1] + t[2], reverse=True)[:5]
+    print(f"Wrote {len(timings)} figures as {', '.join(args.formats)} in {total:.1f}s")
+    print("Slowest figures (build + write):")
+    for base_path, build_time, write_time in slowest:
+        print(f"  {build_time:6.2f}s + {write_time:6.2f}s  {os.path.relpath(base_path, args.out)}")
+
+
+if __name__ == "__main__":
+    main()
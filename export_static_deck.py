@@ -0,0 +1,222 @@
+# Export every slide of static_dashboard_update.py to a static HTML bundle
+#
+# Usage: python export_static_deck.py --out deck
+#
+# The bundle is one index.html with every slide and tab, plus one shared plotly.min.js.
+# Figures are stored once in a JSON block and looked up by hash, so charts that appear
+# on several slides are only shipped once.
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from plotly.offline import get_plotlyjs
+
+from app_capture import capture_page, capture_run, run_app
+
+SCRIPT = "static_dashboard_update.py"
+
+
+# Get the slide names from the sidebar radio buttons
+def get_slide_names():
+    at = run_app(SCRIPT, session_state={"idx": 0})
+    return list(at.radio[0].options), capture_page(at)
+
+
+# Very small markdown converter for the text used in the slides
+def markdown_to_html(text):
+    lines = [line.strip() for line in text.strip().splitlines()]
+    out = []
+    in_list = False
+    for line in lines:
+        inline = html.escape(line)
+        inline = re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", inline)
+        is_bullet = line.startswith("* ") or line.startswith("- ")
+        if in_list and not is_bullet:
+            out.append("</ul>")
+            in_list = False
+        if is_bullet:
+            if not in_list:
+                out.append("<ul>")
+                in_list = True
+            out.append(f"<li>{inline[2:]}</li>")
+        elif line == "---":
+            out.append("<hr>")
+        elif line.startswith("#"):
+            level = min(len(line) - len(line.lstrip("#")), 6)
+            out.append(f"<h{level}>{inline[level:].strip()}</h{level}>")
+        elif line.startswith(">"):
+            out.append(f"<blockquote>{inline[4:].strip()}</blockquote>")
+        elif line:
+            out.append(f"<p>{inline}</p>")
+    if in_list:
+        out.append("</ul>")
+    return "\n".join(out)
+
+
+# Turn the captured nodes into HTML, storing each figure once in `figures`
+def render_nodes(nodes, figures, prefix):
+    parts = []
+    for i, node in enumerate(nodes):
+        node_id = f"{prefix}-{i}"
+        kind = node["type"]
+        if kind == "title":
+            parts.append(f"<h1>{html.escape(node['text'])}</h1>")
+        elif kind == "header":
+            parts.append(f"<h2>{html.escape(node['text'])}</h2>")
+        elif kind == "subheader":
+            parts.append(f"<h3>{html.escape(node['text'])}</h3>")
+        elif kind == "divider":
+            parts.append("<hr>")
+        elif kind == "caption":
+            parts.append(f"<p class='caption'>{html.escape(node['text'])}</p>")
+        elif kind in ["info", "warning", "success", "error"]:
+            parts.append(f"<div class='alert {kind}'>{markdown_to_html(node['text'])}</div>")
+        elif kind == "markdown":
+            parts.append(markdown_to_html(node["text"]))
+        elif kind == "metric":
+            delta = f"<div class='delta'>{html.escape(node['delta'])}</div>" if node["delta"] else ""
+            parts.append(f"<div class='metric'><div class='label'>{html.escape(node['label'])}</div>"
+                         f"<div class='value'>{html.escape(node['value'])}</div>{delta}</div>")
+        elif kind == "plotly":
+            # Same spec -> same hash -> stored once
+            key = hashlib.sha1(node["spec"].encode("utf-8")).hexdigest()[:16]
+            figures[key] = node["spec"]
+            parts.append(f"<div class='chart' data-fig='{key}'></div>")
+        elif kind == "columns":
+            cols = [f"<div class='col'>{render_nodes(col, figures, f'{node_id}-{j}')}</div>"
+                    for j, col in enumerate(node["columns"])]
+            parts.append(f"<div class='row'>{''.join(cols)}</div>")
+        elif kind == "tabs":
+            buttons = []
+            panels = []
+            for j, (label, children) in enumerate(node["tabs"]):
+                active = " active" if j == 0 else ""
+                buttons.append(f"<button class='tab-btn{active}' data-tab='{node_id}-{j}'>{html.escape(label)}</button>")
+                panels.append(f"<div class='tab-panel{active}' id='{node_id}-{j}'>"
+                              f"{render_nodes(children, figures, f'{node_id}-{j}')}</div>")
+            parts.append(f"<div class='tabs'><div class='tab-bar'>{''.join(buttons)}</div>{''.join(panels)}</div>")
+        elif "children" in node:
+            parts.append(render_nodes(node["children"], figures, node_id))
+    return "\n".join(parts)
+
+
+PAGE_STYLE = """
+body { font-family: "Source Sans Pro", sans-serif; margin: 0; display: flex; color: #31333F; }
+nav { width: 240px; min-height: 100vh; background: #f0f2f6; padding: 16px; box-sizing: border-box; }
+nav a { display: block; padding: 6px 8px; color: #31333F; text-decoration: none; border-radius: 4px; }
+nav a.active { background: #dfe3eb; font-weight: bold; }
+main { flex: 1; padding: 24px 48px; min-width: 0; }
+.slide { display: none; } .slide.active { display: block; }
+.row { display: flex; gap: 24px; } .col { flex: 1; min-width: 0; }
+.tab-bar { border-bottom: 1px solid #ddd; margin-bottom: 12px; }
+.tab-btn { background: none; border: none; padding: 8px 12px; cursor: pointer; font-size: 15px; }
+.tab-btn.active { border-bottom: 2px solid #ff4b4b; color: #ff4b4b; }
+.tab-panel { display: none; } .tab-panel.active { display: block; }
+.caption { color: #808495; font-size: 14px; }
+.alert { padding: 12px 16px; border-radius: 6px; margin: 8px 0; }
+.alert.info { background: #e6f0ff; } .alert.warning { background: #fffbe6; }
+.alert.success { background: #e8f9ee; } .alert.error { background: #ffecec; }
+.metric .label { font-size: 14px; } .metric .value { font-size: 32px; } .metric .delta { color: #09ab3b; }
+.chart { width: 100%; min-height: 450px; }
+"""
+
+# Charts are drawn the first time they become visible, so hidden tabs cost nothing on load
+PAGE_SCRIPT = """
+const FIGURES = JSON.parse(document.getElementById("figures").textContent);
+function drawVisible(root) {
+  root.querySelectorAll(".chart").forEach(function (el) {
+    if (el.dataset.drawn || el.offsetParent === null) return;
+    const fig = JSON.parse(FIGURES[el.dataset.fig]);
+    Plotly.newPlot(el, fig.data, fig.layout, {responsive: true, displaylogo: false});
+    el.dataset.drawn = "1";
+  });
+}
+function showSlide(id) {
+  document.querySelectorAll(".slide, nav a").forEach(el => el.classList.remove("active"));
+  document.getElementById(id).classList.add("active");
+  document.querySelector("nav a[href='#" + id + "']").classList.add("active");
+  drawVisible(document.getElementById(id));
+}
+document.querySelectorAll(".tab-btn").forEach(function (btn) {
+  btn.addEventListener("click", function () {
+    const bar = btn.parentElement;
+    bar.querySelectorAll(".tab-btn").forEach(b => b.classList.remove("active"));
+    bar.parentElement.querySelectorAll(":scope > .tab-panel").forEach(p => p.classList.remove("active"));
+    btn.classList.add("active");
+    const panel = document.getElementById(btn.dataset.tab);
+    panel.classList.add("active");
+    drawVisible(panel);
+  });
+});
+window.addEventListener("hashchange", () => showSlide(location.hash.slice(1)));
+showSlide(location.hash ? location.hash.slice(1) : "slide-0");
+"""
+
+
+# Put all the slides together into one page
+def build_page(slide_names, slides):
+    figures = {}
+    nav = []
+    sections = []
+    for index, name in enumerate(slide_names):
+        slide_id = f"slide-{index}"
+        nav.append(f"<a href='#{slide_id}'>{html.escape(name)}</a>")
+        sections.append(f"<section class='slide' id='{slide_id}'>{render_nodes(slides[index], figures, slide_id)}</section>")
+
+    # Escape "</" so figure text can never close the script tag early
+    figures_json = json.dumps(figures).replace("</", "<\\/")
+    page = f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Singapore Employment Trends</title>
+<style>{PAGE_STYLE}</style>
+<script src="plotly.min.js"></script>
+</head>
+<body>
+<nav><h3>Presentation Slides</h3>{''.join(nav)}</nav>
+<main>{''.join(sections)}</main>
+<script type="application/json" id="figures">{figures_json}</script>
+<script>{PAGE_SCRIPT}</script>
+</body>
+</html>
+"""
+    return page, len(figures)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the slide deck to static HTML")
+    parser.add_argument("--out", default="deck", help="output folder")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    slide_names, first_slide = get_slide_names()
+    slides = {0: first_slide}
+
+    # Render the remaining slides in parallel, one process per slide
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {}
+        for index in range(1, len(slide_names)):
+            futures[index] = pool.submit(capture_run, SCRIPT, {"idx": index})
+        for index, future in futures.items():
+            slides[index] = future.result()
+
+    page, n_figures = build_page(slide_names, slides)
+    os.makedirs(args.out, exist_ok=True)
+    with open(os.path.join(args.out, "index.html"), "w", encoding="utf-8") as f:
+        f.write(page)
+    with open(os.path.join(args.out, "plotly.min.js"), "w", encoding="utf-8") as f:
+        f.write(get_plotlyjs())
+
+    print(f"Exported {len(slide_names)} slides with {n_figures} unique figures to {args.out}/ "
+          f"in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+# Batched trend forecasts for every employment series
+#
+# Every employment series (one per Sex x Age Group x Occupation row) is fitted at once, as
+# NumPy operations on a (series x years) matrix, and projected to HORIZON_YEAR with 95%
+# prediction intervals. Only the employment series are projected: series_matrix also gives
+# the industry x occupation cells (rows with the same labels in a year are added up), which
+# chart_specs, anomalies and similarity work on.
+#
+# Models:
+#   linear       least squares line
+#   log_linear   least squares line on the log of the series (a constant growth rate)
+#   damped_holt  Holt's linear trend with a damped trend. The smoothing parameters of each
+#                series are picked from a small grid by the one-step-ahead squared error.
+# Missing values (NaN) are left out of the fits, and a series needs MIN_POINTS values.
+# Intervals assume normal errors (log-linear ones on the log scale). The charts add series
+# together with forecast_total, which treats their errors as independent.
+#
+# Fits are kept per dataset, model and year window (see get_fit), so the dashboard only
+# fits again when one of those changes.
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+HORIZON_YEAR = 2030
+MODELS = {"damped_holt": "Damped Holt trend", "linear": "Linear trend", "log_linear": "Log-linear (constant growth)"}
+DEFAULT_MODEL = "damped_holt"
+MIN_POINTS = 3
+Z_95 = 1.959964
+
+# Grid of damped Holt parameters tried for every series: level (alpha), trend (beta), damping (phi)
+HOLT_ALPHA = [0.2, 0.4, 0.6, 0.8, 1.0]
+HOLT_BETA = [0.05, 0.1, 0.2, 0.4]
+HOLT_PHI = [0.8, 0.9, 0.98]
+
+CACHE_SIZE = 64
+
+
+# Series of a dataset as (index of the series, years, values matrix)
+def series_matrix(data, name):
+    if name == "employment":
+        df = data["employment"]
+        years = np.array(data["year_list"])
+        values = df[[str(year) for year in years]].to_numpy(dtype="float64")
+        return pd.MultiIndex.from_frame(df[["Sex", "Age Group", "Occupation"]]), years, values
+    if name == "industry_occupation":
+        cube = data["industry_occupation"].pivot_table(
+            index=["industry", "occupation"], columns="year", values="employment", aggfunc="sum")
+        return cube.index, cube.columns.to_numpy(), cube.to_numpy(dtype="float64")
+    raise ValueError(f"No series for dataset {name}")
+
+
+# Least squares line of every row through the observed values (mask)
+def fit_lines(x, y, mask):
+    w = mask.astype("float64")
+    y = np.where(mask, y, 0.0)
+    n = w.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        x_mean = (w * x).sum(axis=1) / n
+        y_mean = (w * y).sum(axis=1) / n
+        dx = (x - x_mean[:, None]) * w
+        sxx = (dx * dx).sum(axis=1)
+        slope = (dx * (y - y_mean[:, None])).sum(axis=1) / sxx
+        intercept = y_mean - slope * x_mean
+        residuals = (y - intercept[:, None] - slope[:, None] * x) * w
+        sigma = np.sqrt((residuals ** 2).sum(axis=1) / (n - 2))
+    return {"n": n, "x_mean": x_mean, "sxx": sxx, "slope": slope, "intercept": intercept, "sigma": sigma}
+
+
+def predict_lines(fit, future):
+    mean = fit["intercept"][:, None] + fit["slope"][:, None] * future
+    with np.errstate(invalid="ignore", divide="ignore"):
+        se = fit["sigma"][:, None] * np.sqrt(
+            1 + 1 / fit["n"][:, None] + (future - fit["x_mean"][:, None]) ** 2 / fit["sxx"][:, None])
+    return mean, mean - Z_95 * se, mean + Z_95 * se
+
+
+# Damped Holt for every row and every parameter set of the grid at once: the state arrays
+# are (parameter sets x series), and the loop only runs over the years
+def fit_holt(y, mask):
+    alpha, beta, phi = (a.ravel()[:, None] for a in np.meshgrid(HOLT_ALPHA, HOLT_BETA, HOLT_PHI, indexing="ij"))
+
+    # Fill the years before the first value with that value, so every series starts flat
+    first = mask.argmax(axis=1)
+    filled = np.where(mask, y, np.nan)
+    start = filled[np.arange(len(y)), first]
+    filled = np.where(np.arange(y.shape[1]) < first[:, None], start[:, None], filled)
+
+    level = np.broadcast_to(start, (len(alpha), len(y))).copy()
+    trend = np.zeros_like(level)
+    sse = np.zeros_like(level)
+    for t in range(1, y.shape[1]):
+        forecast = level + phi * trend
+        error = np.where(mask[:, t], filled[:, t] - forecast, 0.0)
+        level = forecast + alpha * error
+        trend = phi * trend + alpha * beta * error
+        sse += error ** 2
+
+    # Keep the parameter set with the smallest error for every series
+    best = sse.argmin(axis=0)
+    rows = np.arange(len(y))
+    n = mask.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sigma = np.sqrt(sse[best, rows] / (n - 3).clip(min=1))
+    return {
+        "n": n, "level": level[best, rows], "trend": trend[best, rows], "sigma": sigma,
+        "alpha": alpha[best, 0], "beta": beta[best, 0], "phi": phi[best, 0]}
+
+
+def predict_holt(fit, steps):
+    h = np.arange(1, steps + 1)
+    phi = fit["phi"][:, None]
+    # Sum of phi^1 .. phi^h for every step h
+    damped = np.cumsum(phi ** h, axis=1)
+    mean = fit["level"][:, None] + damped * fit["trend"][:, None]
+    # Variance of the h-step error: sigma^2 * (1 + sum over j < h of (alpha * (1 + beta * damped_j))^2)
+    c = fit["alpha"][:, None] * (1 + fit["beta"][:, None] * damped)
+    spread = np.concatenate([np.zeros((len(mean), 1)), np.cumsum(c[:, :-1] ** 2, axis=1)], axis=1)
+    se = fit["sigma"][:, None] * np.sqrt(1 + spread)
+    return mean, mean - Z_95 * se, mean + Z_95 * se
+
+
+# Fit one model to every series over the years year_min..year_max, and project each series
+# from the year after year_max to HORIZON_YEAR
+def fit_all(index, years, values, model, year_min, year_max):
+    window = (years >= year_min) & (years <= year_max)
+    x = years[window].astype("float64")
+    y = values[:, window]
+    mask = np.isfinite(y)
+    future = np.arange(year_max + 1, max(HORIZON_YEAR, year_max) + 1)
+
+    if model == "linear":
+        fit = fit_lines(x, y, mask)
+        mean, lower, upper = predict_lines(fit, future.astype("float64"))
+    elif model == "log_linear":
+        mask &= y > 0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            fit = fit_lines(x, np.log(y), mask)
+        mean, lower, upper = (np.exp(a) for a in predict_lines(fit, future.astype("float64")))
+    elif model == "damped_holt":
+        fit = fit_holt(y, mask)
+        mean, lower, upper = predict_holt(fit, len(future))
+    else:
+        raise ValueError(f"Unknown forecast model {model}")
+
+    # Not enough values to fit: no forecast
+    too_short = mask.sum(axis=1) < MIN_POINTS
+    for a in (mean, lower, upper):
+        a[too_short] = np.nan
+    return {"index": index, "model": model, "params": fit, "years": future, "mean": mean, "lower": lower, "upper": upper}
+
+
+# Cached fits: key -> (source DataFrame, fit). The DataFrame is kept to make sure the fit
+# belongs to the data store it is asked for. Charts are also built on background threads
+# (precompute.py), hence the lock.
+fits = OrderedDict()
+fits_lock = threading.Lock()
+
+
+def get_fit(data, name, model, year_min, year_max):
+    key = (name, model, year_min, year_max)
+    source = data[name]
+    with fits_lock:
+        cached = fits.get(key)
+        if cached is not None and cached[0] is source:
+            fits.move_to_end(key)
+            return cached[1]
+
+    index, years, values = series_matrix(data, name)
+    fit = fit_all(index, years, values, model, year_min, year_max)
+    with fits_lock:
+        fits[key] = (source, fit)
+        while len(fits) > CACHE_SIZE:
+            fits.popitem(last=False)
+    return fit
+
+
+# Forecast of the sum of some series (rows: positions in the fitted matrix), with the
+# interval of the sum when the series errors are independent. The errors are added up on
+# the scale the model was fitted on: linear and damped Holt errors are normal, so their
+# variances add; log-linear ones are lognormal, and their sum is taken as the lognormal
+# with the same mean and variance (Fenton-Wilkinson), which keeps the bounds of a single
+# series as they are. Employment can't be negative, so the results are clipped at 0.
+def forecast_total(fit, rows):
+    mean, lower, upper = fit["mean"][rows], fit["lower"][rows], fit["upper"][rows]
+    total = np.nansum(mean, axis=0)
+    if fit["model"] == "log_linear":
+        mu = np.log(mean)
+        s2 = (np.log(upper / lower) / (2 * Z_95)) ** 2
+        m = np.nansum(np.exp(mu + s2 / 2), axis=0)
+        v = np.nansum((np.exp(s2) - 1) * np.exp(2 * mu + s2), axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            sum_s2 = np.log1p(v / m ** 2)
+            sum_mu = np.log(m) - sum_s2 / 2
+        low, high = np.exp(sum_mu - Z_95 * np.sqrt(sum_s2)), np.exp(sum_mu + Z_95 * np.sqrt(sum_s2))
+    else:
+        se = (upper - lower) / (2 * Z_95)
+        spread = Z_95 * np.sqrt(np.nansum(se ** 2, axis=0))
+        low, high = total - spread, total + spread
+    return pd.DataFrame({
+        "year": fit["years"], "forecast": total.clip(min=0), "lower": low.clip(min=0), "upper": high.clip(min=0)})
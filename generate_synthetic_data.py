@@ -0,0 +1,236 @@
+# Generate bigger synthetic copies of the datasets for load and scaling tests
+#
+# Usage: python generate_synthetic_data.py --scale 10 100 1000 [--extra-years 10] [--out synthetic]
+#
+# Each scale writes a folder (synthetic/x10, synthetic/x100, ...) with the same file names
+# and columns as the real CSVs, so any loader can read it by setting SG_DATA_DIR to that
+# folder (see data_store.py). The rows are made from the real data:
+#   - every occupation / industry / unemployment category is split into sub-groups whose
+#     shares drift slowly over the years, so each sub-series looks like a real series
+#   - the "All ..." total rows are recomputed from the sub-groups, so totals still add up
+#   - --extra-years adds earlier years by extending each series' early trend with noise
+# The real data has no region column, so the extra cardinality goes into occupations,
+# industries, categories and years.
+import argparse
+import math
+import os
+
+import numpy as np
+import pandas as pd
+
+import rollups
+from data_store import ROOT_DIR
+
+AGE_TOTAL = "All Ages"
+SEX_TOTAL = "All"
+OCC_TOTAL = "All Occupations"
+IO_OCC_TOTAL = rollups.OCCUPATION_TOTAL
+IO_ALL_INDUSTRIES = rollups.INDUSTRY_TOTAL
+IO_SERVICES = rollups.SERVICES
+
+
+# Name of the i-th sub-group of a category. The first sub-group keeps the original name,
+# so the filter presets and hard-coded category names of the dashboards still match rows.
+def sub_name(name, i, k):
+    return name if i == 0 else f"{name} (Group {i + 1:03d})"
+
+
+# Shares of k sub-groups for each parent series and year, drifting like a random walk.
+# Returns an array of shape (n_parent, k, n_years) that sums to 1 over the sub-groups.
+def drifting_shares(rng, n_parent, k, n_years, drift=0.04):
+    base = np.log(rng.dirichlet(np.full(k, 2.0), size=n_parent))[:, :, None]
+    walk = np.cumsum(rng.normal(0, drift, size=(n_parent, k, n_years)), axis=2)
+    shares = np.exp(base + walk)
+    return shares / shares.sum(axis=1, keepdims=True)
+
+
+# Add earlier years to a (n_series, n_years) matrix by extending the early growth rate
+def extend_years(rng, values, years, extra_years, noise=0.02):
+    if extra_years == 0:
+        return values, years
+    first = np.nan_to_num(values[:, 0])
+    early = np.nan_to_num(values[:, min(5, values.shape[1] - 1)])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        growth = np.where(first > 0, (early / first) ** (1 / 5), 1.0)
+    growth = np.clip(np.nan_to_num(growth, nan=1.0), 0.9, 1.1)
+
+    steps = np.arange(extra_years, 0, -1)
+    shocks = np.exp(np.cumsum(rng.normal(0, noise, size=(values.shape[0], extra_years))[:, ::-1], axis=1)[:, ::-1])
+    earlier = first[:, None] / growth[:, None] ** steps[None, :] * shocks
+    new_years = list(range(years[0] - extra_years, years[0])) + list(years)
+    return np.concatenate([earlier, values], axis=1), new_years
+
+
+# clean_data_combined.csv: split occupations, then rebuild every total row from the leaves
+def scale_employment(rng, df, k, extra_years):
+    year_cols = sorted([c for c in df.columns if c.isdigit()], key=int)
+    for c in year_cols:
+        df[c] = pd.to_numeric(df[c], errors="coerce")
+    years = [int(c) for c in year_cols]
+
+    sexes = ["Female", "Male"]
+    ages = [a for a in df["Age Group"].unique() if a != AGE_TOTAL]
+    occupations = [o for o in df["Occupation"].unique() if o != OCC_TOTAL]
+
+    # Leaf cube: (sex, age, occupation, year)
+    leaves = df.set_index(["Sex", "Age Group", "Occupation"])[year_cols]
+    index = pd.MultiIndex.from_product([sexes, ages, occupations])
+    cube = leaves.reindex(index).fillna(0).to_numpy().reshape(len(sexes), len(ages), len(occupations), len(years))
+
+    # Split each occupation into k sub-occupations
+    n_series = len(sexes) * len(ages) * len(occupations)
+    shares = drifting_shares(rng, n_series, k, len(years)).reshape(len(sexes), len(ages), len(occupations), k, len(years))
+    cube = (cube[:, :, :, None, :] * shares).reshape(len(sexes), len(ages), len(occupations) * k, len(years))
+    sub_occupations = [sub_name(o, i, k) for o in occupations for i in range(k)]
+
+    flat, years = extend_years(rng, cube.reshape(-1, len(years)), years, extra_years)
+    cube = flat.reshape(len(sexes), len(ages), len(sub_occupations), len(years))
+
+    # Add the total rows: All sexes, All Ages and All Occupations
+    cube = np.concatenate([cube.sum(axis=0, keepdims=True), cube], axis=0)
+    cube = np.concatenate([cube.sum(axis=1, keepdims=True), cube], axis=1)
+    cube = np.concatenate([cube.sum(axis=2, keepdims=True), cube], axis=2)
+
+    index = pd.MultiIndex.from_product(
+        [[SEX_TOTAL] + sexes, [AGE_TOTAL] + ages, [OCC_TOTAL] + sub_occupations],
+        names=["Sex", "Age Group", "Occupation"])
+    out = pd.DataFrame(cube.reshape(-1, len(years)).round(1), index=index, columns=[str(y) for y in years])
+    out = out.reset_index()
+    return out[["Age Group", "Occupation"] + [str(y) for y in sorted(years, reverse=True)] + ["Sex"]]
+
+
+# Industry and Occupation.csv: split industries and occupations, then rebuild the totals
+def scale_industry_occupation(rng, df, k_industry, k_occupation, extra_years):
+    wide = df.pivot_table(index=["industry", "occupation"], columns="year", values="employment", aggfunc="sum")
+    years = sorted(wide.columns)
+    wide = wide[years]
+
+    industries = [i for i in wide.index.get_level_values(0).unique() if i not in [IO_ALL_INDUSTRIES, IO_SERVICES]]
+    occupations = [o for o in wide.index.get_level_values(1).unique() if o != IO_OCC_TOTAL]
+
+    # Leaf cube: (industry, occupation, year), missing cells stay missing
+    index = pd.MultiIndex.from_product([industries, occupations])
+    cube = wide.reindex(index).to_numpy().reshape(len(industries), len(occupations), len(years))
+    missing = np.isnan(cube)
+    cube = np.nan_to_num(cube)
+
+    # Split both dimensions
+    n_cells = len(industries) * len(occupations)
+    shares_i = drifting_shares(rng, n_cells, k_industry, len(years)).reshape(len(industries), len(occupations), k_industry, len(years))
+    shares_o = drifting_shares(rng, n_cells, k_occupation, len(years)).reshape(len(industries), len(occupations), k_occupation, len(years))
+    cube = cube[:, :, None, None, :] * shares_i[:, :, :, None, :] * shares_o[:, :, None, :, :]
+    cube = cube.transpose(0, 2, 1, 3, 4).reshape(len(industries) * k_industry, len(occupations) * k_occupation, len(years))
+    missing = np.repeat(np.repeat(missing, k_industry, axis=0), k_occupation, axis=1)
+
+    sub_industries = [sub_name(i, j, k_industry) for i in industries for j in range(k_industry)]
+    sub_occupations = [sub_name(o, j, k_occupation) for o in occupations for j in range(k_occupation)]
+    parents = [i for i in industries for _ in range(k_industry)]
+
+    flat, years = extend_years(rng, cube.reshape(-1, len(years)), years, extra_years)
+    cube = flat.reshape(len(sub_industries), len(sub_occupations), len(years))
+    missing = np.concatenate([np.repeat(missing[:, :, :1], len(years) - missing.shape[2], axis=2), missing], axis=2)
+    cube[missing] = np.nan
+
+    # Total occupation row for every industry, then the All Industries and Services rows
+    cube = np.concatenate([np.nansum(cube, axis=1, keepdims=True), cube], axis=1)
+    is_service = np.array([rollups.sector_of(p) == IO_SERVICES for p in parents])
+    all_industries = np.nansum(cube, axis=0, keepdims=True)
+    services = np.nansum(cube[is_service], axis=0, keepdims=True)
+    cube = np.concatenate([all_industries, services, cube], axis=0)
+
+    index = pd.MultiIndex.from_product(
+        [[IO_ALL_INDUSTRIES, IO_SERVICES] + sub_industries, [IO_OCC_TOTAL] + sub_occupations, years],
+        names=["industry", "occupation", "year"])
+    out = pd.DataFrame({"employment": cube.reshape(-1).round(1)}, index=index).dropna().reset_index()
+    out = out.sort_values(["year", "industry"], ascending=[False, True], kind="stable")
+    return out[["occupation", "industry", "year", "employment"]]
+
+
+# salary.csv: split occupations; each sub-occupation earns around its parent's salary
+def scale_salary(rng, df, k, extra_years):
+    wide = df.pivot_table(index=["gender", "occupation"], columns="year", values="value", aggfunc="mean")
+    years = sorted(wide.columns)
+    values = wide[years].to_numpy()
+
+    # Each sub-occupation gets its own pay level and a slowly drifting premium
+    level = rng.lognormal(0, 0.15, size=(values.shape[0], k, 1))
+    drift = np.exp(np.cumsum(rng.normal(0, 0.02, size=(values.shape[0], k, len(years))), axis=2))
+    values = (values[:, None, :] * level * drift).reshape(-1, len(years))
+    values, years = extend_years(rng, values, years, extra_years)
+
+    keys = [(g, sub_name(o, i, k)) for g, o in wide.index for i in range(k)]
+    out = pd.DataFrame(values.round(0), index=pd.MultiIndex.from_tuples(keys, names=["gender", "occupation"]), columns=years)
+    out = out.stack().rename("value").reset_index().rename(columns={"level_2": "year"})
+    out.columns = ["gender", "occupation", "year", "value"]
+    return out.sort_values(["year", "occupation"], ascending=[False, True], kind="stable")
+
+
+# Unemployment files: split the category column; rates move around the parent rate.
+# The overall "Total" row is kept as it is.
+def scale_unemployment(rng, df, group_cols, split_col, k, extra_years):
+    wide = df.pivot_table(index=group_cols, columns="Year", values="Unemployment", aggfunc="mean")
+    years = sorted(wide.columns)
+    values = wide[years].to_numpy()
+
+    keys = []
+    rows = []
+    for row, key in enumerate(wide.index):
+        key = key if isinstance(key, tuple) else (key,)
+        category = key[group_cols.index(split_col)]
+        n = 1 if category == "Total" else k
+        noise = np.exp(rng.normal(0, 0.1, size=(n, 1)) + np.cumsum(rng.normal(0, 0.03, size=(n, len(years))), axis=1))
+        for i in range(n):
+            keys.append(tuple(sub_name(v, i, n) if c == split_col else v for c, v in zip(group_cols, key)))
+            rows.append(values[row] * noise[i])
+
+    values, years = extend_years(rng, np.array(rows), years, extra_years)
+    out = pd.DataFrame(np.clip(values, 0, None).round(1), index=pd.MultiIndex.from_tuples(keys, names=group_cols), columns=years)
+    out = out.stack().rename("Unemployment").reset_index()
+    out.columns = group_cols + ["Year", "Unemployment"]
+    return out.sort_values(["Year"] + group_cols, kind="stable")
+
+
+def generate(scale, extra_years, out_dir, seed):
+    rng = np.random.default_rng(seed + scale)
+    k_industry = max(1, round(math.sqrt(scale)))
+    k_occupation = max(1, round(scale / k_industry))
+    os.makedirs(out_dir, exist_ok=True)
+
+    def read(name):
+        return pd.read_csv(os.path.join(ROOT_DIR, name), encoding="utf-8-sig")
+
+    def write(frame, *names):
+        for name in names:
+            frame.to_csv(os.path.join(out_dir, name), index=False)
+
+    employment = scale_employment(rng, read("clean_data_combined.csv"), scale, extra_years)
+    write(employment, "clean_data_combined.csv", "occupation_age.csv")
+
+    io = scale_industry_occupation(rng, read("Industry and Occupation.csv"), k_industry, k_occupation, extra_years)
+    write(io, "Industry and Occupation.csv", "employment_by occupation & industry.csv")
+
+    write(scale_salary(rng, read("salary.csv"), scale, extra_years), "salary.csv")
+    write(scale_unemployment(rng, read("unemployment_by_age.csv"), ["Age Group"], "Age Group", scale, extra_years),
+          "unemployment_by_age.csv")
+    write(scale_unemployment(rng, read("unemployment_by_sex.csv"), ["Sex", "Category"], "Category", scale, extra_years),
+          "unemployment_by_sex.csv")
+    write(scale_unemployment(rng, read("unemployment_by_qualification.csv"), ["Highest Qualification"], "Highest Qualification", scale, extra_years),
+          "unemployment_by_qualification.csv")
+
+    print(f"x{scale}: {len(employment):,} employment rows, {len(io):,} industry x occupation rows -> {out_dir}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate scaled-up synthetic datasets")
+    parser.add_argument("--scale", type=int, nargs="+", default=[10, 100, 1000], help="cardinality multipliers")
+    parser.add_argument("--extra-years", type=int, default=0, help="number of earlier years to add")
+    parser.add_argument("--out", default="synthetic", help="output folder")
+    parser.add_argument("--seed", type=int, default=2024)
+    args = parser.parse_args()
+
+    for scale in args.scale:
+        generate(scale, args.extra_years, os.path.join(args.out, f"x{scale}"), args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,44 @@
 # Import library
+import functools
+import os
+
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import re
-
-# Load dataset
-df = pd.read_csv("clean_data_combined.csv")
-df2 = pd.read_csv("salary.csv")
-df_age = pd.read_csv("unemployment_by_age.csv")
-df_sex = pd.read_csv("unemployment_by_sex.csv")
-df_qual = pd.read_csv("unemployment_by_qualification.csv")
-df_io = pd.read_csv("Industry and Occupation.csv")
+
+import api_client
+import charts
+import explore
+import forecasting
+import precompute
+import profiling
+import similarity
+import sql_store
+from app_data import get_data
+from data_store import FILES, get_data_dir
+
+# Time this rerun when profiling is on (SG_PROFILE=1, see profiling.py)
+profiling.start_run("interactive_dashboard.py")
+
+# Sending a figure to the browser is timed as the "render" stage
+plotly_chart = profiling.traced("render", "st.plotly_chart")(st.plotly_chart)
+
+
+# With SG_API_URL set, the dashboard is a thin client: every number and chart comes from
+# the aggregation service (aggregation_service.py) and no data is loaded here
+API_URL = os.environ.get("SG_API_URL")
+
+# Progressive rendering (on unless SG_PROGRESSIVE=0): the KPI cards, key insights and text
+# of every tab are drawn first, with a placeholder where each chart goes. The charts are
+# built and filled in afterwards, in page order, so the Overview shows up straight away.
+PROGRESSIVE = os.environ.get("SG_PROGRESSIVE", "1") not in ("", "0")
+
+if API_URL:
+    data = None
+    options = api_client.get_options(API_URL)
+else:
+    # Load dataset once per server process, shared with the other pages of app.py
+    data = get_data()
+    options = charts.filter_options(data)
+year_list = options["year_list"]
 
 # Set up the page
 st.set_page_config(
@@ -27,22 +54,10 @@ st.markdown("""
 st.caption("Data Source: SingStat")
 st.divider()
 
-# Get list of year column and sort it
-year_list = []
-for i in df.columns:
-    if i.isdigit():
-        year_list.append(int(i))
-year_list = sorted(year_list)
-
-year_cols = [c for c in df.columns if c.isdigit()]
-for c in year_cols:
-    df[c] = pd.to_numeric(df[c], errors="coerce")
-
 # Get the unique values for filter values
-gender_list = sorted(df["Sex"].unique().tolist())
-age_list = sorted(df["Age Group"].unique().tolist())
-job_list = sorted(df["Occupation"].unique().tolist())
-qual_list = sorted(df_qual["Highest Qualification"].unique().tolist())
+gender_list = options["gender_list"]
+age_list = options["age_list"]
+job_list = options["job_list"]
 
 
 # Set a default data for filter
@@ -50,7 +65,6 @@ default_years = (year_list[0], year_list[-1])
 default_gender = ["All"]
 default_age = ["All Ages"]
 default_jobs = ["All Occupations"]
-default_qual = qual_list # Select all by default
 
 
 # Set the page layout
@@ -64,97 +78,293 @@ with left:
     selected_gender = st.multiselect("Gender", options=gender_list, default=default_gender)
     selected_age = st.multiselect("Age Group", options=age_list, default=default_age)
     selected_jobs = st.multiselect("Occupation", options=job_list, default=default_jobs)
+    # Set the trend model of the projection charts
+    selected_model = st.selectbox("Projection model", options=list(forecasting.MODELS), format_func=forecasting.MODELS.get)
+    # Mark the years flagged by the anomaly detector on the trend charts
+    show_anomalies = st.toggle("Mark detected anomalies", help="Unusual year-over-year changes and lasting shifts, found by anomalies.py")
+    # Comparison mode: every chart is also drawn for a second selection (B), side by side
+    compare = st.toggle("Compare with another selection", help="Draw every chart for a second set of filters next to the first one")
+    if compare:
+        st.markdown("**Selection B**")
+        compare_years = st.select_slider("Year Range (B)", options=year_list, value=default_years, key="compare_years")
+        compare_gender = st.multiselect("Gender (B)", options=gender_list, default=default_gender, key="compare_gender")
+        compare_age = st.multiselect("Age Group (B)", options=age_list, default=default_age, key="compare_age")
+        compare_jobs = st.multiselect("Occupation (B)", options=job_list, default=default_jobs, key="compare_jobs")
     st.caption("⚠️ If you select **All**, the other filters for that category won't apply. To choose specific gender, age group, or occupation, uncheck **All** first.")
 
 # Create page tabs with border line
 with right:
     with st.container(border=True):
         # Corrected tab name list to be valid
-        tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+        tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
             "Overview",
             "Demographic Analysis",
             "Industry Performance",
             "Occupation Performance",
             "Salary Trend",
-            "Unemployment Trend"])
-
-# Set new variable for data filtering
-filtered_data = df.copy()
-
-if "All" not in selected_gender:
-    filtered_data = filtered_data[filtered_data["Sex"].isin(selected_gender)]
-
-if "All Ages" not in selected_age:
-    filtered_data = filtered_data[filtered_data["Age Group"].isin(selected_age)]
-
-if "All Occupations" not in selected_jobs:
-    filtered_data = filtered_data[filtered_data["Occupation"].isin(selected_jobs)]
-
-# Give error message, because we spot there's an error if we didn't set any filter in the dashboard
-if filtered_data.empty: st.info("Please choose your filters."); st.stop()
+            "Unemployment Trend",
+            "Explore"])
+
+# Filter state used by every chart builder
+filters = {
+    "year_min": year_min,
+    "year_max": year_max,
+    "gender": selected_gender,
+    "age": selected_age,
+    "jobs": selected_jobs,
+    "model": selected_model,
+    # Set by the "Similar careers" panel of the Occupation tab
+    "similar_to": st.session_state.get("similar_to"),
+    "anomalies": show_anomalies,
+    # Set by clicking the charts of the Industry tab (click-to-drill)
+    "industry_drill": st.session_state.get("industry_drill")}
+
+# Filter state of selection B in comparison mode (the settings not repeated for B are
+# shared), else None
+compare_filters = None
+if compare:
+    compare_filters = dict(
+        filters, year_min=compare_years[0], year_max=compare_years[1],
+        gender=compare_gender, age=compare_age, jobs=compare_jobs)
+
+
+# Short description of a filter state, for the comparison mode
+def describe(state):
+    parts = [f"{state['year_min']}–{state['year_max']}"]
+    for key, everyone in [("gender", "All"), ("age", "All Ages"), ("jobs", "All Occupations")]:
+        if everyone not in state[key]:
+            parts.append(", ".join(state[key]))
+    return " · ".join(parts)
+
+
+
+# Last figure of every chart in this session, with the filter values it was built from
+chart_cache = st.session_state.setdefault("chart_cache", {})
+
+
+# Build one chart for a filter state here, or get it from the aggregation service in
+# thin-client mode
+def make_chart(builder, filters):
+    if API_URL:
+        return api_client.get_figure(API_URL, builder.__name__, filters)
+    return builder(data, filters)
+
+
+def make_summary(filters):
+    if API_URL:
+        return api_client.get_summary(API_URL, filters)
+    return charts.dashboard_summary(data, filters)
+
+
+# Get one chart for a filter state (the main one by default). A chart is only built again
+# when a filter it reads (charts.CHART_INPUTS) has changed, and it may already be in the
+# cache of precompute.py, built for the other selection of the comparison mode.
+def build(builder, state=None):
+    state = state or filters
+    slot = builder.__name__ if state is filters else builder.__name__ + " (B)"
+    key = charts.chart_key(builder, state)
+    cached = chart_cache.get(slot)
+    if cached and cached[0] == key:
+        return cached[1]
+    fig = precompute.get((builder.__name__,) + key, lambda: make_chart(builder, state))
+    chart_cache[slot] = (key, fig)
+    return fig
+
+
+# Build the summary and the charts of the year ranges next to the current one in the
+# background, so the next slider step is a cache hit
+def speculate():
+    jobs = []
+    for near in precompute.neighbour_ranges(filters, year_list):
+        jobs.append((("dashboard_summary",) + charts.filters_key(near), lambda near=near: make_summary(near)))
+        for builder in charts.CHART_INPUTS:
+            if charts.chart_key(builder, near) != charts.chart_key(builder, filters):
+                jobs.append(((builder.__name__,) + charts.chart_key(builder, near), lambda builder=builder, near=near: make_chart(builder, near)))
+    st.session_state["speculative"] = precompute.speculate(jobs, st.session_state.get("speculative", ()))
+
+
+# Charts waiting to be filled in: (placeholder, builder, note, missing, on_select)
+pending_charts = []
+
+
+# Show one chart, with an optional caption above it. When the builder has nothing to draw,
+# missing() shows a message instead. on_select is called when a point of the chart is
+# clicked. In progressive mode this only leaves a placeholder.
+def show_chart(builder, note=None, missing=None, on_select=None):
+    if PROGRESSIVE:
+        slot = st.empty()
+        slot.caption("⏳ Loading chart...")
+        pending_charts.append((slot, builder, note, missing, on_select))
+    else:
+        draw_chart(builder, note, missing, on_select)
+
+
+def draw_chart(builder, note=None, missing=None, on_select=None):
+    # In comparison mode a chart reading none of the filters that differ is drawn once
+    if compare_filters is None or charts.chart_key(builder, compare_filters) == charts.chart_key(builder, filters):
+        if compare_filters is not None:
+            st.caption("Same for both selections")
+        draw_figure(build(builder), builder.__name__, note, missing, on_select)
+        return
+    if note:
+        st.caption(note)
+    left_chart, right_chart = st.columns(2)
+    with left_chart:
+        st.caption(f"**A** · {describe(filters)}")
+        draw_figure(build(builder), builder.__name__, None, missing, on_select, paired=True)
+    with right_chart:
+        st.caption(f"**B** · {describe(compare_filters)}")
+        draw_figure(build(builder, compare_filters), builder.__name__ + "_b", None, missing, on_select, paired=True)
+
+
+# Draw one figure. The two figures of a pair may be the same, so they need their own keys.
+def draw_figure(fig, key, note=None, missing=None, on_select=None, paired=False):
+    if fig is None:
+        if missing:
+            missing()
+        return
+    if note:
+        st.caption(note)
+    if on_select:
+        plotly_chart(fig, use_container_width=True, key=key, on_select=functools.partial(on_select, key), selection_mode="points")
+    elif paired:
+        plotly_chart(fig, use_container_width=True, key=key)
+    else:
+        plotly_chart(fig, use_container_width=True)
+
+
+# Build the waiting charts and put each one in its placeholder
+def fill_charts():
+    while pending_charts:
+        slot, builder, note, missing, on_select = pending_charts.pop(0)
+        with slot.container():
+            draw_chart(builder, note, missing, on_select)
+
+
+# Click-to-drill: clicking a point of an industry chart opens the sector it belongs to into
+# its industries. field is the property of the clicked point holding the sector ("x" for
+# a bar, "legendgroup" for a line), and the selection is read from the chart widget.
+def drill(key, field):
+    def on_select(widget):
+        points = st.session_state[widget]["selection"]["points"]
+        if points and filters[key] is None and points[0].get(field):
+            st.session_state[key] = points[0][field]
+    return on_select
+
+
+def drill_up(key):
+    st.session_state[key] = None
+
+
+# Stop the script here, after filling in the charts already on the page
+def stop():
+    fill_charts()
+    speculate()
+    profiling.finish_run()
+    st.stop()
+
+
+# Explore tab: the form of a filter / group-by query (see explore.py). Running it keeps
+# the statement in the session, so the result stays on the page across reruns.
+def explore_form(database):
+    name = st.selectbox("Dataset", options=list(explore.DATASETS), format_func=lambda n: explore.DATASETS[n]["title"], key="explore_dataset")
+    dataset = explore.DATASETS[name]
+    years = explore.years(database, name)
+    if not years:
+        st.info("This dataset has no rows.")
+        return
+    with st.form("explore_form"):
+        where = {}
+        for column, col in zip(dataset["labels"], st.columns(len(dataset["labels"]))):
+            where[column] = col.multiselect(column, options=explore.labels(database, name, column), placeholder="Everything", key=f"explore_{name}_{column}")
+        year_range = st.select_slider("Years", options=years, value=(years[0], years[-1]), key=f"explore_{name}_years")
+        group_by = st.multiselect("Group by", options=[dataset["year"]] + dataset["labels"], default=[dataset["year"]], key=f"explore_{name}_group_by")
+        aggregate = st.selectbox("Value", options=list(explore.AGGREGATES), format_func=lambda a: f"{a} of {dataset['measure']}", key=f"explore_{name}_aggregate")
+        if st.form_submit_button("Run"):
+            query = {"dataset": name, "where": where, "years": year_range, "group_by": group_by, "aggregate": aggregate}
+            sql, params = explore.build_sql(query)
+            st.session_state["explore_query"] = (sql, params, query)
+
+
+def explore_sql():
+    tables = ", ".join(list(FILES) + ["employment_long"])
+    st.caption(f"Tables: {tables}. Only SELECT statements are allowed.")
+    with st.form("explore_sql"):
+        sql = st.text_area("SQL", height=140, key="explore_sql_text", value=(
+            'SELECT "Year", "Occupation", SUM("Employment") AS "Employment"\n'
+            'FROM employment_long\n'
+            'WHERE "Sex" = \'All\' AND "Age Group" = \'All Ages\' AND "Occupation" != \'All Occupations\'\n'
+            'GROUP BY "Year", "Occupation"'))
+        if st.form_submit_button("Run"):
+            st.session_state["explore_query"] = (sql, [], None)
+
+
+# Run the last query of the session and show its chart and rows
+def explore_result(database):
+    if "explore_query" not in st.session_state:
+        return
+    sql, params, query = st.session_state["explore_query"]
+    try:
+        result = explore.run(database, sql, params)
+    except ValueError as error:
+        st.error(str(error))
+        return
+    rows = result["rows"]
+    timing = "from the cache" if result["cached"] else f"in {result['seconds']:.2f} s"
+    st.caption(f"{len(rows):,} rows {timing}" + (f", only the first {explore.MAX_ROWS:,} are shown" if result["truncated"] else ""))
+    fig = explore.figure(rows, query)
+    if fig is not None:
+        plotly_chart(fig, use_container_width=True, key="explore_chart")
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+    st.download_button("Download CSV", rows.to_csv(index=False), file_name="query.csv", mime="text/csv")
+    if query is not None:
+        with st.expander("SQL of this query"):
+            st.code(sql, language="sql")
+            st.caption(f"Parameters: {params}")
+
+
+# TAB 7: Explore. It doesn't use the filters, so it is drawn before the summary checks
+# that can stop the page.
+with tab7:
+    st.header("Explore the Data")
+    st.caption(f"Ask your own questions of the datasets. Queries stop after {explore.QUERY_TIMEOUT} s and show up to {explore.MAX_ROWS:,} rows.")
+    database = None if API_URL else explore.find_database(data)
+    if API_URL:
+        st.info("Explore queries the local data store, so it isn't available while the dashboard gets its data from the aggregation service.")
+    elif database is None:
+        st.info("The query database of this data hasn't been built yet (python sql_store.py).")
+        if st.button("Build the query database"):
+            with st.spinner("Building the query database..."):
+                sql_store.open_database(get_data_dir(), FILES, data=data)
+            st.rerun()
+    else:
+        if st.radio("Query", options=["Filter and group", "SQL"], horizontal=True, key="explore_kind") == "SQL":
+            explore_sql()
+        else:
+            explore_form(database)
+        explore_result(database)
 
-# Convert selected year columns to numbers
-selected_year_cols = []
 
-for year in year_list:
-    if year >= year_min and year <= year_max:
-        selected_year_cols.append(str(year))
-for year in selected_year_cols:
-    if year in filtered_data.columns:
-        filtered_data[year] = pd.to_numeric(filtered_data[year], errors="coerce").fillna(0)
+# KPI numbers, key insights and data checks
+summary = precompute.get(("dashboard_summary",) + charts.filters_key(filters), lambda: make_summary(filters))
 
 # Give error message, because we spot there's an error if we didn't set any filter in the dashboard
-if not selected_year_cols: st.info("Please set your filters."); st.stop()
+if not summary["has_employment"]: st.info("Please choose your filters."); stop()
+if not summary["year_cols"]: st.info("Please set your filters."); stop()
 
-# Get latest, previous, and two-years-ago columns
-latest_col = str(year_max)
-prev_col = str(year_max - 1)
-prev2_col = str(year_max - 2)
+if compare_filters is not None:
+    compare_summary = precompute.get(("dashboard_summary",) + charts.filters_key(compare_filters), lambda: make_summary(compare_filters))
+    if not compare_summary["has_employment"] or not compare_summary["year_cols"]:
+        with left:
+            st.info("Selection B has no data to compare: choose its filters.")
+        compare_filters = None
 
 # TAB 1: Overview
 with tab1:
-    # Get the previous years available in the data
-    latest_col = str(year_max)
-    prev_col = None
-    prev2_col = None
-
-    # Get the index of the latest selected year in the sorted list of all available years
-    if year_max in year_list:
-        latest_year_index = year_list.index(year_max)
-        
-        # Get the previous available year
-        if latest_year_index > 0:
-            prev_col = str(year_list[latest_year_index - 1])
-        
-        # Get the year before that
-        if latest_year_index > 1:
-            prev2_col = str(year_list[latest_year_index - 2])
-
-    # Calculate totals only if the year columns exist
-    total_latest = filtered_data[latest_col].sum() if latest_col in filtered_data.columns else 0
-    total_prev = filtered_data[prev_col].sum() if prev_col and prev_col in filtered_data.columns else 0
-    total_prev2 = filtered_data[prev2_col].sum() if prev2_col and prev2_col in filtered_data.columns else 0
-
-    # Calculate YoY or Yeor over Year growth if previous year's data is available
-    growth = ((total_latest - total_prev) / total_prev * 100) if total_prev else 0
-    growth_prev = ((total_prev - total_prev2) / total_prev2 * 100) if total_prev2 else 0
-    change = round(growth - growth_prev, 2)
-
-    # Total period growth metrics
-    start_col = str(year_min)
-    total_start = filtered_data[start_col].sum() if start_col in filtered_data.columns else 0
-    period_growth = ((total_latest - total_start) / total_start * 100) if total_start else 0
-
-    # Gender breakdown
-    gender_data = df.copy()
-    if "All Ages" not in selected_age:
-        gender_data = gender_data[gender_data["Age Group"].isin(selected_age)]
-    if "All Occupations" not in selected_jobs:
-        gender_data = gender_data[gender_data["Occupation"].isin(selected_jobs)]
-    gender_data[latest_col] = pd.to_numeric(gender_data[latest_col], errors="coerce")
-    female_sum = gender_data[gender_data["Sex"] == "Female"][latest_col].sum()
-    male_sum = gender_data[gender_data["Sex"] == "Male"][latest_col].sum()
-    female_ratio = (female_sum / (female_sum + male_sum) * 100) if (female_sum + male_sum) else 0
+    kpis = summary["kpis"]
+    latest_col = kpis["latest_col"]
+    prev_col = kpis["prev_col"]
+    prev2_col = kpis["prev2_col"]
 
     # Show metric card
     col1, col2, col3, col4 = st.columns(4)
@@ -162,36 +372,54 @@ with tab1:
     with col1:
         st.metric(
             label=f"Total Growth ({year_min} to {year_max})",
-            value=f"{period_growth:.2f}%")
+            value=f"{kpis['period_growth']:.2f}%")
         st.caption("For the entire selected period")
         
     with col2:
-        # Get the grand total for the metric value from the unfiltered dataframe
-        grand_total_latest_year = df.loc[(df['Age Group'] == 'All Ages') & (df['Occupation'] == 'All Occupations') & (df['Sex'] == 'All'), latest_col].item()
-        numeric_total = float(grand_total_latest_year)
-        
         st.metric(
             label=f"Total Employment (in Thousands, {latest_col})",
-            value=f"{numeric_total:.1f}",
+            value=f"{kpis['grand_total']:.1f}",
             # Only show the delta if there is a previous year to compare 
-            delta=f"{growth:.2f}%" if prev_col else None)
+            delta=f"{kpis['growth']:.2f}%" if prev_col else None)
         # Update the caption to show the actual year being compared
         st.caption(f"Year-over-year vs. {prev_col}" if prev_col else "No previous year for comparison")
         
     with col3:
         st.metric(
             label=f"YoY Growth Rate ({latest_col})",
-            value=f"{growth:.2f}%" if prev_col else "N/A", 
+            value=f"{kpis['growth']:.2f}%" if prev_col else "N/A", 
             # Only show the delta if two previous years exist
-            delta=f"{change:.2f} pp" if prev2_col else None)
+            delta=f"{kpis['change']:.2f} pp" if prev2_col else None)
         # Update the streamlit caption to reflect what's being compared
         st.caption(f"Growth momentum vs. {prev_col}" if prev2_col else "Insufficient data for momentum")
 
     with col4:
         st.metric(
             label=f"Female Employment ({latest_col})",
-            value=f"{female_ratio:.1f}%")
-        st.caption(f"{female_sum:,.0f} Female / {male_sum:,.0f} Male")
+            value=f"{kpis['female_ratio']:.1f}%")
+        st.caption(f"{kpis['female_sum']:,.0f} Female / {kpis['male_sum']:,.0f} Male")
+
+    # Comparison mode: the cards of selection B, with the difference from selection A
+    if compare_filters is not None and "kpis" in compare_summary:
+        kpis_b = compare_summary["kpis"]
+        st.markdown(f"**Selection B** · {describe(compare_filters)}")
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric(
+            label=f"Total Growth ({compare_filters['year_min']} to {compare_filters['year_max']})",
+            value=f"{kpis_b['period_growth']:.2f}%",
+            delta=f"{kpis_b['period_growth'] - kpis['period_growth']:+.2f} pp vs A")
+        col2.metric(
+            label=f"Total Employment (in Thousands, {kpis_b['latest_col']})",
+            value=f"{kpis_b['grand_total']:.1f}",
+            delta=f"{kpis_b['grand_total'] - kpis['grand_total']:+.1f} vs A")
+        col3.metric(
+            label=f"YoY Growth Rate ({kpis_b['latest_col']})",
+            value=f"{kpis_b['growth']:.2f}%" if kpis_b["prev_col"] else "N/A",
+            delta=f"{kpis_b['growth'] - kpis['growth']:+.2f} pp vs A" if kpis_b["prev_col"] and prev_col else None)
+        col4.metric(
+            label=f"Female Employment ({kpis_b['latest_col']})",
+            value=f"{kpis_b['female_ratio']:.1f}%",
+            delta=f"{kpis_b['female_ratio'] - kpis['female_ratio']:+.1f} pp vs A")
 
     st.divider()
     # Add key visualization
@@ -199,67 +427,7 @@ with tab1:
 
     with col1:
         st.subheader("Employment Trend")
-        # Create "Overall Employment Trend" chart
-        if "All Ages" in selected_age and "All Occupations" in selected_jobs and "All" in selected_gender:
-            # Prepare data for each trace
-            total_trend = df.loc[(df['Sex'] == 'All') & (df['Age Group'] == 'All Ages') & (df['Occupation'] == 'All Occupations'), selected_year_cols].sum()
-            male_trend = df.loc[(df['Sex'] == 'Male') & (df['Age Group'] == 'All Ages') & (df['Occupation'] == 'All Occupations'), selected_year_cols].sum()
-            female_trend = df.loc[(df['Sex'] == 'Female') & (df['Age Group'] == 'All Ages') & (df['Occupation'] == 'All Occupations'), selected_year_cols].sum()
-
-            # Create a figure with graph_objects for layering
-            fig = go.Figure()
-
-            # Add the color to fill area for Total Employment chart
-            fig.add_trace(go.Scatter(
-                x=total_trend.index, y=total_trend.values,
-                fill='tozeroy',
-                mode='lines',
-                line_color='rgba(100, 149, 237, 0.5)', 
-                name='Total'))
-
-            # Add the line for Male Employment
-            fig.add_trace(go.Scatter(
-                x=male_trend.index, y=male_trend.values,
-                mode='lines',
-                line_color='#6495ED', 
-                name='Male'))
-
-            # Add the line for Female Employment
-            fig.add_trace(go.Scatter(
-                x=female_trend.index, y=female_trend.values,
-                mode='lines',
-                line_color='#FF69B4', 
-                name='Female'))
-            
-            title = "<b>Overall Employment Trend by Gender</b>"
-        
-        # Setting the chart when user uses filters
-        else:
-            trend_df = filtered_data.melt(id_vars=["Sex", "Age Group", "Occupation"], value_vars=selected_year_cols, var_name="Year", value_name="Employment")
-            trend_df['Year'] = pd.to_numeric(trend_df['Year'])
-
-            if "All" not in selected_gender:
-                grouping_var = "Sex"
-            elif "All Occupations" not in selected_jobs and len(selected_jobs) > 1:
-                grouping_var = "Occupation"
-            else:
-                grouping_var = "Age Group"
-
-            grouped_trend = trend_df.groupby(["Year", grouping_var])["Employment"].sum().reset_index()
-            color_map = {'Male': '#6495ED', 'Female': '#FF69B4'} if grouping_var == "Sex" else {}
-            
-            fig = px.line(grouped_trend, x="Year", y="Employment", color=grouping_var, 
-                          markers=True, color_discrete_map=color_map)
-            
-            title = f"<b>Employment Trend by {grouping_var}</b>"
-        
-        # Set final layout updates to the figure
-        fig.update_layout(
-            title=title,
-            height=350, 
-            margin=dict(l=20, r=20, t=60, b=20), 
-            legend_title_text='')
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(charts.fig_employment_trend)
 
     with col2:
         st.subheader("Key Insights")
@@ -267,17 +435,9 @@ with tab1:
         # Create key insight for Top Hiring Industry
         st.markdown("🚀 **Top Hiring Industry**")
         if year_min < year_max:
-            # Use the industry and occupation dataframe for this insight
-            io_filtered = df_io[(df_io['year'].isin([year_min, year_max])) & (~df_io['industry'].isin(["All Industries", "Services"]))]
-            
-            # Need to set pivot to get years as columns
-            io_pivot = io_filtered.pivot_table(index='industry', columns='year', values='employment', aggfunc='sum')
-            
-            # Calculate absolute growth and find the max
-            if year_min in io_pivot.columns and year_max in io_pivot.columns:
-                io_pivot['growth'] = io_pivot[year_max] - io_pivot[year_min]
-                top_hiring_industry = io_pivot['growth'].idxmax()
-                top_hiring_value = io_pivot['growth'].max()
+            top_hiring = summary["top_hiring"]
+            if top_hiring:
+                top_hiring_industry, top_hiring_value = top_hiring
                 st.markdown(f"##### {top_hiring_industry}") 
                 st.caption(f"This industry added the most jobs (**{top_hiring_value:,.0f}k**) from {year_min} to {year_max}, signaling strong hiring growth.")
             else:
@@ -291,95 +451,38 @@ with tab1:
         st.markdown("💰 **Highest Paying Occupation**")
         
         # If 2024 is selected, use 2023 data for this insight instead, because there's no 2024 data in salary dataset
-        year_for_salary = 2023 if year_max == 2024 else year_max
-        
-        # Filter the salary data using the adjusted year
-        sal_latest = df2[(df2['year'] == year_for_salary) & (df2['occupation'] != 'All Occupations')]
+        year_for_salary = charts.salary_insight_year(filters)
+        top_paying = summary["top_paying"]
         
-        if not sal_latest.empty:
-            top_paying_occ = sal_latest.groupby('occupation')['value'].mean().idxmax()
-            top_paying_val = sal_latest.groupby('occupation')['value'].mean().max()
+        if top_paying:
+            top_paying_occ, top_paying_val = top_paying
             st.markdown(f"##### {top_paying_occ}")
             st.caption(f"Offered the highest average salary of **S${top_paying_val:,.0f}/month** in {year_for_salary}.")
         else:
             st.info(f"Salary data for the year {year_for_salary} is not available.")
 
+    st.divider()
+    # Projection of the trend lines, fitted on the selected years
+    st.subheader(f"Employment Projection to {forecasting.HORIZON_YEAR}")
+    st.caption("Dashed lines are projections, the shaded bands their 95% prediction intervals. Change the model in the filters.")
+    show_chart(charts.fig_projection, missing=lambda: st.info(f"Select at least {forecasting.MIN_POINTS} years ending before {forecasting.HORIZON_YEAR} to see a projection."))
+
 # TAB 2: Demographic Breakdown
 with tab2:
     # Create Employment Trend chart (Overall & By Gender)
     st.subheader(f"Employment Trend (Overall & By Gender) ({year_min} - {year_max})")
-
-    genders_to_plot = ["All"]
-    if "All" in selected_gender:
-        genders_to_plot.extend(["Male", "Female"])
-    else:
-        genders_to_plot.extend(selected_gender)
-
-    gender_filter = df["Sex"].isin(genders_to_plot)
-    combined_src = df[
-        (df["Occupation"] == "All Occupations") &
-        (df["Age Group"] == "All Ages") &
-        gender_filter]
-
-    combined_melt = combined_src.melt(
-        id_vars=["Sex"],
-        value_vars=selected_year_cols,
-        var_name="Year",
-        value_name="Employment")
-    combined_melt["Year"] = combined_melt["Year"].astype(int)
-    combined_melt['Sex'] = combined_melt['Sex'].replace({'All': 'Total'})
-
-    fig_area = px.line(
-        combined_melt, x="Year", y="Employment", color="Sex",
-        markers=False, category_orders={"Sex": ["Total", "Male", "Female"]},
-        color_discrete_map={'Total': 'lightskyblue', 'Male': 'blue', 'Female': 'hotpink'})
-
-    fig_area.update_traces(selector={'name': 'Total'}, fill='tozeroy')
-    st.plotly_chart(fig_area, use_container_width=True)
+    show_chart(charts.fig_area)
     st.divider()
-    
-    # Use the main 'filtered_data' which already connect to the year, gender, and age filters from the sidebar.
-    age_chart_df = filtered_data.copy()
-
-    # If the user select "All Occupations", we must  use only those pre-aggregated rows.
-    if "All Occupations" in selected_jobs:
-        age_chart_df = age_chart_df[age_chart_df['Occupation'] == 'All Occupations']
-    
-    # If the user selected specific occupations, 'filtered_data' is already correct,
-    # so we don't need to do anything else. The sum will be calculated correctly.
-    age_filtered = age_chart_df[age_chart_df["Age Group"] != "All Ages"]
 
     # Create Employment by Age Group bar chart
     st.subheader(f"Employment by Age Group ({year_max})")
-    
-    # Group by Age Group and sum
-    age_snapshot = age_filtered.groupby("Age Group")[latest_col].sum().reset_index()
-    age_snapshot.columns = ['Age Group', 'Employment Count']
-
-    # Set age group order from youngest to older year
-    age_order = [
-        "15-19 Years Old", "20-24 Years Old", "25-29 Years Old", "30-34 Years Old", 
-        "35-39 Years Old", "40-44 Years Old", "45-49 Years Old", "50-54 Years Old", 
-        "55-59 Years Old", "60-64 Years Old", "65 Years & Over" ]
-    age_snapshot['Age Group'] = pd.Categorical(age_snapshot['Age Group'], categories=age_order, ordered=True)
-    age_snapshot = age_snapshot.sort_values('Age Group')
-
-    fig_bar = px.bar(age_snapshot, x='Age Group', y='Employment Count', 
-                     color='Age Group', text_auto='.2s')
-    fig_bar.update_traces(textposition='outside', cliponaxis=False)
-    st.plotly_chart(fig_bar, use_container_width=True)
+    show_chart(charts.fig_bar)
 
     st.divider()
 
     # Create Employment Trends by Age Group using line chart
     st.subheader(f"Employment Trends by Age Group ({year_min}–{year_max})")
-    
-    age_trend = age_filtered.groupby("Age Group")[selected_year_cols].sum().T
-    age_trend.index = age_trend.index.astype(int)
-    
-    fig_line = px.line(age_trend, x=age_trend.index, y=age_trend.columns, markers=True)
-    fig_line.update_layout(xaxis_title="Year", yaxis_title="Total Employment", legend_title_text='Age Group')
-    st.plotly_chart(fig_line, use_container_width=True)
+    show_chart(charts.fig_line)
 
     
 # Tab 3: Industry Performance
@@ -387,110 +490,36 @@ with tab3:
     st.header("Industry & Occupation Performance")
     st.warning("Note: Gender and Age Group filters are not applicable for this section.")
 
-    # Create a filtered copy for this tab using the main year slider
-    tab3_filtered = df_io[(df_io['year'] >= year_min) & (df_io['year'] <= year_max)].copy()
     # Give error message, because we spot there's an error if we didn't set any filter in the dashboard
-    if tab3_filtered.empty: st.info("Please select your filters."); st.stop()
+    if not summary["has_industry"]: st.info("Please select your filters."); stop()
 
-    # Prepare data for total employment charts before applying specific occupation filters
-    industries_to_drop = ["All Industries", "Services"]
-    total_occupation_label = "All Occupation Groups, (Total Employed Residents)"
-
-    total_employment_data_for_bar = tab3_filtered[
-        (tab3_filtered["year"] == year_max) &
-        (tab3_filtered["occupation"] == total_occupation_label) &
-        (~tab3_filtered["industry"].isin(industries_to_drop))]
-    
-    # Sort industry to shows the highest to the lowest
-    by_industry = total_employment_data_for_bar[["industry", "employment"]].sort_values(
-        by="employment", ascending=False)
-    
-    # Listing top industries for line chart
-    top_industries_for_line_chart = total_employment_data_for_bar.sort_values(
-        by="employment", ascending=False)["industry"].head(10).tolist()
-    
-    trends_data = tab3_filtered[
-        (tab3_filtered["industry"].isin(top_industries_for_line_chart)) &
-        (tab3_filtered["occupation"] == total_occupation_label)]
-    
-    # Filter by occupation if specific occupations in the filter are selected
-    if "All Occupations" not in selected_jobs:
-        tab3_filtered = tab3_filtered[tab3_filtered["occupation"].isin(selected_jobs)]
+    # Click a sector to see its industries
+    if filters["industry_drill"]:
+        st.button(f"⬅ All sectors (showing {filters['industry_drill']})", on_click=drill_up, args=("industry_drill",))
+        level = "Industry"
+    else:
+        st.caption("Click a sector in the charts below to break it down into its industries.")
+        level = "Sector"
 
     # Create Bar Chart of Employment Volume 
-    st.subheader(f"Employment Volume by Industry in {year_max}")
-    st.caption("This chart shows the total number of employed residents for each industry in the latest selected year.")
-    fig1 = px.bar(
-        by_industry,
-        x="industry",
-        y="employment",
-        color="industry",
-        text = "employment",
-        text_auto='.1f')
-    fig1.update_traces(textposition="outside", cliponaxis=False)
-    fig1.update_layout(
-        xaxis_title="Employment (in Thousands)", 
-        yaxis_title=None,                        
-        uniformtext_minsize=8,
-        uniformtext_mode='hide',
-        showlegend=False,                        
-        coloraxis_showscale=True)
-    st.plotly_chart(fig1, use_container_width=True)
+    st.subheader(f"Employment Volume by {level} in {year_max}")
+    st.caption(f"This chart shows the total number of employed residents for each {level.lower()} in the latest selected year.")
+    show_chart(charts.fig1, on_select=drill("industry_drill", "x"))
     st.divider()
 
     # Create Line Chart of Employment Trends 
-    st.subheader(f"Employment Trends Across Top 10 Industries ({year_min} - {year_max})")
-    st.caption("This trend line shows the employment trend over the period for the top 10 industries.")
-    fig2 = px.line(
-        trends_data, 
-        x="year", 
-        y="employment", 
-        color="industry",
-        markers=True)
-    fig2.update_layout(
-        xaxis_title="Year",
-        yaxis_title="Employment (in Thousands)",
-        legend_title_text="Industry")
-    st.plotly_chart(fig2, use_container_width=True)
+    st.subheader(f"Employment Trends by {level} ({year_min} - {year_max})")
+    st.caption(f"This trend line shows the employment trend over the period for the top 10 {'industries' if filters['industry_drill'] else 'sectors'}.")
+    show_chart(charts.fig2, on_select=drill("industry_drill", "legendgroup"))
     st.divider()
     
-    # Create Stacked Bar Chart for Occupation distribution (NO CHANGES)
-    st.subheader(f"Occupation Distribution in Each Industry in {year_max}")
-
-    # Filter for the latest year and exclude aggregate occupation categories
-    latest_year_data = tab3_filtered[
-        (tab3_filtered["year"] == year_max) &
-        (~tab3_filtered["industry"].isin(industries_to_drop))]
-    occupations_to_drop = ["All Occupation Groups, (Total Employed Residents)", "Other Occupation Groups Nes"]
-    composition_data = latest_year_data[~latest_year_data["occupation"].isin(occupations_to_drop)]
-
-    if composition_data.empty:
-        st.info("No detailed occupation data to display for the current selection.")
-    else:
-        # Calculate the percentage share of each occupation within its industry
-        totals = composition_data.groupby("industry")["employment"].sum().rename("total_employment")
-        composition_data = composition_data.merge(totals, on="industry")
-        composition_data["share"] = composition_data["employment"] / composition_data["total_employment"]
-
-        # Create the stacked bar chart
-        st.caption("This chart breaks down each industry's workforce by occupation, showing the percentage of employees in different roles.")
-        fig3 = px.bar(
-            composition_data,
-            x="industry",
-            y="share",
-            color="occupation",
-            labels={"share": "Share of Workforce", "industry": "Industry", "occupation": "Occupation"},
-            text_auto='.0%')
-        fig3.update_traces(textposition='inside', insidetextanchor='middle')
-        fig3.update_layout(
-            height=700,
-            barmode="stack",
-            xaxis_title=None,
-            yaxis_title="Share of Employment",
-            yaxis_tickformat=".0%",
-            legend=dict(orientation="h", yanchor="bottom", y=-0.4, xanchor="center", x=0.5),
-            xaxis={'categoryorder':'total descending'})
-        st.plotly_chart(fig3, use_container_width=True)
+    # Create Stacked Bar Chart for Occupation distribution
+    st.subheader(f"Occupation Distribution in Each {level} in {year_max}")
+    show_chart(
+        charts.fig3,
+        note=f"This chart breaks down each {level.lower()}'s workforce by occupation, showing the percentage of employees in different roles.",
+        missing=lambda: st.info("No detailed occupation data to display for the current selection."),
+        on_select=drill("industry_drill", "x"))
 
 # TAB 4: Occupation Performance
 with tab4:
@@ -501,173 +530,47 @@ with tab4:
 
     # Chart 1: Employment Trend by Occupation
     st.subheader("Employment Trend by Occupation")
-    
-    # Use the data already filtered by the sidebar, but remove the "All Occupations" total
-    occupation_trend_data = filtered_data[filtered_data["Occupation"] != "All Occupations"].copy()
-
-    occupation_melted = occupation_trend_data.melt(
-        id_vars=["Occupation"], 
-        value_vars=selected_year_cols,
-        var_name="Year", 
-        value_name="Employment")
-    occupation_melted["Year"] = occupation_melted["Year"].astype(int)
-
-    # Calculate the sum of employment values to get the trend data
-    final_trend = occupation_melted.groupby(["Year", "Occupation"])["Employment"].sum().reset_index()
-    
-    # Create the line chart
-    fig_trend = px.line(final_trend, x="Year", y="Employment", color="Occupation", markers=True)
-    st.plotly_chart(fig_trend, use_container_width=True)
+    show_chart(charts.fig_trend)
+    st.divider()
+
+    # Chart 1b: Projection of each occupation (hover a dashed line for its 95% interval)
+    st.subheader(f"Employment Projection by Occupation to {forecasting.HORIZON_YEAR}")
+    show_chart(charts.fig_occupation_projection, missing=lambda: st.info(f"Select at least {forecasting.MIN_POINTS} years ending before {forecasting.HORIZON_YEAR} to see a projection."))
     st.divider()
 
     # Chart 2: Top 4 Growing & Declining Occupations
     st.subheader(f"Top 4 Growing & Declining Occupations ({year_min}–{year_max})")
 
-    # Define the start and end years for the growth calculation
-    start_year_for_growth = str(year_min)
-    
-    # Check if the selected time range is valid for calculating growth (more than 1 year)
-    if start_year_for_growth in filtered_data.columns and end_year in filtered_data.columns and start_year_for_growth != end_year:
-        
-        # Excluding the total ("All"( in occupation data
-        growth_base = filtered_data[filtered_data["Occupation"] != "All Occupations"]
-        
-        # Group by occupation and sum the employment for start and end years
-        growth_summary = growth_base.groupby("Occupation")[[start_year_for_growth, end_year]].sum()
-        
-        # Remove any occupations that had 0 employment at the start to avoid division-by-zero errors
-        growth_summary = growth_summary[growth_summary[start_year_for_growth] > 0]
-        
-        # Calculate the growth percentage
-        growth_summary["Growth %"] = (
-            (growth_summary[end_year] - growth_summary[start_year_for_growth]) /
-             growth_summary[start_year_for_growth]) * 100
-        
-        # Get the top 4 and least 4
-        top_grow = growth_summary.nlargest(4, "Growth %").reset_index()
-        top_decl = growth_summary.nsmallest(4, "Growth %").reset_index()
-    else:
-        # If the date range is not valid, create empty dataframes to avoid errors in dashboard
-        top_grow = pd.DataFrame(columns=["Occupation", "Growth %"])
-        top_decl = pd.DataFrame(columns=["Occupation", "Growth %"])
-
     # Create two columns to display the charts side-by-side
     c1, c2 = st.columns(2)
     with c1:
-        fig_growing = px.bar(top_grow, x="Growth %", y="Occupation", orientation="h", color="Occupation", 
-                          text_auto='.1f', title="Top 4 Growing Occupations")
-        fig_growing.update_traces(texttemplate='%{x:.1f}%', textposition="outside")
-        fig_growing.update_layout(showlegend=False, yaxis={'categoryorder':'total ascending'})
-        st.plotly_chart(fig_growing, use_container_width=True)
+        show_chart(charts.fig_growing)
     with c2:
-        fig_declining = px.bar(top_decl, x="Growth %", y="Occupation", orientation="h", color="Occupation",
-                          text_auto='.1f', title="Top 4 Declining Occupations")
-        fig_declining.update_traces(texttemplate='%{x:.1f}%', textposition="outside")
-        fig_declining.update_layout(showlegend=False, yaxis={'categoryorder':'total descending'})
-        st.plotly_chart(fig_declining, use_container_width=True)
+        show_chart(charts.fig_declining)
+
+    # Chart 2b: Careers whose employment moved like the chosen (or top growing) occupation
+    st.subheader(f"Similar Careers ({year_min}–{year_max})")
+    st.selectbox("Find careers shaped like", options=[job for job in job_list if job != "All Occupations"],
+                 index=None, key="similar_to", placeholder="Top growing occupation")
+    st.caption("Series of other occupations, age groups and industries with the most similar ups and downs, whatever their size.")
+    show_chart(charts.fig_similar, missing=lambda: st.info(f"Select at least {similarity.MIN_YEARS} years to compare career trajectories."))
     st.divider()
 
     # Chart 3: Gender Distribution by Occupation
     st.subheader(f"Gender Distribution by Occupation ({end_year})")
-
-    # Use the filtered data in mainpage, but ensure we only have Male/Female for comparison
-    gender_dist_data = filtered_data[filtered_data["Sex"].isin(["Male", "Female"])]
-
-    if end_year in gender_dist_data.columns and not gender_dist_data.empty:
-        # Group data by Occupation and Sex, then sum the employment for the selected end year
-        gender_summary = gender_dist_data.groupby(["Occupation", "Sex"])[end_year].sum().reset_index()
-        
-        # Calculate the total employment for each occupation to find the percentage
-        occupation_totals = gender_summary.groupby("Occupation")[end_year].sum().rename("Total")
-        gender_summary = gender_summary.merge(occupation_totals, on="Occupation")
-        
-        # Calculate the share for each gender
-        gender_summary["Share (%)"] = (gender_summary[end_year] / gender_summary["Total"]) * 100
-        
-        # Create the 100% stacked bar chart
-        fig_gender = px.bar(
-            gender_summary, x="Share (%)", y="Occupation", color="Sex", orientation="h",
-            text="Share (%)",
-            color_discrete_map={"Male": "#004C99", "Female": "#FF9999"})
-        fig_gender.update_traces(texttemplate="%{text:.1f}%", textposition="inside")
-        fig_gender.update_layout(
-            barmode="stack", xaxis_title="Share of Workforce", yaxis_title=None,
-            legend_title_text="Gender", yaxis={'categoryorder':'total ascending'})
-        st.plotly_chart(fig_gender, use_container_width=True)
-    else:
-        st.warning(f"No gender distribution data available for {end_year} with these filters.")
+    show_chart(charts.fig_gender, missing=lambda: st.warning(f"No gender distribution data available for {end_year} with these filters."))
     st.divider()
 
     # Chart 4: Job Breakdown by Age, Gender, and Occupation
     st.subheader(f"Job Breakdown by Age, Gender, and Occupation ({end_year})")
-
-    # Use the non-aggregated data from the main dataframe
-    breakdown_data = df[
-        (df["Age Group"] != "All Ages") &
-        (df["Sex"] != "All") &
-        (df["Occupation"] != "All Occupations")
-    ].copy()
-
-    # Apply all sidebar filters to this detailed data
-    if "All Occupations" not in selected_jobs:
-        breakdown_data = breakdown_data[breakdown_data["Occupation"].isin(selected_jobs)]
-    if "All" not in selected_gender:
-        breakdown_data = breakdown_data[breakdown_data["Sex"].isin(selected_gender)]
-    if "All Ages" not in selected_age:
-        breakdown_data = breakdown_data[breakdown_data["Age Group"].isin(selected_age)]
-
-    # Continue only if there is data left after filtering
-    if end_year in breakdown_data.columns and not breakdown_data.empty:
-        # Get a sorted list of unique occupations for the chart titles
-        occupations_in_order = sorted(breakdown_data["Occupation"].unique())
-        
-        # Create a "facet" plot: a grid of smaller charts, one for each occupation
-        fig_breakdown = px.bar(
-            breakdown_data,
-            x="Age Group", y=end_year, color="Sex",
-            facet_col="Occupation",     # Create a new chart for each occupation
-            facet_col_wrap=3,           # Show 3 charts per row
-            barmode="group",
-            height=300 * ((len(occupations_in_order) - 1) // 3 + 1), 
-            color_discrete_map={"Male": "navy", "Female": "lightcoral"})
-        
-        # Set y-axis ranges for each chart for better visibility
-        fig_breakdown.update_yaxes(matches=None, showticklabels=True)
-        
-        # tidy up the titles for each small chart 
-        for annotation in fig_breakdown.layout.annotations:
-            annotation.text = annotation.text.replace("Occupation=", "")
-
-        # Add a y-axis title only to the first chart in each row to have a more clear chart
-        fig_breakdown.update_yaxes(title_text="Employed (in Thousands)", col=1)
-        fig_breakdown.update_yaxes(title_text="", col=2)
-        fig_breakdown.update_yaxes(title_text="", col=3)
-
-        st.plotly_chart(fig_breakdown, use_container_width=True)
-    else:
-        st.warning(f"Sorry, no detailed breakdown data to show for {end_year} with these filters.")
+    show_chart(charts.fig_breakdown, missing=lambda: st.warning(f"Sorry, no detailed breakdown data to show for {end_year} with these filters."))
 
 
 # TAB 5: Salary Trend
 with tab5:
-    # Create new dataframe
-    filtered_data2 = df2.copy()
-
-    if "All" not in selected_gender:
-        filtered_data2 = filtered_data2[filtered_data2["gender"].isin(selected_gender)]
-
-    if "All Occupations" not in selected_jobs:
-        filtered_data2 = filtered_data2[filtered_data2["occupation"].isin(selected_jobs)]
-
-    # Convert selected year columns to numbers
-    selected_year_cols2 = []
-
-    for year in filtered_data2["year"]:
-        if year >= year_min and year <= year_max:
-            selected_year_cols2.append(int(year))
-
+    selected_year_cols2 = summary["salary_years"]
 
-    if not selected_year_cols2: st.info("Please set your filters."); st.stop()
+    if not selected_year_cols2: st.info("Please set your filters."); stop()
     year_min_sal = min(selected_year_cols2)
     year_max_sal = max(selected_year_cols2)
 
@@ -682,58 +585,19 @@ with tab5:
             """
         )
     st.subheader(f"Snapshot of Salary by Industry ({year_max_sal})")
-    sal_snapshot = filtered_data2[filtered_data2["year"]==year_max_sal].groupby("occupation")["value"].mean().sort_values(ascending=False).reset_index()
-    sal_snapshot.columns = ['occupation', 'value']
-    sal_snapshot = sal_snapshot.rename(columns={
-        "occupation": "Occupation",
-        "value": "Gross Monthly Income"})
-
-    fig_bar = px.bar(sal_snapshot, x='Occupation', y='Gross Monthly Income', 
-                     title=f"<b>Gross Monthly Income by Occupation in {year_max_sal}</b>",
-                     color='Occupation', text_auto='.2s')
-    fig_bar.update_traces(textposition='outside', cliponaxis=False)
-    st.plotly_chart(fig_bar, use_container_width=True)
-
-    # Salary by occupation in most recent year, broken down by gender
-    rank_m = filtered_data2[filtered_data2["gender"] == "Male"]
-    rank_f = filtered_data2[filtered_data2["gender"] == "Female"]
-
-    # Merge & calculate gender salary gap
-    salary_gap = rank_m.merge(rank_f, how='left', on=('occupation','year'), suffixes=('_m', '_f'))
-    salary_gap["gap"] = salary_gap["value_m"] - salary_gap["value_f"]
+    show_chart(charts.fig_salary_bar)
 
     ### Current salary gap chart
-    gap_snapshot = salary_gap[salary_gap["year"]==year_max_sal].groupby(["occupation","year"])["gap"].mean().sort_values(ascending=False).reset_index()
-    gap_snapshot = gap_snapshot.rename(columns={
-        "occupation": "Occupation",
-        "gap": "Monthly Income Gap"})
-
-    fig_bar = px.bar(gap_snapshot, x='Occupation', y='Monthly Income Gap', 
-                     title=f"<b>Gender Monthly Income Gap by Occupation in {year_max_sal} (Men − Women)</b>",
-                     color='Occupation', text_auto='.2s')
-    fig_bar.update_traces(textposition='outside', cliponaxis=False)
-    st.plotly_chart(fig_bar, use_container_width=True)
+    show_chart(charts.fig_salary_gap)
 
     st.divider()
 
     ### Salary trend over the years chart
     st.subheader(f"Salary Trends by Occupation ({year_min_sal}–{year_max_sal})")
-    sal_trend = filtered_data2[filtered_data2["year"].isin(selected_year_cols2)].groupby(["occupation","year"])["value"].mean().reset_index()
-    
-    fig_line = px.line(sal_trend, x="year", y="value", color = "occupation",
-                       title="<b>Year-over-Year Salary Trends by Occupation</b>", markers=True)
-    fig_line.update_layout(xaxis_title="Year", yaxis_title="Gross Monthly Income", legend_title_text='Occupation')
-    fig_line.update_traces(cliponaxis=False) 
-    st.plotly_chart(fig_line, use_container_width=True)
+    show_chart(charts.fig_salary_trend)
 
     ### Salary gap over the years chart
-    gap_trend = salary_gap[salary_gap["year"].isin(selected_year_cols2)].groupby(["occupation","year"])["gap"].mean().reset_index()
-    
-    fig_line = px.line(gap_trend, x="year", y="gap", color = "occupation",
-                       title="<b>Year-over-Year Gender Salary Gap Trends by Occupation (Men − Women)</b>", markers=True)
-    fig_line.update_layout(xaxis_title="Year", yaxis_title="Monthly Income Gap", legend_title_text='Occupation')
-    fig_line.update_traces(cliponaxis=False) 
-    st.plotly_chart(fig_line, use_container_width=True)
+    show_chart(charts.fig_salary_gap_trend)
 
 # TAB 6: Unemployment Trend
 with tab6:
@@ -743,37 +607,7 @@ with tab6:
 
     # Chart 1: Overall Unemployment Trend
     st.subheader(f"Overall Unemployment Trend ({year_min}–{year_max})")
-
-    df_total_trend = df_age[
-        (df_age["Age Group"] == "Total") &
-        (df_age["Year"] >= year_min) &
-        (df_age["Year"] <= year_max)
-    ].sort_values("Year")
-
-    if not df_total_trend.empty:
-        fig_overall = go.Figure()
-        fig_overall.add_trace(go.Scatter(
-            x=df_total_trend["Year"], y=df_total_trend["Unemployment"],
-            mode='lines+markers', name='Unemployment Rate',
-            line=dict(color='#e74c3c', width=3),
-            marker=dict(size=8, color='#e74c3c', line=dict(width=1, color='white')),
-            fill='tozeroy', fillcolor='rgba(231, 76, 60, 0.2)'
-        ))
-        events = {2003: "SARS Pandemic", 2008: "Global Financial Crisis", 2020: "COVID-19 Pandemic"}
-        for year, text in events.items():
-            if year in df_total_trend["Year"].values:
-                unemployment_value = df_total_trend[df_total_trend["Year"] == year]["Unemployment"].iloc[0]
-                fig_overall.add_annotation(
-                    x=year, y=unemployment_value, text=text,
-                    showarrow=True, arrowhead=2, ax=0, ay=-40
-                )
-        fig_overall.update_layout(
-            xaxis_title="Year", yaxis_title="Unemployment Rate (%)", height=500,
-            hovermode="x unified", showlegend=False
-        )
-        st.plotly_chart(fig_overall, use_container_width=True)
-    else:
-        st.warning("No overall unemployment data is available for the selected year range.")
+    show_chart(charts.fig_overall, missing=lambda: st.warning("No overall unemployment data is available for the selected year range."))
     st.divider()
 
     # Combined Row for Second and Third Charts
@@ -783,53 +617,16 @@ with tab6:
 
     # Chart 2: Unemployment by Age Group (with labels)
     with col1:
-        df_age_latest = df_age[df_age["Year"] == year_max].copy()
-        target_age_groups = ["15 - 24", "25 - 29", "30 - 39", "40 - 49", "50 - 59", "60 & Over"]
-        df_age_latest = df_age_latest[df_age_latest["Age Group"].isin(target_age_groups)]
-
-        if not df_age_latest.empty:
-            df_age_latest["Age Group"] = pd.Categorical(df_age_latest["Age Group"], categories=target_age_groups, ordered=True)
-            df_age_latest = df_age_latest.sort_values("Age Group")
-
-            fig_age_dist = go.Figure()
-            # Add bar trace with text labels
-            fig_age_dist.add_trace(go.Bar(
-                x=df_age_latest["Age Group"], y=df_age_latest["Unemployment"],
-                marker_color=px.colors.sequential.Viridis, name="Unemployment Rate",
-                text=df_age_latest["Unemployment"], texttemplate='%{text:.1f}%', textposition='outside'))
-            # Add line trace
-            fig_age_dist.add_trace(go.Scatter(
-                x=df_age_latest["Age Group"], y=df_age_latest["Unemployment"],
-                mode='lines+markers', line=dict(color='navy', width=3),
-                marker=dict(size=12, color='white', line=dict(width=2.5, color='navy')),
-                name="Trend Line"))
-            fig_age_dist.update_layout(
-                title="By Age Group", xaxis_title=None,
-                yaxis_title="Unemployment Rate (%)", height=450, showlegend=False,
-                uniformtext_minsize=8, uniformtext_mode='hide')
-            st.plotly_chart(fig_age_dist, use_container_width=True)
-        else:
-            st.info(f"No age group breakdown is available for {year_max}.")
+        show_chart(charts.fig_age_dist, missing=lambda: st.info(f"No age group breakdown is available for {year_max}."))
 
     # Chart 3: Unemployment by Qualification (with labels)
     with col2:
-        df_qual_latest = df_qual[df_qual["Year"] == year_max]
-
-        if not df_qual_latest.empty:
-            df_chart_data = df_qual_latest.sort_values("Unemployment", ascending=True)
-            # Add text_auto to create labels
-            fig_qual_bar = px.bar(
-                df_chart_data, x="Unemployment", y="Highest Qualification",
-                orientation='h', color="Unemployment",
-                color_continuous_scale="RdYlGn_r", title="By Qualification",
-                text_auto='.1f')
-            # Position the text outside the bars
-            fig_qual_bar.update_traces(textposition='outside')
-            fig_qual_bar.update_layout(
-                height=450, showlegend=False,
-                xaxis_title="Unemployment Rate (%)", yaxis_title=None)
-            st.plotly_chart(fig_qual_bar, use_container_width=True)
-        else:
-            st.info(f"No qualification breakdown is available for {year_max}.")
+        show_chart(charts.fig_qual_bar, missing=lambda: st.info(f"No qualification breakdown is available for {year_max}."))
     
-    st.divider()
\ No newline at end of file
+    st.divider()
+
+# Fill in the charts, start on the neighbouring year ranges, then save and show the
+# timings of this rerun
+fill_charts()
+speculate()
+profiling.finish_run()
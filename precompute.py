@@ -0,0 +1,126 @@
+# Speculative precomputation for the year range slider
+#
+# Moving the "Pick Year Range" slider is the most common action on the dashboard, and it
+# usually ends one step away from where it started. After every rerun the dashboard asks
+# speculate() to build the summary and charts of the neighbouring ranges (year_min +/- 1,
+# year_max +/- 1) on a small background thread pool, so when the slider settles on one of
+# them the results are already in the cache.
+#
+# The cache is shared by every session of the server process and keeps the most recently
+# used results (CACHE_SIZE of them). Keys must identify the result completely: the
+# dashboard uses the builder name and the values of the filters it reads.
+# Results are also kept on disk (see disk_cache.py), so a result computed before a restart
+# is read back instead of computed again, and the cache of a new server process is warmed
+# in the background with the most recently used results on disk.
+# Set SG_SPECULATE=0 to turn the background work off (the cache is still used).
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import streamlit as st
+
+import disk_cache
+
+ENABLED = os.environ.get("SG_SPECULATE", "1") not in ("", "0")
+CACHE_SIZE = 512
+WORKERS = 2
+
+
+# Thread pool, lock and cache of the server process. The cache maps a key to a Future,
+# so a result being computed in the background can be waited for instead of built again.
+@st.cache_resource
+def get_state():
+    state = {
+        "pool": ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="precompute"),
+        "lock": threading.Lock(),
+        "cache": OrderedDict()}
+    state["pool"].submit(warm, state)
+    return state
+
+
+def remember(state, key, future):
+    state["cache"][key] = future
+    state["cache"].move_to_end(key)
+    while len(state["cache"]) > CACHE_SIZE:
+        state["cache"].popitem(last=False)
+
+
+def done(value):
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+# Fill the cache with the most recently used results on disk, leaving the keys already
+# computed by this process alone
+def warm(state):
+    for key, body in reversed(disk_cache.warm("dashboard", CACHE_SIZE)):
+        value = disk_cache.decode(body)
+        with state["lock"]:
+            if key not in state["cache"]:
+                remember(state, key, done(value))
+
+
+# Read a result from the disk cache, or compute it and write it there
+def produce(key, compute):
+    body = disk_cache.load("dashboard", key)
+    if body is not None:
+        return disk_cache.decode(body)
+    value = compute()
+    disk_cache.store("dashboard", key, lambda: disk_cache.encode(value))
+    return value
+
+
+# Get a result from the cache, or compute it here and keep it
+def get(key, compute):
+    state = get_state()
+    with state["lock"]:
+        future = state["cache"].get(key)
+        if future is not None and not future.cancelled():
+            state["cache"].move_to_end(key)
+        else:
+            future = None
+
+    # Wait for a background result; if it failed, compute again here so the error shows
+    if future is not None:
+        try:
+            return future.result()
+        except Exception:
+            pass
+
+    value = produce(key, compute)
+    with state["lock"]:
+        remember(state, key, done(value))
+    return value
+
+
+# Queue (key, compute) jobs on the thread pool, skipping keys already in the cache.
+# Jobs queued by the previous rerun of the session (previous) and not started yet are
+# cancelled first, because the slider has moved on. Returns the futures of the new jobs.
+def speculate(jobs, previous=()):
+    state = get_state()
+    with state["lock"]:
+        for key, future in previous:
+            if future.cancel() and state["cache"].get(key) is future:
+                del state["cache"][key]
+        if not ENABLED:
+            return []
+
+        queued = []
+        for key, compute in jobs:
+            if key in state["cache"]:
+                continue
+            future = state["pool"].submit(produce, key, compute)
+            remember(state, key, future)
+            queued.append((key, future))
+    return queued
+
+
+# Filter states one step of the year slider away from filters, inside year_list
+def neighbour_ranges(filters, year_list):
+    lo = year_list.index(filters["year_min"])
+    hi = year_list.index(filters["year_max"])
+    for new_lo, new_hi in [(lo, hi - 1), (lo + 1, hi), (lo, hi + 1), (lo - 1, hi)]:
+        if 0 <= new_lo <= new_hi < len(year_list):
+            yield dict(filters, year_min=year_list[new_lo], year_max=year_list[new_hi])
@@ -0,0 +1,127 @@
+# Time the stages of one dashboard rerun (load, transform, chart build, render)
+#
+# Turn it on with the SG_PROFILE=1 environment variable, for example:
+#   SG_PROFILE=1 streamlit run interactive_dashboard.py
+#
+# Every rerun then records a list of spans (name, stage, start, duration, nesting depth),
+# shows them in a "Rerun timings" panel in the sidebar and appends them as one JSON line
+# to profile_log.jsonl (or the file in SG_PROFILE_LOG).
+#
+# When it is off, traced() gives back the undecorated function and span() gives back
+# one shared do-nothing context manager, so the dashboards run as before.
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from functools import wraps
+
+ENABLED = os.environ.get("SG_PROFILE", "") not in ("", "0")
+LOG_PATH = os.environ.get("SG_PROFILE_LOG") or os.path.join(os.path.dirname(os.path.abspath(__file__)), "profile_log.jsonl")
+
+# Stages shown in the panel, in pipeline order
+STAGES = ["load", "transform", "chart", "render", "slide"]
+
+NO_SPAN = nullcontext()
+
+# Streamlit runs every session's script in its own thread, so each thread keeps its own run
+state = threading.local()
+
+
+# Start recording a new rerun of a script
+def start_run(script):
+    if not ENABLED:
+        return
+    state.run = {"script": script, "start": time.perf_counter(), "spans": []}
+    state.depth = 0
+
+
+# Time a block of code as one span of the current run
+def span(name, stage):
+    if not ENABLED or getattr(state, "run", None) is None:
+        return NO_SPAN
+    return record_span(name, stage)
+
+
+@contextmanager
+def record_span(name, stage):
+    run = state.run
+    entry = {"name": name, "stage": stage, "depth": state.depth}
+    run["spans"].append(entry)
+    state.depth += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        state.depth -= 1
+        entry["start_ms"] = (start - run["start"]) * 1000
+        entry["ms"] = (end - start) * 1000
+
+
+# Decorator that times every call of a function as a span
+def traced(stage, name=None):
+    def decorate(func):
+        if not ENABLED:
+            return func
+        span_name = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name, stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+# Time spent in a span without the spans nested inside it
+def self_times(spans):
+    result = []
+    for i, entry in enumerate(spans):
+        children = 0.0
+        for child in spans[i + 1:]:
+            if child["depth"] <= entry["depth"]:
+                break
+            if child["depth"] == entry["depth"] + 1:
+                children += child.get("ms", 0.0)
+        result.append(entry.get("ms", 0.0) - children)
+    return result
+
+
+# Stop recording, write the run to the log and show the panel
+def finish_run(show_panel=True):
+    run = getattr(state, "run", None)
+    if not ENABLED or run is None:
+        return None
+    state.run = None
+    run["total_ms"] = (time.perf_counter() - run.pop("start")) * 1000
+    run["time"] = datetime.now().isoformat(timespec="seconds")
+
+    with open(LOG_PATH, "a", encoding="utf-8") as f:
+        f.write(json.dumps(run) + "\n")
+    if show_panel:
+        render_panel(run)
+    return run
+
+
+# Sidebar panel with the total per stage and every span of the rerun
+def render_panel(run):
+    import pandas as pd
+    import streamlit as st
+
+    spans = run["spans"]
+    table = pd.DataFrame({
+        "span": ["  " * s["depth"] + s["name"] for s in spans],
+        "stage": [s["stage"] for s in spans],
+        "start (ms)": [round(s.get("start_ms", 0.0), 1) for s in spans],
+        "time (ms)": [round(s.get("ms", 0.0), 1) for s in spans],
+        "self (ms)": [round(t, 1) for t in self_times(spans)]})
+
+    with st.sidebar.expander("⏱️ Rerun timings", expanded=False):
+        st.metric("Total rerun time", f"{run['total_ms']:,.0f} ms")
+        by_stage = table.groupby("stage")["self (ms)"].sum()
+        st.dataframe(by_stage.reindex([s for s in STAGES if s in by_stage.index]).reset_index(),
+                     hide_index=True, use_container_width=True)
+        st.dataframe(table, hide_index=True, use_container_width=True)
+        st.caption(f"Also written to {LOG_PATH}")
@@ -0,0 +1,200 @@
+# Rollups of the industry x occupation table along explicit dimension hierarchies
+#
+# "Industry and Occupation.csv" mixes leaf rows with aggregate rows ("All Industries",
+# "Services", the "All Occupation Groups" total of every industry). Instead of dropping
+# the aggregates by hand, the table is split into:
+#   leaves   one value per leaf industry x leaf occupation x year
+#   totals   the published total of every leaf industry (all occupations) per year
+# and the totals of any level are added up from these with precomputed group indexes.
+# The published industry totals are used for "all occupations" because they also count
+# the occupations that are not published on their own (and the years without any
+# occupation detail), so the occupation leaves don't always add up to them.
+#
+# Hierarchies, from the top level down (see HIERARCHIES):
+#   industry     sector > industry, the sectors being "Services" and the ones of SECTORS
+#   occupation   occupation (the data has no level below the occupation groups)
+#
+# The engine of a data store is built once and cached (see get_engine). Chart builders
+# ask for one level of each dimension, optionally inside one node of the level above
+# (drill-down), with rollup().
+import threading
+
+import numpy as np
+import pandas as pd
+
+INDUSTRY_TOTAL = "All Industries"
+OCCUPATION_TOTAL = "All Occupation Groups, (Total Employed Residents)"
+
+# Sector of the industries that are not services. The synthetic data of
+# generate_synthetic_data.py splits an industry into sub-industries named after it, which
+# stay in its sector.
+SECTORS = {
+    "Manufacturing": "Goods Producing Industries",
+    "Construction": "Goods Producing Industries",
+    "Other Industries Nes": "Other Industries",
+    "Other Occupation Groups Nes": "Other Industries",
+}
+SERVICES = "Services"
+
+
+def sector_of(industry):
+    for name, sector in SECTORS.items():
+        if industry.startswith(name):
+            return sector
+    return SERVICES
+
+
+# Levels of each dimension from the top down. Each level but the last gives the parent of
+# a node of the level below it. aggregates are the labels of the column that are not leaves.
+HIERARCHIES = {
+    "industry": {
+        "column": "industry",
+        "aggregates": [INDUSTRY_TOTAL, SERVICES],
+        "levels": ["sector", "industry"],
+        "parent": {"sector": sector_of}},
+    "occupation": {
+        "column": "occupation",
+        "aggregates": [OCCUPATION_TOTAL],
+        "levels": ["occupation"],
+        "parent": {}},
+}
+
+
+# Dense cube of a table: one axis per label column (labels in the order they are first
+# found) plus a last axis for the value columns. Cells without a row are NaN, and rows
+# with the same labels are added up. Returns the cube and the labels of each axis.
+def to_cube(labels, values):
+    codes, levels = zip(*(pd.factorize(labels[column]) for column in labels.columns))
+    shape = tuple(len(level) for level in levels)
+    flat = np.ravel_multi_index(codes, shape)
+    cube = np.full((np.prod(shape), values.shape[1]), np.nan)
+    if np.bincount(flat, minlength=cube.shape[0]).max(initial=0) <= 1:
+        cube[flat] = values
+    else:
+        sums = np.zeros_like(cube)
+        np.add.at(sums, flat, np.nan_to_num(values))
+        present = np.zeros_like(cube, dtype=bool)
+        np.logical_or.at(present, flat, np.isfinite(values))
+        cube = np.where(present, sums, np.nan)
+    return cube.reshape(shape + (values.shape[1],)), [np.asarray(level, dtype=object) for level in levels]
+
+
+# Group index of every level of a dimension: level -> (node of every leaf, node labels).
+# Nodes are in the order their first leaf is found.
+def group_indexes(hierarchy, leaves):
+    indexes = {hierarchy["levels"][-1]: (np.arange(len(leaves)), leaves)}
+    labels = pd.Series(leaves, dtype=object)
+    for level in reversed(hierarchy["levels"][:-1]):
+        labels = labels.map(hierarchy["parent"][level])
+        codes, nodes = pd.factorize(labels)
+        indexes[level] = (codes, np.asarray(nodes, dtype=object))
+    return indexes
+
+
+def build_engine(df):
+    industry = HIERARCHIES["industry"]
+    occupation = HIERARCHIES["occupation"]
+    rows = ~df[industry["column"]].isin(industry["aggregates"])
+    is_total = df[occupation["column"]].isin(occupation["aggregates"])
+
+    # Leaf cells and the published total of every leaf industry, on the same industry axis
+    years = np.asarray(pd.unique(df["year"]))
+    industries = np.asarray(pd.unique(df.loc[rows, industry["column"]]), dtype=object)
+    leaf_rows = df[rows & ~is_total]
+    cube, (cube_industries, occupations, cube_years) = to_cube(
+        leaf_rows[[industry["column"], occupation["column"], "year"]], leaf_rows[["employment"]].to_numpy(dtype="float64"))
+    # Put the leaves on the industry and year axes of the totals
+    at_industry = pd.Index(cube_industries).get_indexer(industries)
+    at_year = pd.Index(cube_years).get_indexer(years)
+    leaves = np.full((len(industries), len(occupations), len(years)), np.nan)
+    leaves[np.ix_(at_industry >= 0, np.ones(len(occupations), dtype=bool), at_year >= 0)] = \
+        cube[at_industry[at_industry >= 0]][:, :, at_year[at_year >= 0], 0]
+
+    total_rows = df[rows & is_total]
+    totals = total_rows.pivot_table(index=industry["column"], columns="year", values="employment", aggfunc="sum")
+    totals = totals.reindex(index=industries, columns=years).to_numpy(dtype="float64")
+
+    return {
+        "years": years, "leaves": leaves, "totals": totals,
+        "industry": group_indexes(industry, industries),
+        "occupation": group_indexes(occupation, occupations)}
+
+
+# Add up the rows of a matrix (along axis) by group: NaN where a group has no value
+def group_sum(values, codes, n_groups, axis):
+    one_hot = np.zeros((n_groups, len(codes)))
+    one_hot[codes, np.arange(len(codes))] = 1.0
+    moved = np.moveaxis(values, axis, 0)
+    sums = np.tensordot(one_hot, np.nan_to_num(moved), axes=1)
+    counts = np.tensordot(one_hot, np.isfinite(moved).astype("float64"), axes=1)
+    sums[counts == 0] = np.nan
+    return np.moveaxis(sums, 0, axis)
+
+
+# Level above another one in a dimension, or None at the top
+def parent_level(dimension, level):
+    levels = HIERARCHIES[dimension]["levels"]
+    position = levels.index(level)
+    return levels[position - 1] if position > 0 else None
+
+
+# Leaves of one dimension inside a node of a level (all leaves when node is None)
+def leaves_in(engine, dimension, level, node):
+    if node is None:
+        leaf_codes, _ = engine[dimension][HIERARCHIES[dimension]["levels"][-1]]
+        return np.ones(len(leaf_codes), dtype=bool)
+    codes, nodes = engine[dimension][level]
+    return np.isin(codes, np.flatnonzero(nodes == node))
+
+
+# Employment at one level of each dimension, one row per node (and year):
+#   industry_level     a level of HIERARCHIES["industry"]
+#   occupation_level   a level of HIERARCHIES["occupation"], or None for all occupations
+#   industry_node / occupation_node
+#                      keep only the nodes inside this node of the level above (drill-down)
+#   years              years to keep (all by default)
+# Rows come out with the years in the order of the table, then the occupations, then the
+# industries, in the order they are first found; cells without any value are left out.
+def rollup(engine, industry_level, occupation_level=None, industry_node=None, occupation_node=None, years=None):
+    year_mask = np.ones(len(engine["years"]), dtype=bool) if years is None else np.isin(engine["years"], years)
+    industry_mask = leaves_in(engine, "industry", parent_level("industry", industry_level), industry_node)
+    industry_codes, industry_nodes = engine["industry"][industry_level]
+
+    if occupation_level is None:
+        values = engine["totals"][industry_mask][:, None, year_mask]
+        occupation_nodes = np.array([OCCUPATION_TOTAL], dtype=object)
+    else:
+        occupation_mask = leaves_in(engine, "occupation", parent_level("occupation", occupation_level), occupation_node)
+        occupation_codes, occupation_nodes = engine["occupation"][occupation_level]
+        values = engine["leaves"][industry_mask][:, occupation_mask][:, :, year_mask]
+        values = group_sum(values, occupation_codes[occupation_mask], len(occupation_nodes), axis=1)
+    values = group_sum(values, industry_codes[industry_mask], len(industry_nodes), axis=0)
+
+    # (industry, occupation, year) -> rows ordered by year, occupation, industry
+    values = values.transpose(2, 1, 0)
+    year_index, occupation_index, industry_index = np.nonzero(np.isfinite(values))
+    return pd.DataFrame({
+        "occupation": occupation_nodes[occupation_index],
+        "industry": industry_nodes[industry_index],
+        "year": engine["years"][year_mask][year_index],
+        "employment": values[year_index, occupation_index, industry_index]})
+
+
+# Cached engine: (source DataFrame, engine). The DataFrame is kept to make sure the engine
+# belongs to the data store it is asked for. Charts are also built on background threads
+# (precompute.py), hence the lock.
+cached_engine = {}
+engine_lock = threading.Lock()
+
+
+def get_engine(data):
+    source = data["industry_occupation"]
+    with engine_lock:
+        cached = cached_engine.get("engine")
+        if cached is not None and cached[0] is source:
+            return cached[1]
+
+    engine = build_engine(source)
+    with engine_lock:
+        cached_engine["engine"] = (source, engine)
+    return engine
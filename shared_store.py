@@ -0,0 +1,95 @@
+# Read-only memory-mapped data store shared by every process on the host
+#
+# When several Streamlit server processes run behind a load balancer, each one used to
+# read the CSV files into its own DataFrames. With SG_SHARED_STORE=1 (see data_store.py)
+# the data store is written once as uncompressed Arrow IPC files, one per dataset, and
+# every process memory-maps them. The DataFrames point straight into the mapped files, so
+# the operating system keeps a single copy in the page cache for all the processes.
+#
+# The files live in .data_store/<fingerprint>/ (or SG_STORE_DIR), where the fingerprint
+# comes from the name, size and modification time of the CSV files, so the store is
+# rebuilt when a CSV changes. The mapped DataFrames are read-only: take a .copy() before
+# changing one.
+#
+# Needs pyarrow.
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import pandas as pd
+import pyarrow as pa
+
+# Bump this when the file layout changes, so old stores are not reused
+STORE_VERSION = 1
+
+
+def get_store_root():
+    return os.environ.get("SG_STORE_DIR") or os.path.join(os.path.dirname(os.path.abspath(__file__)), ".data_store")
+
+
+# Fingerprint of the CSV files the store is built from
+def fingerprint(data_dir, files):
+    h = hashlib.sha1(f"v{STORE_VERSION}".encode())
+    for file_name in sorted(files.values()):
+        stat = os.stat(os.path.join(data_dir, file_name))
+        h.update(f"{file_name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return h.hexdigest()[:16]
+
+
+# Convert a DataFrame to an Arrow table that can be read back without copying.
+# Number columns keep NaN as NaN (not as Arrow nulls), so pandas can use the mapped buffer as is.
+def to_arrow(df):
+    arrays = []
+    for c in df.columns:
+        if df[c].dtype.kind in "fiub":
+            arrays.append(pa.array(df[c].to_numpy(), from_pandas=False))
+        else:
+            arrays.append(pa.Array.from_pandas(df[c]))
+    return pa.Table.from_arrays(arrays, names=[str(c) for c in df.columns])
+
+
+# Write every dataset to its own Arrow file in a new folder, then move the folder into place.
+# If another process finished the same store first, keep theirs.
+def build_store(data, store_dir):
+    root = os.path.dirname(store_dir)
+    os.makedirs(root, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(dir=root, prefix=".building-")
+    try:
+        names = []
+        for name, value in data.items():
+            if isinstance(value, pd.DataFrame):
+                table = to_arrow(value)
+                with pa.OSFile(os.path.join(tmp_dir, f"{name}.arrow"), "wb") as f:
+                    with pa.ipc.new_file(f, table.schema) as writer:
+                        writer.write_table(table)
+                names.append(name)
+        with open(os.path.join(tmp_dir, "meta.json"), "w") as f:
+            json.dump({"datasets": names, "year_list": data["year_list"]}, f)
+        os.rename(tmp_dir, store_dir)
+    except OSError:
+        if not os.path.exists(os.path.join(store_dir, "meta.json")):
+            raise
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+# Map the store folder and wrap every dataset in a DataFrame without copying
+def open_store(store_dir):
+    with open(os.path.join(store_dir, "meta.json")) as f:
+        meta = json.load(f)
+    data = {}
+    for name in meta["datasets"]:
+        source = pa.memory_map(os.path.join(store_dir, f"{name}.arrow"), "r")
+        data[name] = pa.ipc.open_file(source).read_all().to_pandas(split_blocks=True)
+    data["year_list"] = meta["year_list"]
+    return data
+
+
+# Load the data store from the shared files, building them first if needed
+def load_store(data_dir, files, read_data):
+    store_dir = os.path.join(get_store_root(), fingerprint(data_dir, files))
+    if not os.path.exists(os.path.join(store_dir, "meta.json")):
+        build_store(read_data(data_dir), store_dir)
+    return open_store(store_dir)
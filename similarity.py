@@ -0,0 +1,172 @@
+# Similarity search over employment trajectories
+#
+# Every series of the data store is a trajectory over the selected years:
+#   employment            one series per Sex x Age Group x Occupation row
+#   industry_occupation   one series per industry x occupation cell
+# Trajectories are z-normalized (mean 0, standard deviation 1 over the years), so two
+# series are close when their ups and downs have the same shape, whatever their size. The
+# squared distance of two normalized series of T years is 2 * T * (1 - correlation), and
+# the results report the correlation. Series with a missing year in the window, that start
+# at zero or that never change are left out.
+#
+# The index of a year window (see get_index) holds the normalized matrix and:
+#   clusters    N_CLUSTERS k-means clusters of trajectory shapes
+#   lists       with more than EXACT_LIMIT series, an inverted file of about sqrt(n)
+#               k-means lists: a query only looks at the series of its NPROBE nearest
+#               lists (approximate). Below the limit every query is exact.
+# Distances are computed as matrix products (|a|^2 + |b|^2 - 2 a.b) in blocks of BLOCK rows.
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+import forecasting
+import rollups
+
+SOURCES = {"employment": "Occupation", "industry_occupation": "occupation"}
+# Totals over every occupation are not careers of their own
+TOTAL_OCCUPATIONS = ["All Occupations", rollups.OCCUPATION_TOTAL]
+MIN_YEARS = 4
+N_CLUSTERS = 8
+KMEANS_ITERATIONS = 20
+SEED = 0
+EXACT_LIMIT = 50000
+NPROBE = 8
+BLOCK = 4096
+
+CACHE_SIZE = 16
+
+
+# Squared distances between the rows of a and the rows of b
+def distances(a, b):
+    d = (a ** 2).sum(axis=1)[:, None] + (b ** 2).sum(axis=1)[None, :] - 2 * a @ b.T
+    return np.maximum(d, 0.0)
+
+
+# Position of the nearest centroid of every row, a block of rows at a time
+def nearest(x, centroids):
+    return np.concatenate([distances(x[i:i + BLOCK], centroids).argmin(axis=1) for i in range(0, len(x), BLOCK)])
+
+
+# k-means clustering of the rows of x: (centroids, cluster of every row)
+def kmeans(x, k):
+    rng = np.random.default_rng(SEED)
+    k = min(k, len(x))
+    centroids = x[rng.choice(len(x), size=k, replace=False)]
+    for _ in range(KMEANS_ITERATIONS):
+        labels = nearest(x, centroids)
+        counts = np.bincount(labels, minlength=k)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, x)
+        # A cluster that lost all its rows keeps its centroid
+        centroids = np.where(counts[:, None] > 0, sums / np.maximum(counts, 1)[:, None], centroids)
+    return centroids, nearest(x, centroids)
+
+
+# Labels of the series of a series index, joined with " | "
+def series_labels(index):
+    levels = index.to_frame(index=False)
+    labels = levels.iloc[:, 0].astype(str)
+    for column in levels.columns[1:]:
+        labels = labels + " | " + levels[column].astype(str)
+    return labels.to_numpy()
+
+
+# Normalized trajectories of every series over the years of the data store between
+# year_min and year_max (a series without one of those years is left out)
+def trajectories(data, year_min, year_max):
+    years = [year for year in data["year_list"] if year_min <= year <= year_max]
+    tables, matrices = [], []
+    for name, occupation_level in SOURCES.items():
+        index, source_years, values = forecasting.series_matrix(data, name)
+        matrices.append(pd.DataFrame(values, columns=source_years).reindex(columns=years).to_numpy(dtype="float64"))
+        tables.append(pd.DataFrame({
+            "dataset": name,
+            "series": series_labels(index),
+            "occupation": index.get_level_values(occupation_level).astype(str)}))
+
+    table = pd.concat(tables, ignore_index=True)
+    values = np.concatenate(matrices)
+    with np.errstate(invalid="ignore"):
+        std = values.std(axis=1)
+    keep = np.isfinite(values).all(axis=1) & (std > 0) & (values[:, 0] != 0)
+    values = values[keep]
+    normalized = (values - values.mean(axis=1)[:, None]) / std[keep][:, None]
+    return table[keep].reset_index(drop=True), years, values, normalized
+
+
+def build_index(data, year_min, year_max):
+    table, years, values, normalized = trajectories(data, year_min, year_max)
+    if len(years) < MIN_YEARS or len(table) == 0:
+        return None
+
+    centroids, clusters = kmeans(normalized, N_CLUSTERS)
+    table["cluster"] = clusters
+    index = {
+        "table": table, "values": values, "normalized": normalized,
+        "years": years, "centroids": centroids, "lists": None}
+    if len(table) > EXACT_LIMIT:
+        list_centroids, members = kmeans(normalized, int(np.sqrt(len(table))))
+        index["lists"] = {"centroids": list_centroids, "members": [np.flatnonzero(members == i) for i in range(len(list_centroids))]}
+    return index
+
+
+# Cached indexes: year window -> (source DataFrames, index). The DataFrames are kept to make
+# sure the index belongs to the data store it is asked for. Charts are also built on
+# background threads (precompute.py), hence the lock.
+indexes = OrderedDict()
+indexes_lock = threading.Lock()
+
+
+def get_index(data, year_min, year_max):
+    key = (year_min, year_max)
+    sources = [data[name] for name in SOURCES]
+    with indexes_lock:
+        cached = indexes.get(key)
+        if cached is not None and all(a is b for a, b in zip(cached[0], sources)):
+            indexes.move_to_end(key)
+            return cached[1]
+
+    index = build_index(data, year_min, year_max)
+    with indexes_lock:
+        indexes[key] = (sources, index)
+        while len(indexes) > CACHE_SIZE:
+            indexes.popitem(last=False)
+    return index
+
+
+# The k series nearest to the series at position row, leaving out the rows where skip is
+# True: (positions, squared distances), nearest first
+def neighbours(index, row, k, skip=None):
+    x = index["normalized"]
+    query = x[row:row + 1]
+    if index["lists"] is None:
+        candidates = np.arange(len(x))
+    else:
+        lists = index["lists"]
+        probe = distances(query, lists["centroids"])[0].argsort()[:NPROBE]
+        candidates = np.concatenate([lists["members"][i] for i in probe])
+
+    candidates = candidates[candidates != row]
+    if skip is not None:
+        candidates = candidates[~skip[candidates]]
+    d = distances(query, x[candidates])[0]
+    order = np.argsort(d, kind="stable")[:k]
+    return candidates[order], d[order]
+
+
+# Series with the trajectories nearest to the employment of an occupation (everyone, all
+# ages), other than the series of that occupation itself and the totals. None when the occupation has no
+# trajectory in the window.
+def similar_occupations(index, occupation, k):
+    table = index["table"]
+    query = np.flatnonzero(
+        (table["dataset"] == "employment") & (table["series"] == f"All | All Ages | {occupation}"))
+    if len(query) == 0:
+        return None
+    skip = table["occupation"].isin(TOTAL_OCCUPATIONS + [occupation]).to_numpy()
+    rows, d = neighbours(index, query[0], k, skip=skip)
+    hits = table.iloc[rows].reset_index(drop=True)
+    hits["correlation"] = 1 - d / (2 * index["normalized"].shape[1])
+    return {"query": query[0], "rows": rows, "hits": hits}
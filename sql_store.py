@@ -0,0 +1,195 @@
+# Embedded SQLite copy of the data store, with indexes, for SQL queries
+#
+# Usage: python sql_store.py [data folder] [--sql "SELECT ..."]
+#
+# The build step writes every dataset of the data store to one SQLite file:
+#   <dataset>         one table per dataset of data_store.FILES, with the same columns and
+#                     rows (in the same order, as rowid) as the DataFrame
+#   employment_long   the employment cube with one row per Sex x Age Group x Occupation x
+#                     Year (the years without a value are left out), for SQL over the years
+#   meta              the list of years and the dtypes of every dataset
+# plus the indexes of INDEXES for the lookups the dashboards and analysts do. The datasets
+# are validated as they are read (see validation.py), so the file only holds checked data.
+#
+# The file is .data_store/<fingerprint>-sql<version>.sqlite (or in SG_STORE_DIR), with the
+# fingerprint of the CSV files from shared_store.py, so it is built again when a CSV changes
+# and never changed after it is built. Every process opens it read-only and shares it
+# through the page cache. Without --sql the command only builds the file (when needed) and
+# prints its path; with --sql it also runs the query and prints the rows, without reading
+# the CSVs again when the file is already there.
+#
+# With SG_SQL_STORE=1, data_store.load_data attaches the database to the data store (as
+# data["database"]) and the row filters of charts.py (filter_employment, filter_salary,
+# unemployment_trend) become indexed SQL queries. The DataFrames are still loaded as usual:
+# reading whole tables back from SQLite is slower than the CSV and Arrow readers.
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+
+import pandas as pd
+
+from shared_store import fingerprint, get_store_root
+
+# Bump this when the tables or indexes change, so old files are not reused
+DATABASE_VERSION = 1
+BATCH_ROWS = 100000
+
+# Indexes of every table, as lists of columns
+INDEXES = {
+    "employment": [["Occupation", "Sex", "Age Group"], ["Age Group", "Sex"]],
+    "employment_long": [["Occupation", "Year"], ["Year", "Sex", "Age Group"]],
+    "salary": [["occupation", "gender", "year"], ["year"]],
+    "unemployment_age": [["Age Group", "Year"]],
+    "unemployment_sex": [["Sex", "Category", "Year"]],
+    "unemployment_qual": [["Highest Qualification", "Year"]],
+    "industry_occupation": [["industry", "occupation", "year"], ["occupation", "year"], ["year"]],
+}
+
+# Filters of the salary data (as chart_specs.EMPLOYMENT_FILTERS for the employment data)
+SALARY_FILTERS = [("gender", "gender", "All"), ("occupation", "jobs", "All Occupations")]
+
+
+def quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def database_path(data_dir, files):
+    return os.path.join(get_store_root(), f"{fingerprint(data_dir, files)}-sql{DATABASE_VERSION}.sqlite")
+
+
+# Employment cube with one row per series and year
+def employment_long(data):
+    df = data["employment"]
+    year_cols = [str(year) for year in data["year_list"]]
+    long = df.melt(id_vars=["Sex", "Age Group", "Occupation"], value_vars=year_cols, var_name="Year", value_name="Employment")
+    long["Year"] = long["Year"].astype("int64")
+    return long.dropna(subset=["Employment"])
+
+
+def write_table(con, name, df):
+    df.to_sql(name, con, index=False, chunksize=BATCH_ROWS)
+    for columns in INDEXES.get(name, []):
+        index_name = quote(f"{name}_by_" + "_".join(columns))
+        con.execute(f"CREATE INDEX {index_name} ON {quote(name)} ({', '.join(quote(c) for c in columns)})")
+
+
+# Write the datasets of a data store to a new file, then move it into place. If another
+# process finished the same file first, keep theirs.
+def build_database(data, files, path):
+    root = os.path.dirname(path)
+    os.makedirs(root, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=root, prefix=".building-", suffix=".sqlite")
+    os.close(fd)
+    try:
+        con = sqlite3.connect(tmp_path)
+        try:
+            con.execute("PRAGMA journal_mode = OFF")
+            con.execute("PRAGMA synchronous = OFF")
+            meta = {"year_list": list(data["year_list"]), "dtypes": {}}
+            for name in files:
+                df = data[name]
+                write_table(con, name, df)
+                meta["dtypes"][name] = {str(c): str(dtype) for c, dtype in df.dtypes.items()}
+            write_table(con, "employment_long", employment_long(data))
+            con.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+            con.executemany("INSERT INTO meta VALUES (?, ?)", [(key, json.dumps(value)) for key, value in meta.items()])
+            con.execute("ANALYZE")
+            con.commit()
+        finally:
+            con.close()
+        if os.path.exists(path):
+            return
+        os.chmod(tmp_path, 0o644)
+        os.rename(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+# Path of the database of a data folder, building it first if needed (from the data store
+# data when it is given, otherwise by reading the data folder with read_data)
+def open_database(data_dir, files, data=None, read_data=None):
+    path = database_path(data_dir, files)
+    if not os.path.exists(path):
+        build_database(data if data is not None else read_data(data_dir), files, path)
+    return path
+
+
+# One read-only connection per thread and database: charts are also built on background
+# threads (precompute.py), and a connection can only be used by the thread that opened it
+connections = threading.local()
+
+
+def connect(database):
+    opened = getattr(connections, "opened", None)
+    if opened is None:
+        opened = connections.opened = {}
+    if database not in opened:
+        opened[database] = sqlite3.connect(f"file:{database}?mode=ro&immutable=1", uri=True)
+    return opened[database]
+
+
+# Rows of a SELECT statement as a DataFrame
+def query(database, sql, params=()):
+    return pd.read_sql_query(sql, connect(database), params=list(params))
+
+
+# Meta data of the database: the list of years and the dtypes of every dataset
+def read_meta(database):
+    rows = connect(database).execute("SELECT key, value FROM meta").fetchall()
+    return {key: json.loads(value) for key, value in rows}
+
+
+# Rows of a dataset where every column holds one of its labels (conditions: column ->
+# labels), and optionally a column is inside a range (between: (column, first, last)), as
+# the DataFrame rows of the data store with their index and dtypes
+def select(database, name, conditions, between=None):
+    clauses, params = [], []
+    for column, labels in conditions.items():
+        clauses.append(f"{quote(column)} IN ({', '.join('?' * len(labels))})")
+        params.extend(labels)
+    if between is not None:
+        clauses.append(f"{quote(between[0])} BETWEEN ? AND ?")
+        params.extend(between[1:])
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    df = query(database, f"SELECT rowid - 1 AS row_index, * FROM {quote(name)}{where} ORDER BY rowid", params)
+    df = df.set_index("row_index")
+    df.index.name = None
+    return df.astype(read_meta(database)["dtypes"][name])
+
+
+# Rows of a dataset of a data store kept by the filter state, with filters as (column,
+# filter key, everyone): a filter is left out when everyone is selected. Without any filter
+# left the rows are copied from the DataFrame, as reading a whole table is slower in SQL.
+def filter_rows(data, name, filters, columns):
+    conditions = {column: list(filters[key]) for column, key, everyone in columns if everyone not in filters[key]}
+    if not conditions:
+        return data[name].copy()
+    return select(data["database"], name, conditions)
+
+
+def main():
+    from data_store import FILES, ROOT_DIR, read_data
+
+    parser = argparse.ArgumentParser(description="Build the SQLite copy of the data store, and optionally query it")
+    parser.add_argument("data_dir", nargs="?", default=os.environ.get("SG_DATA_DIR") or ROOT_DIR)
+    parser.add_argument("--sql", help="SELECT statement to run against the database")
+    args = parser.parse_args()
+
+    database = open_database(args.data_dir, FILES, read_data=read_data)
+    if not args.sql:
+        print(database)
+        return
+    try:
+        print(query(database, args.sql).to_string(index=False))
+    except (sqlite3.Error, pd.errors.DatabaseError) as e:
+        print(f"Query failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+# Consistency checks of the hierarchical datasets, run when they are read
+#
+# The employment and industry x occupation tables hold totals next to their parts, and
+# the totals must match the sums of the parts:
+#   employment  sex          Male + Female = All, for every age group, occupation and year
+#               age          the age bands add up to "All Ages"
+#               occupation   the occupations add up to "All Occupations" (roughly: see below)
+#   industry_occupation
+#               occupation   the occupations of an industry add up to its total row (roughly)
+#               industry     the industries other than "All Industries" and "Services" add
+#                            up to "All Industries"
+#               services     the service industries add up to "Services"
+# Each table is turned into a dense cube (rollups.to_cube: one axis per label column, plus
+# the years), so every check is one sum over an axis and a comparison, for all cells at
+# once. The services are the industries of the "Services" sector of rollups.HIERARCHIES.
+#
+# The published numbers are rounded to ROUNDING, so a sum of n parts may be off by
+# n * ROUNDING / 2. The occupation checks also allow OCCUPATION_TOLERANCE of the total,
+# because small occupation groups ("others, nes") are not always published as rows.
+# Missing parts (NaN) are left out, and then only parts adding up to more than the total
+# break the check. A missing total is not checked, and a breakdown that is all zeros is
+# taken as not published (the 2006 occupations of the industry table).
+#
+# data_store.py runs check() on every table it reads (turn it off with SG_VALIDATE=0), so
+# an inconsistent refresh fails when it is loaded. validate() lists every broken cell.
+# KNOWN_ISSUES are problems of the data in this repo: they are reported by validate() but
+# don't make check() fail.
+#
+# Usage: python validation.py [data folder]
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+import rollups
+
+ENABLED = os.environ.get("SG_VALIDATE", "1") not in ("", "0")
+ROUNDING = 0.1
+OCCUPATION_TOLERANCE = 0.05
+REPORT_ROWS = 5
+
+SEX_TOTAL = "All"
+AGE_TOTAL = "All Ages"
+OCCUPATION_TOTAL = "All Occupations"
+
+# (dataset, check, cell) of known problems of the source data
+KNOWN_ISSUES = [
+    # The industries add up to about twice the "All Industries" cleaners in every year
+    ("industry_occupation", "industry", "Cleaners, Labourers & Related Workers"),
+]
+
+
+# Sum and count of the values of the parts (a mask over the axis). When the parts are
+# everything but the total, the sum over the whole axis minus the total saves a copy.
+def sum_parts(filled, finite, axis, parts, total):
+    if parts.sum() == len(parts) - 1 and not parts[total]:
+        total_value = np.take(filled, total, axis=axis)
+        total_count = np.take(finite, total, axis=axis)
+        return filled.sum(axis=axis) - total_value, finite.sum(axis=axis) - total_count
+    positions = np.flatnonzero(parts)
+    return np.take(filled, positions, axis=axis).sum(axis=axis), np.take(finite, positions, axis=axis).sum(axis=axis)
+
+
+# Compare the sum of the parts of a cube axis with the total on that axis (filled: the
+# cube with NaN as 0, finite: where it has values). Returns the broken cells as (positions
+# of the cells on the other axes, total, sum of the parts, tolerance).
+def check_sum(filled, finite, axis, parts, total, relative=0.0):
+    actual, present = sum_parts(filled, finite, axis, parts, total)
+    expected = np.where(np.take(finite, total, axis=axis), np.take(filled, total, axis=axis), np.nan)
+
+    # Cells off by more than the rounding of their parts, then the other rules on those only
+    with np.errstate(invalid="ignore"):
+        cells = np.nonzero(np.abs(actual - expected) > present * (ROUNDING / 2) + 1e-9)
+    expected, actual, present = expected[cells], actual[cells], present[cells]
+    tolerance = present * ROUNDING / 2 + relative * np.abs(expected) + 1e-9
+    difference = actual - expected
+    complete = present == parts.sum()
+    published = (present > 0) & ((actual != 0) | (expected == 0))
+    broken = published & np.where(complete, np.abs(difference) > tolerance, difference > tolerance)
+    return tuple(positions[broken] for positions in cells), expected[broken], actual[broken], tolerance[broken]
+
+
+# Broken cells of one check as rows of a report
+def report(dataset, name, cells, levels, axis, years, expected, actual, tolerance):
+    other = [level for i, level in enumerate(levels) if i != axis] + [np.asarray(years)]
+    labels = [level[positions] for level, positions in zip(other, cells)]
+    cell = labels[0].astype(str)
+    for part in labels[1:-1]:
+        cell = np.char.add(np.char.add(cell, " | "), part.astype(str))
+    known = [cell_name for known_dataset, check_name, cell_name in KNOWN_ISSUES if (known_dataset, check_name) == (dataset, name)]
+    return pd.DataFrame({
+        "dataset": dataset, "check": name, "cell": cell, "year": labels[-1],
+        "total": expected, "sum_of_parts": actual, "difference": actual - expected, "tolerance": tolerance,
+        "known": np.isin(cell, known)})
+
+
+# Run the checks of one cube. checks: (name, axis, mask of the parts on the axis, label of
+# the total, relative tolerance)
+def run_checks(dataset, cube, levels, years, checks):
+    finite = np.isfinite(cube)
+    filled = np.where(finite, cube, 0.0)
+    found = []
+    for name, axis, parts, total, relative in checks:
+        total_position = np.flatnonzero(levels[axis] == total)
+        if len(total_position) == 0 or not parts.any():
+            continue
+        cells, expected, actual, tolerance = check_sum(filled, finite, axis, parts, total_position[0], relative)
+        if len(expected):
+            found.append(report(dataset, name, cells, levels, axis, years, expected, actual, tolerance))
+    return found
+
+
+def check_employment(df):
+    year_cols = [c for c in df.columns if c.isdigit()]
+    cube, levels = rollups.to_cube(df[["Sex", "Age Group", "Occupation"]], df[year_cols].to_numpy(dtype="float64"))
+    sexes, ages, occupations = levels
+    return run_checks("employment", cube, levels, [int(c) for c in year_cols], [
+        ("sex", 0, sexes != SEX_TOTAL, SEX_TOTAL, 0.0),
+        ("age", 1, ages != AGE_TOTAL, AGE_TOTAL, 0.0),
+        ("occupation", 2, occupations != OCCUPATION_TOTAL, OCCUPATION_TOTAL, OCCUPATION_TOLERANCE)])
+
+
+def check_industry_occupation(df):
+    cube, levels = rollups.to_cube(df[["industry", "occupation", "year"]], df[["employment"]].to_numpy(dtype="float64"))
+    # The years are the last label axis: put them in order
+    order = np.argsort(levels[2].astype("int64"))
+    cube = cube[..., 0][:, :, order]
+    years = levels[2][order].tolist()
+    industries, occupations = levels[0], levels[1]
+    # Leaf industries and their sectors (rollups.HIERARCHIES)
+    leaves = ~np.isin(industries, rollups.HIERARCHIES["industry"]["aggregates"])
+    sectors = np.array([rollups.sector_of(industry) for industry in industries], dtype=object)
+    services = leaves & (sectors == rollups.SERVICES)
+    return run_checks("industry_occupation", cube, levels[:2], years, [
+        ("occupation", 1, occupations != rollups.OCCUPATION_TOTAL, rollups.OCCUPATION_TOTAL, OCCUPATION_TOLERANCE),
+        ("industry", 0, leaves, rollups.INDUSTRY_TOTAL, 0.0),
+        ("services", 0, services, rollups.SERVICES, 0.0)])
+
+
+CHECKS = {"employment": check_employment, "industry_occupation": check_industry_occupation}
+
+
+# Every broken cell of the datasets of a data store
+def validate(data):
+    found = [table for name, check_table in CHECKS.items() for table in check_table(data[name])]
+    columns = ["dataset", "check", "cell", "year", "total", "sum_of_parts", "difference", "tolerance", "known"]
+    return pd.concat(found, ignore_index=True) if found else pd.DataFrame(columns=columns)
+
+
+# Raise a ValueError describing the broken cells of a dataset, if there are any
+def check(name, df):
+    if not ENABLED or name not in CHECKS:
+        return
+    found = CHECKS[name](df)
+    if not found:
+        return
+    found = pd.concat(found, ignore_index=True)
+    found = found[~found["known"]]
+    if found.empty:
+        return
+    worst = found.reindex(found["difference"].abs().sort_values(ascending=False).index).head(REPORT_ROWS)
+    lines = [f"  {row.check}: {row.cell}, {row.year}: parts add up to {row.sum_of_parts:,.1f}, total is {row.total:,.1f}"
+             for row in worst.itertuples()]
+    counts = ", ".join(f"{check_name} {count}" for check_name, count in found["check"].value_counts().items())
+    raise ValueError(f"{len(found)} inconsistent cells in the {name} data ({counts}). Largest:\n" + "\n".join(lines))
+
+
+def main():
+    from data_store import ROOT_DIR, read_data
+
+    parser = argparse.ArgumentParser(description="Check that the totals of the datasets match their parts")
+    parser.add_argument("data_dir", nargs="?", default=os.environ.get("SG_DATA_DIR") or ROOT_DIR)
+    args = parser.parse_args()
+
+    global ENABLED
+    ENABLED = False
+    found = validate(read_data(args.data_dir))
+    if found.empty:
+        print("All checks passed")
+        return
+    print(found.to_string(index=False))
+    if not found["known"].all():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()